@@ -66,3 +66,41 @@ class Agent(ABC):
             given state
         """
         return np.amax(self.values(state))
+    
+    def peek(self, state):
+        """ Returns a numpy array containing the Q-values for all actions for the 
+        specified state, like values, but without modifying the agent. This is used to
+        evaluate an agent without changing its state.
+        
+        The default implementation calls values, which is suitable for agents whose 
+        values method does not modify the agent; agents that add new states to a table
+        when they are first looked up should override this method.
+        
+        inputs:
+            state - the state for which to compute Q-values
+        outputs:
+            a one-dimensional numpy array of Q-values
+        """
+        return self.values(state)
+    
+    def peek_batch(self, states):
+        """ Returns a numpy array containing the Q-values for all actions for each of
+        the specified states, like values_batch, but without modifying the agent.
+        
+        inputs:
+            states - a numpy array of states for which to compute Q-values
+        outputs:
+            a two-dimensional numpy array of Q-values, with one row per state
+        """
+        return self.values_batch(states)
+    
+    def values_batch(self, states):
+        """ Returns a numpy array containing the Q-values for all actions for each of
+        the specified states.
+        
+        inputs:
+            states - a numpy array of states for which to compute Q-values
+        outputs:
+            a two-dimensional numpy array of Q-values, with one row per state
+        """
+        return np.array([self.values(state) for state in states])
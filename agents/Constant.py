@@ -0,0 +1,22 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+
+
+class Constant:
+    """ A schedule of a parameter (e.g. a learning rate) that has the same value in every
+    episode. Agents and policies use it in place of a lambda expression when a parameter
+    is given as a floating point number, so that they can be pickled and sent to worker
+    processes.
+
+    inputs:
+        value - the value of the parameter
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, episode):
+        return self.value
@@ -5,15 +5,18 @@ Created on Oct 22, 2018
 '''
 import numpy as np
 from agents.Neural import Neural
+from agents.Predictor import Predictor
 
 
 class DeepQ(Neural):
     """ A simple class that represents a deep Q network (DQN), 
-    implemented using a Keras model.
+    implemented using a Keras model or an MLP.
     
     inputs:
-        network - a Keras model for the neural network
+        network - a Keras model or MLP for the neural network
         train_epochs - the number of epochs of training that is done per batch
+        inference - how Q-values of single states are computed when selecting actions
+        (see Predictor.create; defaults to 'auto')
     
     References
     ========
@@ -23,46 +26,41 @@ class DeepQ(Neural):
         Nature 518.7540 (2015): 529.
     """
 
-    def __init__(self, network, train_epochs):
+    def __init__(self, network, train_epochs, inference='auto'):
         self.network = network
         self.train_epochs = train_epochs
+        self.predictor = Predictor.create(network, inference)
         self.clear()
 
     def clear(self):
         Neural.clear_model(self.network)
-        self.state_placeholder = None
-        self.next_state_placeholder = None
+        self.predictor.refresh()
+        self.stats = {'train_steps': 0}
         
     def values(self, state):
-        return self.network.predict(state)[0]
+        return self.predictor(state)[0]
         
     def finish_episode(self, episode):
         pass
     
-    def train(self, mini_batch, discount):
+    def train(self, mini_batch, discount, weights=None):
+        states, actions, rewards, next_states, dones = mini_batch
+        batch_size = len(actions)
         
-        # get the states at which to predict Q-values
-        if self.state_placeholder is None:
-            state_dim = mini_batch[0][0].size
-            self.state_placeholder = np.empty((len(mini_batch), state_dim))
-            self.next_state_placeholder = np.empty((len(mini_batch), state_dim))
-        for i, (state, _, _, new_state, _) in enumerate(mini_batch):
-            self.state_placeholder[i] = state
-            self.next_state_placeholder[i] = new_state
-        
-        # get the Q-values
-        values = self.network.predict(self.state_placeholder)
-        next_values = self.network.predict(self.next_state_placeholder)
+        # get the Q-values of the states and next states in a single pass
+        all_values = self.network.predict_on_batch(Neural.stack(states, next_states))
+        values, next_values = all_values[:batch_size], all_values[batch_size:]
         
         # compute the new Q-value targets using Q-learning
-        for i, (_, action, reward, _, done) in enumerate(mini_batch):
-            if done:
-                values[i][action] = reward
-            else:
-                values[i][action] = reward + discount * np.amax(next_values[i])
+        rows = np.arange(batch_size)
+        next_values = np.where(dones, 0.0, np.amax(next_values, axis=1))
+        targets = rewards + discount * next_values
+        errors = targets - values[rows, actions]
+        values[rows, actions] = targets
         
         # fit the network on the data
-        self.network.fit(self.state_placeholder, values,
-                         batch_size=len(mini_batch),
-                         epochs=self.train_epochs,
-                         verbose=0)
+        for _ in range(self.train_epochs):
+            self.network.train_on_batch(states, values, sample_weight=weights)
+        self.predictor.refresh()
+        self.stats['train_steps'] += 1
+        return errors
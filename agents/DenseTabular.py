@@ -0,0 +1,240 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+import math
+from agents.Tabular import Tabular
+from agents.Indexer import Indexer, IdentityIndexer
+
+
+class DenseTabular(Tabular):
+    """ A dense array implementation of a Q-value table.
+
+    Action values for all states are stored as rows of a single contiguous two-dimensional
+    numpy array. States are mapped to rows using an Indexer, which makes this class
+    suitable for tasks whose states are integers or can be enumerated. If the indexer
+    produces an index that does not fit in the table, the table grows geometrically.
+
+    The method values returns a view of a row of the table, so this class can be used
+    in place of Tabular by all learners and policies.
+
+    If the indexer has a fixed size (e.g. an IdentityIndexer), the table has exactly one
+    row per state and never grows, and the views of the rows of tables with at most
+    VIEW_LIMIT rows are kept in a list, so that values is as fast as a dictionary lookup.
+    Indices outside of the table raise an IndexError.
+
+    inputs:
+        valid_actions - the number of possible actions
+        learning_rate - the learning rate used to update the table
+        states - either an integer giving the number of states (if the states of the task
+        are integers in [0, states)), or an Indexer that maps states to row indices
+        clip_min - minimum value that can be used to update the table
+        (defaults to negative infinity)
+        clip_max - maximum value that can be used to update the table
+        (defaults to positive infinity)
+        randomizer - numpy method handle to initialize action values, which must accept
+        a shape tuple (defaults to np.zeros)
+        capacity - the initial number of rows allocated when the indexer does not have a
+        fixed size (defaults to 1024)
+        dtype - the numpy data type of the table (defaults to float)
+    """
+
+    # the largest number of rows whose views are kept in a list
+    VIEW_LIMIT = 1 << 20
+
+    def __init__(self, valid_actions, learning_rate, states,
+                 clip_min=-math.inf, clip_max=math.inf, randomizer=np.zeros,
+                 capacity=1024, dtype=float):
+        if isinstance(states, Indexer):
+            self.indexer = states
+        else:
+            self.indexer = IdentityIndexer(states)
+        self.capacity = capacity
+        self.dtype = dtype
+        super().__init__(valid_actions, learning_rate, clip_min, clip_max, randomizer)
+
+    def clear(self):
+        self.alpha = self.learning_rate(0)
+        self.indexer.clear()
+        if self.indexer.fixed():
+            rows = self.indexer.size()
+        else:
+            rows = max(self.indexer.size(), self.capacity)
+        self.Q = np.asarray(self.randomizer((rows, self.valid_actions)), dtype=self.dtype)
+        self.attach()
+
+    def attach(self):
+        """ Prepares the lookups of states in the current table. This must be called 
+        whenever the table is replaced.
+        """
+        self.index = self.indexer.index
+        self.fixed = self.indexer.fixed()
+        if self.fixed and self.Q.shape[0] <= DenseTabular.VIEW_LIMIT:
+            self.views = list(self.Q)
+        else:
+            self.views = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['views'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.attach()
+
+    def row(self, state):
+        """ Returns the row index of the specified state in the table, growing the table
+        if necessary.
+
+        inputs:
+            state - the state to look up
+        outputs:
+            an integer row index
+        """
+        idx = self.index(state)
+        if idx < 0:
+            raise IndexError('negative state index {}'.format(idx))
+        if idx >= self.Q.shape[0] and not self.fixed:
+            self.grow(idx + 1)
+        return idx
+
+    def rows(self, states):
+        """ Returns the row indices of the specified states in the table, growing the 
+        table if necessary.
+        
+        inputs:
+            states - a numpy array of states to look up
+        outputs:
+            a one-dimensional numpy array of integer row indices
+        """
+        idx = self.indexer.index_batch(states)
+        if idx.size > 0:
+            if idx.min() < 0:
+                raise IndexError('negative state index {}'.format(idx.min()))
+            top = idx.max()
+            if top >= self.Q.shape[0] and not self.fixed:
+                self.grow(top + 1)
+        return idx
+
+    def grow(self, rows):
+        """ Enlarges the table so that it contains at least the specified number of rows.
+
+        inputs:
+            rows - the minimum number of rows required
+        """
+        old_rows = self.Q.shape[0]
+        new_rows = max(rows, 2 * old_rows)
+        extra = np.asarray(self.randomizer((new_rows - old_rows, self.valid_actions)),
+                           dtype=self.dtype)
+        self.Q = np.concatenate((self.Q, extra), axis=0)
+
+    def values(self, state):
+        views = self.views
+        if views is not None:
+            if state < 0:
+                raise IndexError('negative state index {}'.format(state))
+            return views[state]
+        idx = self.row(state)
+        return self.Q[idx]
+
+    def peek(self, state):
+        idx = self.indexer.find(state)
+        if 0 <= idx < self.Q.shape[0]:
+            return self.Q[idx]
+        return np.asarray(self.randomizer((1, self.valid_actions)), dtype=self.dtype)[0]
+
+    def peek_batch(self, states):
+        idx = self.indexer.find_batch(states)
+        known = (idx >= 0) & (idx < self.Q.shape[0])
+        if np.all(known):
+            return self.Q[idx]
+        result = np.empty((len(idx), self.valid_actions), dtype=self.dtype)
+        result[known] = self.Q[idx[known]]
+        result[~known] = self.randomizer((len(idx) - np.count_nonzero(known), 
+                                          self.valid_actions))
+        return result
+
+    def update(self, state, action, error):
+        views = self.views
+        if views is not None:
+            if state < 0:
+                raise IndexError('negative state index {}'.format(state))
+            change = self.alpha * error
+            views[state][action] += max(min(change, self.clip_max), self.clip_min)
+            return
+        self.update_row(self.row(state), action, error)
+
+    def update_row(self, row, action, error):
+        """ Updates the Q-value for the specified row of the table, action and Bellman 
+        error. This is the same as update, except that the state is given by its row 
+        index in the table.
+
+        inputs:
+            row - the row index of the state
+            action - the action
+            error - the Bellman error
+        """
+        change = self.alpha * error
+        change = max(min(change, self.clip_max), self.clip_min)
+        self.Q[row, action] += change
+
+    def update_all(self, state, errors):
+        change = self.alpha * errors
+        change = np.clip(change, self.clip_min, self.clip_max, change)
+        idx = self.row(state)
+        self.Q[idx] += change
+
+    def values_batch(self, states):
+        idx = self.rows(states)
+        return self.Q[idx]
+
+    def update_batch(self, states, actions, errors, merge=False):
+        self.update_rows(self.rows(states), actions, errors, merge)
+
+    def update_rows(self, rows, actions, errors, merge=False):
+        """ Updates the Q-values for the specified rows of the table, actions and 
+        Bellman errors. This is the same as update_batch, except that states are given 
+        by their row indices in the table.
+
+        inputs:
+            rows - a one-dimensional numpy array of row indices of states
+            actions - a one-dimensional numpy array of actions
+            errors - a one-dimensional numpy array of Bellman errors
+            merge - whether to merge repeated pairs into one update by the mean of their
+            errors, as in Tabular.update_batch (defaults to False)
+        """
+        errors = np.asarray(errors, dtype=float)
+        if merge:
+            rows, actions, errors = DenseTabular.merge_pairs(rows, actions, errors,
+                                                             self.valid_actions)
+        change = self.alpha * errors
+        change = np.clip(change, self.clip_min, self.clip_max, change)
+        if merge:
+            self.Q[rows, actions] += change
+        else:
+            np.add.at(self.Q, (rows, actions), change)
+
+    @staticmethod
+    def merge_pairs(rows, actions, errors, columns):
+        """ Merges repeated pairs of rows and actions into one pair, whose error is the 
+        mean of their errors.
+
+        inputs:
+            rows - a one-dimensional numpy array of row indices
+            actions - a one-dimensional numpy array of actions
+            errors - a one-dimensional numpy array of errors
+            columns - the number of actions
+        outputs:
+            the rows, actions and errors of the distinct pairs
+        """
+        rows, actions = np.asarray(rows), np.asarray(actions)
+        keys = rows * columns + actions
+        unique, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        if unique.size == keys.size:
+            return rows, actions, errors
+        errors = np.bincount(inverse.ravel(), weights=errors) / counts
+        rows, actions = np.divmod(unique, columns)
+        return rows, actions, errors
@@ -3,18 +3,37 @@ Created on Oct 22, 2018
 
 @author: michael
 '''
-from keras.models import clone_model
 import numpy as np
 from agents.Neural import Neural
+from agents.MLP import MLP
+from agents.Predictor import Predictor
 
 
 class DoubleDeepQ(Neural):
     """ A simple class that represents a double Deep Q network (DDQN), 
-    implemented using Keras models.
+    implemented using Keras models or MLPs.
+    
+    The weights of the network that is trained are copied to the network used to select 
+    the actions of the targets either at the end of each episode (the default), or every
+    sync_every training steps. Alternatively, if tau is specified, the weights are 
+    blended by Polyak averaging, w <- tau * w_trained + (1 - tau) * w, after every
+    training step (or every sync_every training steps). Both kinds of update are done
+    in place, inside the Keras graph or on the arrays of an MLP, so weights are not 
+    copied through Python lists.
+    
+    The number of training steps, full synchronizations and soft updates are 
+    reported in the dictionary stats.
     
     inputs:
-        network - a Keras model that will be used for both action and target networks
+        network - a Keras model or MLP that will be used for both action and target networks
         train_epochs - the number of epochs of training that is done per batch
+        sync_every - the number of training steps between updates of the action network
+        (defaults to None, meaning the action network is synchronized at the end of each 
+        episode, or updated after every training step if tau is specified)
+        tau - the weight in (0, 1] of the trained network in soft updates (defaults to 
+        None, meaning the weights are copied)
+        inference - how Q-values of single states are computed when selecting actions
+        (see Predictor.create; defaults to 'auto')
     
     References
     ========
@@ -22,52 +41,82 @@ class DoubleDeepQ(Neural):
         "Deep Reinforcement Learning with Double Q-Learning." AAAI. Vol. 2. 2016.
     """
 
-    def __init__(self, network, train_epochs):
+    def __init__(self, network, train_epochs, sync_every=None, tau=None, inference='auto'):
         self.target_network = network
-        self.action_network = clone_model(network)
-        self.action_network.set_weights(network.get_weights())
+        self.predictor = Predictor.create(network, inference)
         self.train_epochs = train_epochs
+        self.sync_every = sync_every
+        self.tau = tau
+        
+        # create the action network and the weight updates of the action network
+        if isinstance(network, MLP):
+            self.action_network = network.clone()
+            self.hard_update = lambda _: self.action_network.assign(network)
+            self.soft_update = lambda _: self.action_network.blend(network, tau)
+        else:
+            import keras.backend as K
+            from keras.models import clone_model
+            self.action_network = clone_model(network)
+            pairs = list(zip(self.action_network.weights, network.weights))
+            self.hard_update = K.function(
+                [], [], updates=[K.update(w, w_trained) for w, w_trained in pairs])
+            if tau is not None:
+                self.soft_update = K.function(
+                    [], [], updates=[K.update(w, tau * w_trained + (1.0 - tau) * w) 
+                                     for w, w_trained in pairs])
         self.clear()
 
     def clear(self):
-        Neural.clear_model(self.action_network)
         Neural.clear_model(self.target_network)
-        self.state_placeholder = None
-        self.next_state_placeholder = None
+        self.hard_update([])
+        self.predictor.refresh()
+        self.stats = {'train_steps': 0, 'syncs': 0, 'soft_updates': 0}
+        
+    def sync(self):
+        """ Updates the weights of the action network from the trained network, using
+        a soft update if tau is specified or a full copy otherwise.
+        """
+        if self.tau is None:
+            self.hard_update([])
+            self.stats['syncs'] += 1
+        else:
+            self.soft_update([])
+            self.stats['soft_updates'] += 1
         
     def values(self, state):
-        return self.target_network.predict(state)[0]
+        return self.predictor(state)[0]
         
     def finish_episode(self, episode):
-        self.action_network.set_weights(self.target_network.get_weights())
+        if self.sync_every is None and self.tau is None:
+            self.sync()
             
-    def train(self, mini_batch, discount):
-        
-        # get the states at which to predict Q-values
-        if self.state_placeholder is None:
-            state_dim = mini_batch[0][0].size
-            self.state_placeholder = np.empty((len(mini_batch), state_dim))
-            self.next_state_placeholder = np.empty((len(mini_batch), state_dim))
-        for i, (state, _, _, new_state, _) in enumerate(mini_batch):
-            self.state_placeholder[i] = state
-            self.next_state_placeholder[i] = new_state
+    def train(self, mini_batch, discount, weights=None):
+        states, actions, rewards, next_states, dones = mini_batch
+        batch_size = len(actions)
             
-        # get the Q-values
-        values = self.target_network.predict(self.state_placeholder)
-        next_values = self.target_network.predict(self.next_state_placeholder)
-        next_action_values = self.action_network.predict(self.next_state_placeholder)
+        # get the Q-values of the states and next states in a single pass
+        all_values = self.target_network.predict_on_batch(Neural.stack(states, next_states))
+        values, next_values = all_values[:batch_size], all_values[batch_size:]
+        next_action_values = self.action_network.predict_on_batch(next_states)
             
-        # compute the new Q-value targets using Q-learning
-        for i in range(len(mini_batch)):
-            state, action, reward, _, done = mini_batch[i]
-            if done:
-                values[i][action] = reward
-            else:
-                a = np.argmax(next_action_values[i])
-                values[i][action] = reward + discount * next_values[i][a]
+        # compute the new Q-value targets using double Q-learning
+        rows = np.arange(batch_size)
+        next_values = next_values[rows, np.argmax(next_action_values, axis=1)]
+        next_values = np.where(dones, 0.0, next_values)
+        targets = rewards + discount * next_values
+        errors = targets - values[rows, actions]
+        values[rows, actions] = targets
         
         # fit the network on the data
-        self.target_network.fit(self.state_placeholder, values,
-                                batch_size=len(mini_batch),
-                                epochs=self.train_epochs,
-                                verbose=0)
+        for _ in range(self.train_epochs):
+            self.target_network.train_on_batch(states, values, sample_weight=weights)
+        self.predictor.refresh()
+        
+        # update the action network
+        self.stats['train_steps'] += 1
+        if self.sync_every is None:
+            if self.tau is not None:
+                self.sync()
+        elif self.stats['train_steps'] % self.sync_every == 0:
+            self.sync()
+        return errors
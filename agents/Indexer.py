@@ -0,0 +1,135 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class Indexer(ABC):
+    """ An abstract class that maps states of a task to consecutive non-negative
+    integers, which are used as row indices into a dense Q-value table.
+    """
+
+    @abstractmethod
+    def clear(self):
+        """ Forgets all states that have been indexed so far.
+        """
+        pass
+
+    @abstractmethod
+    def index(self, state):
+        """ Returns the row index of the specified state.
+
+        inputs:
+            state - the state to index
+        outputs:
+            a non-negative integer index
+        """
+        pass
+
+    @abstractmethod
+    def size(self):
+        """ Returns an upper bound on the indices returned so far, plus one. This is the
+        minimum number of rows a table must have to hold all indexed states.
+
+        outputs:
+            an integer counting the number of rows required
+        """
+        pass
+
+    def fixed(self):
+        """ Returns whether or not the indexer maps states to a fixed range of indices
+        [0, size()) that is known in advance, and does not depend on the states that
+        have been indexed so far.
+        """
+        return False
+
+    def index_batch(self, states):
+        """ Returns the row indices of the specified states.
+
+        inputs:
+            states - an iterable of states to index
+        outputs:
+            a one-dimensional numpy array of integer indices
+        """
+        return np.fromiter((self.index(state) for state in states), dtype=np.intp)
+
+    def find(self, state):
+        """ Returns the row index of the specified state without indexing new states.
+
+        The default implementation calls index, which is suitable for indexers that do
+        not record the states they index.
+
+        inputs:
+            state - the state to look up
+        outputs:
+            an integer index, or -1 if the state has not been indexed
+        """
+        return self.index(state)
+
+    def find_batch(self, states):
+        """ Returns the row indices of the specified states without indexing new states.
+
+        inputs:
+            states - an iterable of states to look up
+        outputs:
+            a one-dimensional numpy array of integer indices, which are -1 for states 
+            that have not been indexed
+        """
+        return np.fromiter((self.find(state) for state in states), dtype=np.intp)
+
+
+class IdentityIndexer(Indexer):
+    """ An indexer for tasks whose states are already integers in [0, states).
+
+    inputs:
+        states - the total number of states of the task
+    """
+
+    def __init__(self, states):
+        self.states = states
+
+    def clear(self):
+        pass
+
+    def index(self, state):
+        return state
+
+    def size(self):
+        return self.states
+
+    def fixed(self):
+        return True
+
+    def index_batch(self, states):
+        return np.asarray(states, dtype=np.intp)
+
+    def find_batch(self, states):
+        return np.asarray(states, dtype=np.intp)
+
+
+class InternIndexer(Indexer):
+    """ An indexer for tasks with arbitrary hashable states. Each new state is assigned
+    the next free index the first time it is seen.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.indices = {}
+
+    def index(self, state):
+        indices = self.indices
+        idx = indices.get(state)
+        if idx is None:
+            idx = indices[state] = len(indices)
+        return idx
+
+    def find(self, state):
+        return self.indices.get(state, -1)
+
+    def size(self):
+        return len(self.indices)
@@ -0,0 +1,145 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+import math
+from agents.Agent import Agent
+from agents.DenseTabular import DenseTabular
+from agents.TileCoder import TileCoder
+from agents.Constant import Constant
+
+
+class Linear(Agent):
+    """ A linear approximation of the Q-value function over sparse binary features,
+    such as those produced by tile coding.
+
+    The Q-values of a state are the sums of the weights of its active features, one
+    row of weights per feature. Reading and updating the Q-values of a state therefore
+    costs time proportional to the number of active features, independently of the size
+    of the state space. The learning rate is divided by the number of active features
+    of each state, as is usual for tile coding.
+
+    This class provides the same update methods as Tabular, so it can be used with the
+    tabular learners (e.g. QLearning, Sarsa, ExpectedSarsa and OnlineSarsaLambda).
+
+    inputs:
+        valid_actions - the number of possible actions
+        learning_rate - the learning rate used to update the weights
+        features - a TileCoder object that maps states to the indices of their active 
+        features, or any object with the same attributes size (the number of features) 
+        and tilings (the number of active features of each state), and the same methods
+        features and features_batch
+        clip_min - minimum value that can be used to update the weights
+        (defaults to negative infinity)
+        clip_max - maximum value that can be used to update the weights
+        (defaults to positive infinity)
+        randomizer - numpy method handle to initialize the weights, which must accept
+        a shape tuple (defaults to np.zeros)
+    """
+
+    def __init__(self, valid_actions, learning_rate, features : TileCoder,
+                 clip_min=-math.inf, clip_max=math.inf, randomizer=np.zeros):
+        self.valid_actions = valid_actions
+        self.coder = features
+        self.randomizer = randomizer
+        self.clip_min = clip_min
+        self.clip_max = clip_max
+        if isinstance(learning_rate, float):
+            self.learning_rate = Constant(learning_rate)
+        else:
+            self.learning_rate = learning_rate
+        self.clear()
+
+    def clear(self):
+        self.alpha = self.learning_rate(0)
+        self.W = np.asarray(self.randomizer((self.coder.size, self.valid_actions)),
+                            dtype=float)
+
+    def features(self, state):
+        """ Returns the indices of the active features of the specified state.
+        """
+        return self.coder.features(state)
+
+    def values(self, state):
+        return np.sum(self.W[self.coder.features(state)], axis=0)
+
+    def finish_episode(self, episode):
+        self.alpha = self.learning_rate(episode)
+
+    def update(self, state, action, error):
+        """ Updates the weights of the active features of the specified state for the
+        specified action, given the Bellman error.
+
+        The formula is W[f, action] += learning_rate * error / n for each of the n
+        active features f of state.
+
+        inputs:
+            state - the current state
+            action - the current selected action
+            error - the Bellman error
+        """
+        f = self.coder.features(state)
+        change = self.alpha * error / len(f)
+        change = max(min(change, self.clip_max), self.clip_min)
+        self.W[f, action] += change
+
+    def update_all(self, state, errors):
+        """ Updates the weights of the active features of the specified state for all
+        actions, given an array of Bellman errors.
+
+        inputs:
+            state - the current state
+            errors - a one-dimensional numpy array of Bellman errors for each action;
+            must be of the same length as valid_actions
+        """
+        f = self.coder.features(state)
+        change = self.alpha * errors / len(f)
+        change = np.clip(change, self.clip_min, self.clip_max, change)
+        self.W[f] += change
+
+    def values_batch(self, states):
+        return np.sum(self.W[self.coder.features_batch(states)], axis=1)
+
+    def update_batch(self, states, actions, errors, merge=False):
+        """ Updates the weights for the specified state-action pairs and Bellman errors,
+        following the same rule as Tabular.update_batch: by default, the changes of 
+        weights shared by several pairs of the batch accumulate, and if merge is True, 
+        each shared weight is updated once, by the mean of the errors of its pairs.
+
+        inputs:
+            states - a numpy array of states
+            actions - a one-dimensional numpy array of actions
+            errors - a one-dimensional numpy array of Bellman errors
+            merge - whether to merge the updates of each weight into one update
+            (defaults to False)
+        """
+        f = self.coder.features_batch(states)
+        rows = f.ravel()
+        actions = np.repeat(np.asarray(actions, dtype=np.intp), f.shape[1])
+        errors = np.repeat(np.asarray(errors, dtype=float), f.shape[1])
+        self.update_rows(rows, actions, errors, merge)
+
+    def update_rows(self, rows, actions, errors, merge=False):
+        """ Updates the weights of the specified features and actions given the Bellman
+        errors, with the same scaling of the learning rate as update. This is used to
+        apply eligibility traces over features.
+
+        inputs:
+            rows - a one-dimensional numpy array of feature indices
+            actions - a one-dimensional numpy array of actions
+            errors - a one-dimensional numpy array of Bellman errors
+            merge - whether to merge repeated pairs into one update by the mean of their
+            errors (defaults to False)
+        """
+        errors = np.asarray(errors, dtype=float)
+        if merge:
+            rows, actions, errors = DenseTabular.merge_pairs(rows, actions, errors,
+                                                             self.valid_actions)
+        change = self.alpha * errors / self.coder.tilings
+        change = np.clip(change, self.clip_min, self.clip_max, change)
+        if merge:
+            self.W[rows, actions] += change
+        else:
+            np.add.at(self.W, (rows, actions), change)
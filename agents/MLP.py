@@ -0,0 +1,203 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import copy
+import numpy as np
+from agents.Optimizers import Adam
+
+
+class MLP:
+    """ A lightweight multi-layer perceptron implemented in NumPy, which can be used in
+    place of a Keras model by the Neural agents.
+
+    The network consists of fully-connected layers. It provides the subset of the Keras
+    model interface used by the agents (predict, predict_on_batch, train_on_batch, fit,
+    get_weights and set_weights), as well as methods to re-initialize, clone, copy and
+    blend networks in place. Weights are stored in single precision.
+
+    inputs:
+        sizes - a list of the numbers of units of each layer, starting with the dimension
+        of the input and ending with the number of outputs (e.g. the number of actions)
+        activation - the name of the activation function of the hidden layers
+        (defaults to 'relu')
+        output_activation - the name of the activation function of the output layer
+        (defaults to 'linear')
+        optimizer - an Optimizer object used to train the network (defaults to Adam with
+        its default parameters)
+        loss - the name of the loss function, either 'huber' or 'mse' (defaults to 'huber')
+        delta - the threshold at which the Huber loss changes from quadratic to linear
+        (defaults to 1.0)
+        seed - the seed of the random number generator used to initialize the weights
+        (defaults to None)
+    """
+
+    # activation functions and their derivatives, in terms of the inputs z and outputs a
+    ACTIVATIONS = {
+        'linear': (lambda z: z,
+                   lambda z, a: 1.0),
+        'relu': (lambda z: np.maximum(z, 0.0),
+                 lambda z, a: z > 0.0),
+        'tanh': (np.tanh,
+                 lambda z, a: 1.0 - a * a),
+        'sigmoid': (lambda z: 1.0 / (1.0 + np.exp(-z)),
+                    lambda z, a: a * (1.0 - a)),
+        'elu': (lambda z: np.where(z > 0.0, z, np.expm1(np.minimum(z, 0.0))),
+                lambda z, a: np.where(z > 0.0, 1.0, a + 1.0)),
+        'softplus': (lambda z: np.logaddexp(z, 0.0),
+                     lambda z, a: 1.0 / (1.0 + np.exp(-z)))
+    }
+
+    def __init__(self, sizes, activation='relu', output_activation='linear',
+                 optimizer=None, loss='huber', delta=1.0, seed=None):
+        if loss not in ('huber', 'mse'):
+            raise ValueError('unknown loss {}'.format(loss))
+        self.sizes = list(sizes)
+        self.activation = activation
+        self.output_activation = output_activation
+        self.activations = [MLP.ACTIVATIONS[activation]] * (len(self.sizes) - 2) + [
+            MLP.ACTIVATIONS[output_activation]]
+        self.optimizer = optimizer if optimizer is not None else Adam()
+        self.loss = loss
+        self.delta = delta
+        self.seed = seed
+        self.random = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self):
+        """ Re-initializes all weights using Glorot uniform initialization for the
+        kernels and zeros for the biases, and resets the state of the optimizer.
+        """
+        self.weights = []
+        for fan_in, fan_out in zip(self.sizes[:-1], self.sizes[1:]):
+            limit = np.sqrt(6.0 / (fan_in + fan_out))
+            kernel = self.random.uniform(-limit, limit, (fan_in, fan_out))
+            self.weights.append(kernel.astype(np.float32))
+            self.weights.append(np.zeros(fan_out, dtype=np.float32))
+        self.optimizer.reset(self.weights)
+
+    def clone(self):
+        """ Returns a new network with the same architecture, loss and kind of optimizer
+        as this network, whose weights are a copy of the weights of this network.
+        """
+        other = MLP(self.sizes, self.activation, self.output_activation,
+                    copy.copy(self.optimizer),
+                    self.loss, self.delta, self.seed)
+        other.assign(self)
+        return other
+
+    def get_weights(self):
+        return [w.copy() for w in self.weights]
+
+    def set_weights(self, weights):
+        for w, value in zip(self.weights, weights):
+            np.copyto(w, value)
+
+    def assign(self, other):
+        """ Copies the weights of the specified network into this network in place.
+
+        inputs:
+            other - an MLP with the same architecture as this network
+        """
+        for w, w_other in zip(self.weights, other.weights):
+            np.copyto(w, w_other)
+
+    def blend(self, other, tau):
+        """ Moves the weights of this network towards the weights of the specified
+        network in place, using the formula w <- tau * w_other + (1 - tau) * w.
+
+        inputs:
+            other - an MLP with the same architecture as this network
+            tau - the weight of the other network in [0, 1]
+        """
+        for w, w_other in zip(self.weights, other.weights):
+            w *= 1.0 - tau
+            w += tau * w_other
+
+    def predict(self, inputs):
+        return self.predict_on_batch(inputs)
+
+    def predict_on_batch(self, inputs):
+        x = np.reshape(inputs, (len(inputs), -1)).astype(np.float32, copy=False)
+        weights = self.weights
+        for i, (activation, _) in enumerate(self.activations):
+            x = activation(np.dot(x, weights[2 * i]) + weights[2 * i + 1])
+        return x
+
+    def train_on_batch(self, inputs, targets, sample_weight=None):
+        """ Performs one step of the optimizer on a batch of inputs and targets.
+
+        inputs:
+            inputs - a numpy array of inputs, with one row per input
+            targets - a two-dimensional numpy array of targets, with one row per input
+            sample_weight - a one-dimensional numpy array of weights of the inputs in
+            the loss (defaults to None, meaning all inputs have equal weight)
+        outputs:
+            the value of the loss before the step
+        """
+        weights = self.weights
+
+        # forward pass
+        x = np.reshape(inputs, (len(inputs), -1)).astype(np.float32, copy=False)
+        cache = []
+        for i, (activation, _) in enumerate(self.activations):
+            z = np.dot(x, weights[2 * i]) + weights[2 * i + 1]
+            a = activation(z)
+            cache.append((x, z, a))
+            x = a
+
+        # loss and its gradient with respect to the outputs, which is averaged
+        # over the outputs and weighted over the batch as in Keras
+        error = x - targets
+        if self.loss == 'huber':
+            abs_error = np.abs(error)
+            quadratic = np.minimum(abs_error, self.delta)
+            losses = 0.5 * quadratic * quadratic + self.delta * (abs_error - quadratic)
+            grad = np.clip(error, -self.delta, self.delta)
+        else:
+            losses = 0.5 * error * error
+            grad = error
+        losses = np.mean(losses, axis=1)
+        scale = 1.0 / (error.shape[0] * error.shape[1])
+        if sample_weight is None:
+            loss = np.mean(losses)
+            grad = grad * scale
+        else:
+            loss = np.mean(losses * sample_weight)
+            grad = grad * (scale * np.reshape(sample_weight, (-1, 1)))
+
+        # backward pass
+        gradients = [None] * len(weights)
+        for i in range(len(self.activations) - 1, -1, -1):
+            x, z, a = cache[i]
+            grad = (grad * self.activations[i][1](z, a)).astype(np.float32, copy=False)
+            gradients[2 * i] = np.dot(x.T, grad)
+            gradients[2 * i + 1] = np.sum(grad, axis=0)
+            if i > 0:
+                grad = np.dot(grad, weights[2 * i].T)
+
+        # update the weights
+        self.optimizer.step(weights, gradients)
+        return loss
+
+    def fit(self, inputs, targets, batch_size=32, epochs=1, verbose=0, sample_weight=None):
+        """ Trains the network for a number of epochs over the specified data, in
+        shuffled mini-batches of the specified size.
+
+        inputs:
+            inputs - a numpy array of inputs, with one row per input
+            targets - a two-dimensional numpy array of targets, with one row per input
+            batch_size - the number of inputs per mini-batch (defaults to 32)
+            epochs - the number of passes over the data (defaults to 1)
+            verbose - ignored
+            sample_weight - a one-dimensional numpy array of weights of the inputs in
+            the loss (defaults to None, meaning all inputs have equal weight)
+        """
+        count = len(inputs)
+        for _ in range(epochs):
+            order = self.random.permutation(count)
+            for start in range(0, count, batch_size):
+                batch = order[start:start + batch_size]
+                weights = None if sample_weight is None else sample_weight[batch]
+                self.train_on_batch(inputs[batch], targets[batch], weights)
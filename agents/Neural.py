@@ -4,39 +4,80 @@ Created on Oct 22, 2018
 @author: michael
 '''
 from abc import abstractmethod
-import keras.backend as K
-from keras.engine.network import Network
+import numpy as np
 from agents.Agent import Agent
+from agents.MLP import MLP
 
 
 class Neural(Agent):
     """ An abstract class to represent an instance of a deep network architecture
-    to represent an instance of the Q-value function. 
+    to represent an instance of the Q-value function. Networks may be either Keras 
+    models or MLP objects.
+    
+    Keras is imported only when a Keras model is first used, so that programs that use
+    only tabular agents or MLP networks do not load the deep learning libraries.
+    
+    Implementations report counters of their training activity (such as the number
+    of training steps) in the dictionary stats, which is reset by clear.
     """
     
     @abstractmethod
-    def train(self, mini_batch, discount):
+    def train(self, mini_batch, discount, weights=None):
         """ Trains the current neural network on a batch of experiences.
         
         inputs:
-            mini_batch - an iterable object containing experiences observed
-            from a Markov decision process, of the form 
-            (state, action, reward, next_state, done)
+            mini_batch - a tuple of numpy arrays (states, actions, rewards, next_states, 
+            dones) containing experiences observed from a Markov decision process, with 
+            one row per experience, as returned by ReplayMemory
             discount - the discount factor in [0, 1]
+            weights - a one-dimensional numpy array of importance sampling weights
+            of the experiences (defaults to None, meaning all experiences have equal weight)
+        outputs:
+            a one-dimensional numpy array of the Bellman errors of the experiences,
+            computed before training
         """
         pass
         
+    @staticmethod
+    def stack(states, next_states):
+        """ Returns a single array containing the specified states followed by the 
+        specified next states, so that a network can be evaluated on both in one call.
+        
+        If the two arrays are adjacent halves of one array (as in the batches sampled 
+        by ReplayMemory), that array is returned without copying. 
+        
+        inputs:
+            states - a two-dimensional numpy array of states
+            next_states - a two-dimensional numpy array of next states
+        outputs:
+            a two-dimensional numpy array whose first half are states and second half 
+            are next states
+        """
+        base = states.base
+        if (base is not None and base is next_states.base
+                and len(base) == len(states) + len(next_states)
+                and states.ctypes.data == base.ctypes.data
+                and next_states.ctypes.data == base[len(states):].ctypes.data):
+            return base
+        return np.concatenate((states, next_states), axis=0)
+    
     @staticmethod
     def clear_model(model):
         """ A recursive method to re-initialize all layers in a Keras model.
         
         This method will recursively check all layers in the current model. For each
         layer, if a weight initializer exists, it calls the weight initializer to initialize
-        all weights in the layer to their default values. 
+        all weights in the layer to their default values. If the model is an MLP, its 
+        weights are re-initialized directly.
         
         inputs:
-            model - a Keras model whose weights to re-initialize
+            model - a Keras model or MLP whose weights to re-initialize
         """
+        if isinstance(model, MLP):
+            model.reset()
+            return
+        import keras.backend as K
+        from keras.engine.network import Network
         session = K.get_session()
         for layer in model.layers: 
             if isinstance(layer, Network):
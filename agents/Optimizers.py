@@ -0,0 +1,131 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class Optimizer(ABC):
+    """ An abstract class that represents a gradient-based optimizer of the weights
+    of an MLP. Weights are updated in place.
+
+    inputs:
+        learning_rate - the step size of the optimizer
+    """
+
+    def __init__(self, learning_rate):
+        self.learning_rate = learning_rate
+
+    @abstractmethod
+    def reset(self, weights):
+        """ Re-initializes the state of the optimizer for the specified weights.
+
+        inputs:
+            weights - a list of numpy arrays of weights to optimize
+        """
+        pass
+
+    @abstractmethod
+    def step(self, weights, gradients):
+        """ Updates the specified weights in place using the specified gradients
+        of the loss.
+
+        inputs:
+            weights - a list of numpy arrays of weights to optimize
+            gradients - a list of numpy arrays of gradients of the loss with respect
+            to each array of weights
+        """
+        pass
+
+
+class SGD(Optimizer):
+    """ Stochastic gradient descent with optional momentum.
+
+    inputs:
+        learning_rate - the step size of the optimizer (defaults to 0.01)
+        momentum - the momentum parameter in [0, 1) (defaults to 0)
+    """
+
+    def __init__(self, learning_rate=0.01, momentum=0.0):
+        super().__init__(learning_rate)
+        self.momentum = momentum
+
+    def reset(self, weights):
+        self.velocities = [np.zeros_like(w) for w in weights]
+
+    def step(self, weights, gradients):
+        for w, g, v in zip(weights, gradients, self.velocities):
+            v *= self.momentum
+            v -= self.learning_rate * g
+            w += v
+
+
+class RMSProp(Optimizer):
+    """ The RMSProp optimizer.
+
+    inputs:
+        learning_rate - the step size of the optimizer (defaults to 0.001)
+        rho - the decay rate of the moving average of squared gradients (defaults to 0.9)
+        epsilon - a small constant for numerical stability (defaults to 1e-7)
+
+    References
+    ========
+        - Tieleman, Tijmen, and Geoffrey Hinton. "Lecture 6.5-rmsprop: Divide the gradient
+        by a running average of its recent magnitude." COURSERA: Neural networks for
+        machine learning 4.2 (2012): 26-31.
+    """
+
+    def __init__(self, learning_rate=0.001, rho=0.9, epsilon=1e-7):
+        super().__init__(learning_rate)
+        self.rho = rho
+        self.epsilon = epsilon
+
+    def reset(self, weights):
+        self.averages = [np.zeros_like(w) for w in weights]
+
+    def step(self, weights, gradients):
+        for w, g, a in zip(weights, gradients, self.averages):
+            a *= self.rho
+            a += (1.0 - self.rho) * g * g
+            w -= self.learning_rate * g / (np.sqrt(a) + self.epsilon)
+
+
+class Adam(Optimizer):
+    """ The Adam optimizer.
+
+    inputs:
+        learning_rate - the step size of the optimizer (defaults to 0.001)
+        beta1 - the decay rate of the moving average of gradients (defaults to 0.9)
+        beta2 - the decay rate of the moving average of squared gradients
+        (defaults to 0.999)
+        epsilon - a small constant for numerical stability (defaults to 1e-7)
+
+    References
+    ========
+        - Kingma, Diederik P., and Jimmy Ba. "Adam: A method for stochastic optimization."
+        arXiv preprint arXiv:1412.6980 (2014).
+    """
+
+    def __init__(self, learning_rate=0.001, beta1=0.9, beta2=0.999, epsilon=1e-7):
+        super().__init__(learning_rate)
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+
+    def reset(self, weights):
+        self.t = 0
+        self.means = [np.zeros_like(w) for w in weights]
+        self.variances = [np.zeros_like(w) for w in weights]
+
+    def step(self, weights, gradients):
+        self.t += 1
+        step_size = self.learning_rate * np.sqrt(1.0 - self.beta2 ** self.t) / (
+            1.0 - self.beta1 ** self.t)
+        for w, g, m, v in zip(weights, gradients, self.means, self.variances):
+            m *= self.beta1
+            m += (1.0 - self.beta1) * g
+            v *= self.beta2
+            v += (1.0 - self.beta2) * g * g
+            w -= step_size * m / (np.sqrt(v) + self.epsilon)
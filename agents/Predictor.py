@@ -0,0 +1,170 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from agents.MLP import MLP
+
+
+class Predictor:
+    """ Evaluates a Keras model on small batches of inputs, such as the single states
+    for which Q-values are requested when selecting actions.
+
+    This base class calls predict_on_batch, which avoids the input pipeline overhead
+    of predict, and is also used for MLP networks, which are evaluated in NumPy 
+    directly. Use Predictor.create to obtain the fastest predictor for a model.
+
+    inputs:
+        model - the Keras model to evaluate
+    """
+
+    def __init__(self, model):
+        self.model = model
+
+    @staticmethod
+    def create(model, inference='auto'):
+        """ Returns a predictor for the specified model.
+
+        inputs:
+            model - the Keras model to evaluate
+            inference - the kind of predictor to create:
+                'numpy' - a NumPy copy of the forward pass (see DenseMirror)
+                'function' - a compiled backend function (see CompiledPredictor)
+                'predict' - calls predict_on_batch of the model
+                'auto' - 'numpy' if the model is supported by DenseMirror, and 'function'
+                otherwise (the default)
+        outputs:
+            a Predictor object
+        """
+        if isinstance(model, MLP):
+            return Predictor(model)
+        if inference == 'auto':
+            inference = 'numpy' if DenseMirror.supports(model) else 'function'
+        if inference == 'numpy':
+            return DenseMirror(model)
+        elif inference == 'function':
+            return CompiledPredictor(model)
+        elif inference == 'predict':
+            return Predictor(model)
+        else:
+            raise ValueError('unknown inference mode {}'.format(inference))
+
+    def refresh(self):
+        """ Notifies the predictor that the weights of the model have changed.
+        """
+        pass
+
+    def __call__(self, inputs):
+        """ Returns the outputs of the model for the specified batch of inputs.
+
+        inputs:
+            inputs - a numpy array of inputs, with one row per input
+        outputs:
+            a numpy array of outputs, with one row per input
+        """
+        return self.model.predict_on_batch(inputs)
+
+
+class CompiledPredictor(Predictor):
+    """ Evaluates a Keras model by calling a backend function compiled from its
+    inputs and outputs, which bypasses the Keras training and prediction loops.
+    """
+
+    def __init__(self, model):
+        import keras.backend as K
+        super().__init__(model)
+        self.function = K.function([model.input, K.learning_phase()], [model.output])
+
+    def __call__(self, inputs):
+        return self.function([inputs, 0])[0]
+
+
+class DenseMirror(Predictor):
+    """ Evaluates a Keras model consisting of a chain of Dense layers with a NumPy
+    copy of its forward pass.
+
+    For the small batches used to select actions, this is much faster than calling
+    into the backend. Weights are copied from the model lazily, on the first call
+    following a call to refresh.
+    """
+
+    # activation functions supported by the NumPy forward pass
+    ACTIVATIONS = {
+        'linear': lambda x: x,
+        'relu': lambda x: np.maximum(x, 0.0),
+        'tanh': np.tanh,
+        'sigmoid': lambda x: 1.0 / (1.0 + np.exp(-x)),
+        'softplus': lambda x: np.logaddexp(x, 0.0),
+        'elu': lambda x: np.where(x > 0.0, x, np.expm1(np.minimum(x, 0.0))),
+        'softmax': lambda x: DenseMirror.softmax(x)
+    }
+
+    # layers that do nothing at inference time
+    IDENTITY_LAYERS = ('InputLayer', 'Dropout', 'Flatten')
+
+    def __init__(self, model):
+        super().__init__(model)
+        self.layers = DenseMirror.parse(model)
+        if self.layers is None:
+            raise ValueError('model is not a chain of Dense layers')
+        self.weights = None
+
+    @staticmethod
+    def supports(model):
+        """ Returns whether the specified Keras model can be evaluated by a DenseMirror.
+        """
+        return DenseMirror.parse(model) is not None
+
+    @staticmethod
+    def parse(model):
+        """ Returns a list of (use_bias, activations) for each Dense layer in the
+        specified model, where activations is a list of activation names, or None if
+        the model is not a chain of supported layers.
+        """
+        layers = []
+        output = None
+        for layer in model.layers:
+            if output is not None and layer.input is not output:
+                return None
+            output = layer.output
+            kind = type(layer).__name__
+            if kind in DenseMirror.IDENTITY_LAYERS:
+                continue
+            activation = layer.get_config().get('activation')
+            if activation not in DenseMirror.ACTIVATIONS:
+                return None
+            if kind == 'Dense':
+                layers.append((layer.get_config()['use_bias'], [activation]))
+            elif kind == 'Activation' and layers:
+                layers[-1][1].append(activation)
+            else:
+                return None
+        return layers or None
+
+    @staticmethod
+    def softmax(x):
+        x = np.exp(x - np.amax(x, axis=-1, keepdims=True))
+        return x / np.sum(x, axis=-1, keepdims=True)
+
+    def refresh(self):
+        self.weights = None
+
+    def __call__(self, inputs):
+
+        # copy the weights from the model
+        if self.weights is None:
+            self.weights = self.model.get_weights()
+
+        # evaluate the forward pass
+        x = np.reshape(inputs, (len(inputs), -1))
+        i = 0
+        for use_bias, activations in self.layers:
+            x = np.dot(x, self.weights[i])
+            i += 1
+            if use_bias:
+                x += self.weights[i]
+                i += 1
+            for activation in activations:
+                x = DenseMirror.ACTIVATIONS[activation](x)
+        return x
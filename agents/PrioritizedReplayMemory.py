@@ -0,0 +1,89 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from agents.ReplayMemory import ReplayMemory
+from agents.SumTree import SumTree
+
+
+class PrioritizedReplayMemory(ReplayMemory):
+    """ A cyclic buffer for prioritized experience replay, in which experiences are
+    sampled in proportion to their priorities. Priorities are stored in a sum-tree, so 
+    sampling and updating priorities take logarithmic time in the capacity of the buffer.
+    
+    New experiences are given the maximum priority seen so far. After training on a 
+    sampled batch, the priorities of its experiences should be updated from the absolute
+    Bellman errors by calling update_priorities. Sampling is corrected by importance 
+    sampling weights, whose exponent beta is annealed linearly to one.
+    
+    inputs:
+        memory_capacity - the maximum capacity of the buffer
+        batch_size - the size of the random samples generated by the buffer
+        alpha - the exponent applied to Bellman errors to compute priorities 
+        (defaults to 0.6)
+        beta - the initial exponent of the importance sampling weights (defaults to 0.4)
+        beta_steps - the number of batches sampled over which beta is annealed to one
+        (defaults to 100000)
+        epsilon - a small constant added to the absolute Bellman errors so that no 
+        experience has zero priority (defaults to 1e-6)
+    
+    References
+    ========
+        - Schaul, Tom, et al. "Prioritized experience replay." 
+        arXiv preprint arXiv:1511.05952 (2015).
+    """
+
+    def __init__(self, memory_capacity, batch_size, 
+                 alpha=0.6, beta=0.4, beta_steps=100000, epsilon=1e-6):
+        self.alpha = alpha
+        self.beta0 = beta
+        self.beta_steps = beta_steps
+        self.epsilon = epsilon
+        self.priorities = SumTree(memory_capacity)
+        super().__init__(memory_capacity, batch_size)
+    
+    def clear(self):
+        super().clear()
+        self.priorities.clear()
+        self.max_priority = 1.0
+        self.beta = self.beta0
+        self.samples = 0
+        self.indices = None
+        self.weights = None
+        
+    def remember(self, state, action, reward, new_state, done):
+        i = self.index
+        super().remember(state, action, reward, new_state, done)
+        self.priorities.update(np.array([i]), self.max_priority)
+        
+    def sample_indices(self):
+        
+        # sample experiences in proportion to their priorities, stratified over
+        # equal segments of the total priority
+        batch_size = self.batch_size
+        segment = self.priorities.total() / batch_size
+        u = (np.arange(batch_size) + np.random.rand(batch_size)) * segment
+        indices = np.minimum(self.priorities.find(u), self.size - 1)
+        
+        # compute the normalized importance sampling weights
+        probabilities = self.priorities.get(indices) / self.priorities.total()
+        weights = (self.size * probabilities) ** (-self.beta)
+        weights /= np.amax(weights)
+        
+        # anneal beta towards one
+        self.samples += 1
+        fraction = min(self.samples / self.beta_steps, 1.0)
+        self.beta = self.beta0 + fraction * (1.0 - self.beta0)
+        
+        self.indices, self.weights = indices, weights
+        return indices
+    
+    def importance_weights(self):
+        return self.weights
+    
+    def update_priorities(self, errors):
+        priorities = (np.abs(errors) + self.epsilon) ** self.alpha
+        self.priorities.update(self.indices, priorities)
+        self.max_priority = max(self.max_priority, np.amax(priorities))
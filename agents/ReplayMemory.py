@@ -3,12 +3,18 @@ Created on Oct 22, 2018
 
 @author: michael
 '''
-import random
+import numpy as np
 
 
 class ReplayMemory:
     """ A simple and efficient reusable cyclic buffer for randomized experience replay.
     
+    Experiences are stored column-wise in numpy arrays that are allocated once, when the 
+    first experience is stored. States are flattened to one-dimensional vectors and 
+    stored in single precision, which is the precision used by neural network libraries.
+    In each sampled batch, the states and next states are stored together in one array,
+    so that both can be evaluated by a network in a single call (see Neural.stack).
+    
     inputs:
         memory_capacity - the maximum capacity of the buffer
         batch_size - the size of the random samples generated by the buffer
@@ -22,9 +28,29 @@ class ReplayMemory:
     def clear(self):
         """ Removes all data from the buffer.
         """
-        self.memory = []
+        self.states = None
+        self.size = 0
         self.index = 0
         
+    def allocate(self, state_dim):
+        """ Allocates the columns of the buffer and of the sampled batches.
+        
+        inputs:
+            state_dim - the number of components of each (flattened) state
+        """
+        capacity, batch_size = self.memory_capacity, self.batch_size
+        self.states = np.empty((capacity, state_dim), dtype=np.float32)
+        self.actions = np.empty(capacity, dtype=int)
+        self.rewards = np.empty(capacity, dtype=np.float32)
+        self.next_states = np.empty((capacity, state_dim), dtype=np.float32)
+        self.dones = np.empty(capacity, dtype=bool)
+        batch_states = np.empty((2 * batch_size, state_dim), dtype=np.float32)
+        self.batch = (batch_states[:batch_size],
+                      np.empty(batch_size, dtype=int),
+                      np.empty(batch_size, dtype=np.float32),
+                      batch_states[batch_size:],
+                      np.empty(batch_size, dtype=bool))
+        
     def remember(self, state, action, reward, new_state, done):
         """ Stores a new experience in the buffer.
         
@@ -40,21 +66,74 @@ class ReplayMemory:
             new_state - the next state
             done - boolean whether or not new_state is terminal
         """
-        memory = (state, action, reward, new_state, done)
-        if len(self.memory) < self.memory_capacity:
-            self.memory.append(memory)
-        else:
-            self.memory[self.index] = memory
-        self.index = (self.index + 1) % self.memory_capacity
+        if self.states is None:
+            self.allocate(np.size(state))
+        i = self.index
+        self.states[i] = np.ravel(state)
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = np.ravel(new_state)
+        self.dones[i] = done
+        self.index = (i + 1) % self.memory_capacity
+        self.size = min(self.size + 1, self.memory_capacity)
+        
+    def sample_indices(self):
+        """ Returns the positions in the buffer of a randomly sampled batch of experiences.
+        
+        outputs:
+            a one-dimensional numpy array of integer positions
+        """
+        return np.random.randint(self.size, size=self.batch_size)
+        
+    def gather(self, indices):
+        """ Copies the experiences at the specified positions in the buffer into 
+        the batch arrays and returns them.
+        
+        inputs:
+            indices - a one-dimensional numpy array of integer positions
+        outputs:
+            a tuple of numpy arrays (states, actions, rewards, next_states, dones)
+        """
+        states, actions, rewards, next_states, dones = self.batch
+        np.take(self.states, indices, axis=0, out=states)
+        np.take(self.actions, indices, out=actions)
+        np.take(self.rewards, indices, out=rewards)
+        np.take(self.next_states, indices, axis=0, out=next_states)
+        np.take(self.dones, indices, out=dones)
+        return self.batch
         
     def sample_batch(self):
         """ If the buffer has enough experiences in memory, this method samples and returns
-        a randomly sampled batch of experiences of fixed size from memory.
+        a randomly sampled batch of experiences of fixed size from memory. Experiences are 
+        sampled uniformly with replacement.
+        
+        The returned arrays are reused by subsequent calls to this method, so they must 
+        be copied if they are needed after the next batch is sampled.
         
         outputs:
-            a list of experiences represented as tuples
+            a tuple of numpy arrays (states, actions, rewards, next_states, dones), with
+            one row per experience, or None if the buffer does not have enough experiences
         """
-        if len(self.memory) < self.batch_size:
+        if self.size < self.batch_size:
             return None
         else:
-            return random.sample(self.memory, self.batch_size)
+            return self.gather(self.sample_indices())
+    
+    def importance_weights(self):
+        """ Returns the importance sampling weights of the experiences in the most 
+        recently sampled batch, or None if experiences are sampled uniformly.
+        
+        outputs:
+            a one-dimensional numpy array of weights, or None
+        """
+        return None
+    
+    def update_priorities(self, errors):
+        """ Updates the sampling priorities of the experiences in the most recently 
+        sampled batch. Does nothing if experiences are sampled uniformly.
+        
+        inputs:
+            errors - a one-dimensional numpy array of Bellman errors of the experiences 
+            in the most recently sampled batch
+        """
+        pass
@@ -0,0 +1,124 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+import math
+from agents.DenseTabular import DenseTabular
+
+
+class SharedTabular(DenseTabular):
+    """ A dense Q-value table stored in shared memory, which can be updated concurrently
+    by several worker processes (see HogwildLearning).
+
+    The table has a fixed number of rows, so the indexer must map each state to the
+    same row in every process (e.g. an IdentityIndexer); an InternIndexer would assign
+    different rows in each worker. By default, updates are not synchronized, as in
+    Hogwild: concurrent updates of the same entry may occasionally be lost, which is
+    harmless for stochastic approximation. Alternatively, rows can be protected by a
+    number of striped locks, where row i is protected by lock i modulo locks.
+
+    The shared memory is released by calling close in the process that created the
+    table, once it is no longer needed.
+
+    inputs:
+        valid_actions - the number of possible actions
+        learning_rate - the learning rate used to update the table
+        states - either an integer giving the number of states (if the states of the task
+        are integers in [0, states)), or an Indexer that maps states to row indices
+        clip_min - minimum value that can be used to update the table
+        (defaults to negative infinity)
+        clip_max - maximum value that can be used to update the table
+        (defaults to positive infinity)
+        randomizer - numpy method handle to initialize action values, which must accept
+        a shape tuple (defaults to np.zeros)
+        dtype - the numpy data type of the table (defaults to float)
+        locks - the number of striped locks protecting updates (defaults to 0, meaning
+        updates are not synchronized)
+
+    References
+    ========
+        - Recht, Benjamin, et al. "Hogwild!: A lock-free approach to parallelizing
+        stochastic gradient descent." Advances in neural information processing systems.
+        2011.
+    """
+
+    def __init__(self, valid_actions, learning_rate, states,
+                 clip_min=-math.inf, clip_max=math.inf, randomizer=np.zeros,
+                 dtype=float, locks=0):
+        self.memory = None
+        self.locks = [multiprocessing.Lock() for _ in range(locks)]
+        super().__init__(valid_actions, learning_rate, states, clip_min, clip_max,
+                         randomizer, 0, dtype)
+
+    def clear(self):
+        self.alpha = self.learning_rate(0)
+        self.indexer.clear()
+        values = np.asarray(self.randomizer((self.indexer.size(), self.valid_actions)),
+                            dtype=self.dtype)
+
+        # allocate the shared memory once, and then re-initialize it in place so that
+        # processes that share the table keep seeing the same memory
+        if self.memory is None:
+            self.memory = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            self.Q = np.ndarray(values.shape, dtype=values.dtype, buffer=self.memory.buf)
+        np.copyto(self.Q, values)
+        self.attach()
+
+    def close(self):
+        """ Releases the shared memory holding the table. The table can no longer be
+        used afterwards.
+        """
+        if self.memory is not None:
+            self.Q = None
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['Q'] = None
+        state['views'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        shape = (self.indexer.size(), self.valid_actions)
+        self.Q = np.ndarray(shape, dtype=self.dtype, buffer=self.memory.buf)
+        self.attach()
+
+    def grow(self, rows):
+        raise ValueError('state index {} exceeds the size {} of the shared table'.format(
+            rows - 1, self.Q.shape[0]))
+
+    def update(self, state, action, error):
+        self.update_row(self.row(state), action, error)
+
+    def update_row(self, row, action, error):
+        if self.locks:
+            with self.locks[row % len(self.locks)]:
+                super().update_row(row, action, error)
+        else:
+            super().update_row(row, action, error)
+
+    def update_all(self, state, errors):
+        if self.locks:
+            with self.locks[self.row(state) % len(self.locks)]:
+                super().update_all(state, errors)
+        else:
+            super().update_all(state, errors)
+
+    def update_rows(self, rows, actions, errors, merge=False):
+        if not self.locks:
+            super().update_rows(rows, actions, errors, merge)
+            return
+        rows, actions = np.asarray(rows), np.asarray(actions)
+        errors = np.asarray(errors, dtype=float)
+        stripes = rows % len(self.locks)
+        for stripe in np.unique(stripes):
+            mask = stripes == stripe
+            with self.locks[stripe]:
+                super().update_rows(rows[mask], actions[mask], errors[mask], merge)
@@ -0,0 +1,86 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+
+
+class SumTree:
+    """ An array-backed binary tree in which every internal node stores the sum of the
+    values of its children. Supports O(log n) updates of leaf values and O(log n) 
+    sampling of leaves in proportion to their values, vectorized over batches.
+    
+    The tree is stored in a single numpy array of length 2 * leaves, where leaves is 
+    the capacity rounded up to a power of two. Node i has children 2i and 2i + 1, the
+    root is node 1, and leaf j is node leaves + j.
+    
+    inputs:
+        capacity - the number of leaves of the tree
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.leaves = 1
+        while self.leaves < capacity:
+            self.leaves *= 2
+        self.depth = self.leaves.bit_length() - 1
+        self.clear()
+        
+    def clear(self):
+        """ Sets the values of all leaves to zero.
+        """
+        self.tree = np.zeros(2 * self.leaves, dtype=float)
+        
+    def total(self):
+        """ Returns the sum of the values of all leaves.
+        """
+        return self.tree[1]
+    
+    def get(self, indices):
+        """ Returns the values of the specified leaves.
+        
+        inputs:
+            indices - a one-dimensional numpy array of leaf indices
+        outputs:
+            a one-dimensional numpy array of leaf values
+        """
+        return self.tree[indices + self.leaves]
+    
+    def update(self, indices, values):
+        """ Sets the values of the specified leaves and updates the sums stored in 
+        their ancestors. If a leaf is repeated, its last value is kept.
+        
+        inputs:
+            indices - a one-dimensional numpy array of leaf indices
+            values - a one-dimensional numpy array of new leaf values
+        """
+        tree = self.tree
+        nodes = np.asarray(indices) + self.leaves
+        tree[nodes] = values
+        for _ in range(self.depth):
+            nodes = np.unique(nodes >> 1)
+            tree[nodes] = tree[2 * nodes] + tree[2 * nodes + 1]
+            
+    def find(self, values):
+        """ For each of the specified values in [0, total()), returns the index of the 
+        first leaf at which the cumulative sum of leaf values exceeds the value. 
+        
+        If the values are drawn uniformly at random, the leaves are sampled in proportion 
+        to their values.
+        
+        inputs:
+            values - a one-dimensional numpy array of values in [0, total())
+        outputs:
+            a one-dimensional numpy array of leaf indices
+        """
+        tree = self.tree
+        values = np.array(values, dtype=float)
+        nodes = np.ones(len(values), dtype=np.intp)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = tree[left]
+            right = values >= left_sum
+            values -= np.where(right, left_sum, 0.0)
+            nodes = left + right
+        return np.minimum(nodes - self.leaves, self.capacity - 1)
@@ -7,6 +7,7 @@ from collections import defaultdict
 import numpy as np
 import math
 from agents.Agent import Agent
+from agents.Constant import Constant
 
 
 class Tabular(Agent):
@@ -33,18 +34,33 @@ class Tabular(Agent):
         self.clip_min = clip_min
         self.clip_max = clip_max
         if isinstance(learning_rate, float):
-            self.learning_rate = lambda e: learning_rate
+            self.learning_rate = Constant(learning_rate)
         else:
             self.learning_rate = learning_rate
         self.clear()
         
     def clear(self):
         self.alpha = self.learning_rate(0)
-        self.Q = defaultdict(lambda: self.randomizer(self.valid_actions))
+        self.Q = defaultdict(self.initial_values)
+    
+    def initial_values(self):
+        """ Returns the initial Q-values of a state that is added to the table. This is a 
+        method rather than a lambda expression so that the table can be pickled.
+        """
+        return self.randomizer(self.valid_actions)
     
     def values(self, state):
         return self.Q[state]
      
+    def peek(self, state):
+        values = self.Q.get(state)
+        if values is None:
+            return self.randomizer(self.valid_actions)
+        return values
+    
+    def peek_batch(self, states):
+        return np.array([self.peek(state) for state in states])
+     
     def finish_episode(self, episode):
         self.alpha = self.learning_rate(episode)
     
@@ -75,3 +91,36 @@ class Tabular(Agent):
         change = self.alpha * errors
         change = np.clip(change, self.clip_min, self.clip_max, change)
         self.Q[state] += change
+    
+    def update_batch(self, states, actions, errors, merge=False):
+        """ Updates the Q-values for the specified state-action pairs and Bellman errors.
+        
+        The formula is Q[states[i], actions[i]] += learning_rate * errors[i] for each i,
+        so by default the batch has the same effect as calling update for each pair in 
+        turn, and repeated state-action pairs accumulate their changes. This is the rule
+        followed by update_batch and update_rows of all agents.
+        
+        If merge is True, repeated state-action pairs are instead updated once, by the 
+        mean of their errors, so that a batch never moves a Q-value further than a 
+        single update would. This is needed by learners whose batches can repeat the 
+        same pair many times (e.g. the vector learners, whose copies of the environment 
+        start in the same state), but costs an extra pass over the batch.
+        
+        inputs:
+            states - a numpy array of states
+            actions - a one-dimensional numpy array of actions
+            errors - a one-dimensional numpy array of Bellman errors
+            merge - whether to merge repeated state-action pairs into one update 
+            (defaults to False)
+        """
+        if not merge:
+            for state, action, error in zip(states, actions, errors):
+                self.update(state, action, error)
+            return
+        merged = {}
+        for state, action, error in zip(states, actions, errors):
+            key = (state, int(action))
+            total, count = merged.get(key, (0.0, 0))
+            merged[key] = (total + error, count + 1)
+        for (state, action), (total, count) in merged.items():
+            self.update(state, action, total / count)
@@ -0,0 +1,109 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+
+
+class TileCoder:
+    """ Maps continuous states to sparse binary features using tile coding.
+
+    The box of states between low and high is covered by several overlapping grids of
+    tiles (tilings), each offset from the others by a fraction of a tile. Each state
+    activates exactly one tile in each tiling, so a state is represented by the indices
+    of its active tiles, one per tiling. Tilings are offset asymmetrically, by
+    displacements proportional to (1, 3, 5, ...) in each dimension.
+
+    If the number of tiles is too large to be enumerated, tiles can be hashed into a
+    fixed number of features, in which case distinct tiles may share a feature.
+
+    Since learners generally look up the same state several times in a row, the features
+    of the last state are cached, keyed on the identity of the state. States must
+    therefore not be modified in place once their features have been computed.
+
+    inputs:
+        low - a one-dimensional numpy array of the lower bounds of each state variable
+        high - a one-dimensional numpy array of the upper bounds of each state variable
+        tilings - the number of tilings (defaults to 8)
+        tiles - the number of tiles per tiling along each dimension, either an integer
+        or a sequence with one integer per dimension (defaults to 8)
+        hashing - the number of features into which tiles are hashed (defaults to None,
+        meaning every tile has its own feature)
+
+    References
+    ========
+        - Sutton, Richard S., and Andrew G. Barto.
+        Reinforcement learning: An introduction. MIT press, 2018.
+    """
+
+    # large primes used to hash the coordinates of tiles
+    PRIMES = np.array([2654435761, 2246822519, 3266489917, 668265263, 374761393,
+                       1181783497, 3863031449, 1540483477], dtype=np.uint64)
+
+    def __init__(self, low, high, tilings=8, tiles=8, hashing=None):
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+        self.dimension = self.low.size
+        self.tilings = tilings
+        self.tiles = np.broadcast_to(np.asarray(tiles, dtype=int), (self.dimension,)).copy()
+        self.hashing = hashing
+        self.scale = self.tiles / (self.high - self.low)
+
+        # offsets of each tiling in units of tiles
+        displacement = 2 * np.arange(self.dimension) + 1
+        self.offsets = (np.arange(tilings)[:, np.newaxis] * displacement / tilings) % 1.0
+
+        # each tiling has one more tile along each dimension to cover its offset
+        sides = self.tiles + 1
+        self.strides = np.concatenate(([1], np.cumprod(sides[:-1]))).astype(np.intp)
+        self.tiling_size = int(np.prod(sides))
+        if hashing is None:
+            self.size = tilings * self.tiling_size
+        else:
+            self.size = hashing
+        self.bases = np.arange(tilings, dtype=np.intp) * self.tiling_size
+        self.last_state = None
+        self.last_features = None
+
+    def coordinates(self, states):
+        """ Returns the coordinates of the active tile in each tiling for the specified
+        two-dimensional array of states, as an array of shape (states, tilings, dimension).
+        """
+        scaled = (states - self.low) * self.scale
+        coords = np.floor(scaled[:, np.newaxis, :] + self.offsets).astype(np.intp)
+        return np.clip(coords, 0, self.tiles, coords)
+
+    def features_batch(self, states):
+        """ Returns the indices of the active features of each of the specified states.
+
+        inputs:
+            states - a two-dimensional numpy array of states, with one row per state, or a
+            sequence of one-dimensional states
+        outputs:
+            a two-dimensional numpy array of feature indices, of shape (states, tilings)
+        """
+        states = np.asarray(states)
+        if states.dtype == object:
+            states = np.stack(states)
+        states = np.reshape(states, (-1, self.dimension))
+        coords = self.coordinates(states)
+        if self.hashing is None:
+            return np.dot(coords, self.strides) + self.bases
+        primes = TileCoder.PRIMES[np.arange(self.dimension + 1) % len(TileCoder.PRIMES)]
+        keys = np.dot(coords.astype(np.uint64), primes[:-1])
+        keys += np.arange(self.tilings, dtype=np.uint64) * primes[-1]
+        return (keys % np.uint64(self.hashing)).astype(np.intp)
+
+    def features(self, state):
+        """ Returns the indices of the active features of the specified state.
+
+        inputs:
+            state - a one-dimensional numpy array representing the state
+        outputs:
+            a one-dimensional numpy array of feature indices, one per tiling
+        """
+        if state is not self.last_state:
+            self.last_features = self.features_batch(state)[0]
+            self.last_state = state
+        return self.last_features
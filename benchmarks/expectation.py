@@ -0,0 +1,100 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import argparse
+import os
+import sys
+import timeit
+import numpy as np
+
+# make the packages of the repository importable when this file is run as a script
+# (python benchmarks/expectation.py) rather than as a module (python -m benchmarks.expectation)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.DenseTabular import DenseTabular
+from agents.Tabular import Tabular
+from domains.RandomMDP import RandomMDP
+from policies.Boltzmann import Boltzmann
+from policies.EpsilonGreedy import EpsilonGreedy
+from policies.Policy import Policy
+from policies.Pursuit import Pursuit
+
+# the number of states of the task
+STATES = 1000
+
+# the agents: name -> agent factory given the number of actions
+AGENTS = {
+    'Tabular': lambda actions: Tabular(actions, 0.1, randomizer=np.random.random),
+    'DenseTabular': lambda actions: DenseTabular(actions, 0.1, STATES,
+                                                 randomizer=np.random.random)
+}
+
+# the exploration policies: name -> policy factory
+POLICIES = {
+    'EpsilonGreedy': lambda: EpsilonGreedy(0.1),
+    'Boltzmann': lambda: Boltzmann(0.5),
+    'Pursuit': lambda: Pursuit(0.05)
+}
+
+
+def time_calls(function, states, repeats):
+    """ Returns the smallest average time in microseconds of one call of the specified
+    function of a state over several passes through the specified states.
+    """
+    def run():
+        for state in states:
+            function(state)
+    return min(timeit.repeat(run, number=1, repeat=repeats)) / len(states) * 1e6
+
+
+def run_case(policy_name, agent_name, actions, calls, repeats, seed):
+    """ Times the fused act_and_evaluate of a policy against the unfused calls of act,
+    distribution and values made by the default implementation in Policy, and returns
+    the average time per call of each in microseconds.
+    """
+    np.random.seed(seed)
+    task = RandomMDP(STATES, actions, seed=seed)
+    Q = AGENTS[agent_name](actions)
+    policy = POLICIES[policy_name]()
+    policy.seed(seed)
+    states = np.random.randint(STATES, size=calls).tolist()
+    for state in range(STATES):
+        Q.values(state)
+    fused = time_calls(lambda state: policy.act_and_evaluate(Q, task, state), states,
+                       repeats)
+    unfused = time_calls(lambda state: Policy.act_and_evaluate(policy, Q, task, state),
+                         states, repeats)
+    return fused, unfused
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares the fused act_and_evaluate of each policy to unfused calls.')
+    parser.add_argument('--actions', type=int, nargs='+', default=[4, 64],
+                        help='the numbers of actions to benchmark (default 4 64)')
+    parser.add_argument('--calls', type=int, default=20000,
+                        help='the number of calls per measurement (default 20000)')
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='the number of measurements, of which the fastest is kept '
+                        '(default 5)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='the random seed (default 0)')
+    args = parser.parse_args()
+
+    print('{:40s} {:>12s} {:>12s} {:>8s}'.format('case', 'fused us', 'unfused us',
+                                                 'speedup'))
+    for policy_name in POLICIES:
+        for agent_name in AGENTS:
+            for actions in args.actions:
+                fused, unfused = run_case(policy_name, agent_name, actions, args.calls,
+                                          args.repeats, args.seed)
+                name = '{}/{}/{}'.format(policy_name, agent_name, actions)
+                print('{:40s} {:12.2f} {:12.2f} {:8.2f}'.format(name, fused, unfused,
+                                                                unfused / fused))
+                sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# the modules imported by tabular-only worker processes
+TABULAR_MODULES = [
+    'agents.Tabular', 'agents.DenseTabular',
+    'learning.QLearning', 'learning.Sarsa', 'learning.ExpectedSarsa',
+    'learning.OnlineSarsaLambda', 'learning.OfflineSarsaLambda', 'learning.MonteCarlo',
+    'policies.EpsilonGreedy', 'policies.Boltzmann', 'policies.Pursuit'
+]
+
+# the modules imported by programs that train neural agents using MLP networks
+MLP_MODULES = [
+    'agents.MLP', 'agents.DeepQ', 'agents.DoubleDeepQ', 'agents.PrioritizedReplayMemory',
+    'learning.DeepQLearning'
+]
+
+# deep learning libraries that must not be loaded by the modules above
+FORBIDDEN = ('keras', 'tensorflow', 'theano')
+
+# the program run in a fresh interpreter to measure the import time
+PROGRAM = '''
+import importlib, json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+loaded = sorted(m for m in sys.modules if m.split('.')[0] in {forbidden!r})
+print(json.dumps({{'seconds': elapsed, 'forbidden': loaded}}))
+'''
+
+
+def measure(modules, repeats):
+    """ Imports the specified modules in fresh interpreters, and returns the smallest
+    import time in seconds over the specified number of repeats and the list of
+    forbidden modules that were loaded.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    program = PROGRAM.format(modules=modules, forbidden=FORBIDDEN)
+    best, forbidden = float('inf'), []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, '-c', program], cwd=root, check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout
+        result = json.loads(output)
+        best = min(best, result['seconds'])
+        forbidden = result['forbidden']
+    return best, forbidden
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Checks the import time of the tabular and MLP code paths.')
+    parser.add_argument('--budget', type=float, default=0.5,
+                        help='the maximum import time in seconds (default 0.5)')
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='the number of fresh interpreters to measure (default 5)')
+    args = parser.parse_args()
+
+    ok = True
+    for label, modules in (('tabular', TABULAR_MODULES), ('mlp', MLP_MODULES)):
+        seconds, forbidden = measure(modules, args.repeats)
+        within = seconds <= args.budget and not forbidden
+        ok = ok and within
+        print('{:8s} {:.3f}s (budget {:.3f}s) {}{}'.format(
+            label, seconds, args.budget, 'ok' if within else 'FAILED',
+            ', loaded ' + ', '.join(forbidden) if forbidden else ''))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
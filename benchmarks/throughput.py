@@ -0,0 +1,232 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+# make the packages of the repository importable when this file is run as a script
+# (python benchmarks/throughput.py) rather than as a module (python -m benchmarks.throughput)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.DenseTabular import DenseTabular
+from agents.DeepQ import DeepQ
+from agents.DoubleDeepQ import DoubleDeepQ
+from agents.MLP import MLP
+from agents.ReplayMemory import ReplayMemory
+from domains.Chain import Chain
+from domains.GridWorld import GridWorld
+from domains.MountainCar import MountainCar
+from domains.RandomMDP import RandomMDP
+from learning.DeepQLearning import DeepQLearning
+from learning.ExpectedSarsa import ExpectedSarsa
+from learning.Instrumentation import Instrumentation
+from learning.MonteCarlo import MonteCarlo
+from learning.OfflineSarsaLambda import OfflineSarsaLambda
+from learning.OnlineSarsaLambda import OnlineSarsaLambda
+from learning.QLearning import QLearning
+from learning.Sarsa import Sarsa
+from learning.VectorExpectedSarsa import VectorExpectedSarsa
+from learning.VectorQLearning import VectorQLearning
+from learning.VectorSarsa import VectorSarsa
+from policies.Boltzmann import Boltzmann
+from policies.EpsilonGreedy import EpsilonGreedy
+from policies.Pursuit import Pursuit
+
+# the discount factor used by all benchmarks
+DISCOUNT = 0.99
+
+# the number of copies of the environment stepped together by the vectorized learners
+COPIES = 32
+
+# the number of episodes over which returns are averaged to detect the threshold
+WINDOW = 10
+
+# the tabular tasks: name -> (task factory, episode length, threshold on the average
+# discounted return, or None if the task has no threshold)
+TABULAR_TASKS = {
+    'gridworld': (lambda: GridWorld(10, 10, slip=0.1), 500, -25.0),
+    'chain': (lambda: Chain(5), 200, None),
+    'random_mdp': (lambda: RandomMDP(1000, 4, seed=0), 500, None)
+}
+
+# the tabular learners: name -> (learner factory given the episode length, vectorized)
+TABULAR_LEARNERS = {
+    'QLearning': (lambda length: QLearning(DISCOUNT, length), False),
+    'Sarsa': (lambda length: Sarsa(DISCOUNT, length), False),
+    'ExpectedSarsa': (lambda length: ExpectedSarsa(DISCOUNT, length), False),
+    'MonteCarlo': (lambda length: MonteCarlo(DISCOUNT, length), False),
+    'OnlineSarsaLambda': (lambda length: OnlineSarsaLambda(DISCOUNT, length), False),
+    'OfflineSarsaLambda': (lambda length: OfflineSarsaLambda(DISCOUNT, length), False),
+    'VectorQLearning': (lambda length: VectorQLearning(DISCOUNT, length, COPIES), True),
+    'VectorSarsa': (lambda length: VectorSarsa(DISCOUNT, length, COPIES), True),
+    'VectorExpectedSarsa': (lambda length: VectorExpectedSarsa(DISCOUNT, length, COPIES),
+                            True)
+}
+
+# the exploration policies: name -> policy factory
+POLICIES = {
+    'EpsilonGreedy': lambda: EpsilonGreedy(0.1),
+    'Boltzmann': lambda: Boltzmann(0.5),
+    'Pursuit': lambda: Pursuit(0.05)
+}
+
+# the neural agents, which are benchmarked on the mountain car task
+NEURAL_AGENTS = {
+    'DeepQ': lambda: DeepQ(MLP([2, 64, 64, 3]), 1),
+    'DoubleDeepQ': lambda: DoubleDeepQ(MLP([2, 64, 64, 3]), 1, sync_every=500)
+}
+
+# the encoding of mountain car states as inputs of neural networks
+MOUNTAIN_CAR_SCALE = 2.0 / (MountainCar.HIGH - MountainCar.LOW)
+MOUNTAIN_CAR_CENTER = (MountainCar.HIGH + MountainCar.LOW) / 2.0
+
+
+def encode_mountain_car(state):
+    return ((state - MOUNTAIN_CAR_CENTER) * MOUNTAIN_CAR_SCALE).reshape(1, -1)
+
+
+def cases():
+    """ Yields the benchmark cases as dictionaries with the entries task, learner, policy,
+    vectorized, threshold and build, where build is a function returning a tuple
+    (learner, agent, task, policy) of new objects.
+    """
+    for task_name, (make_task, length, threshold) in TABULAR_TASKS.items():
+        for learner_name, (make_learner, vectorized) in TABULAR_LEARNERS.items():
+            for policy_name, make_policy in POLICIES.items():
+                def build(make_task=make_task, make_learner=make_learner,
+                          make_policy=make_policy, length=length):
+                    task = make_task()
+                    agent = DenseTabular(task.valid_actions(), 0.1, task.states())
+                    return make_learner(length), agent, task, make_policy()
+                yield {'task': task_name, 'learner': learner_name, 'policy': policy_name,
+                       'vectorized': vectorized, 'threshold': threshold, 'build': build}
+    for agent_name, make_agent in NEURAL_AGENTS.items():
+        def build(make_agent=make_agent):
+            learner = DeepQLearning(DISCOUNT, 1000, encode_mountain_car,
+                                    ReplayMemory(100000, 32))
+            return learner, make_agent(), MountainCar(), EpsilonGreedy(0.1)
+        yield {'task': 'mountain_car', 'learner': 'DeepQLearning/' + agent_name,
+               'policy': 'EpsilonGreedy', 'vectorized': False, 'threshold': -300.0,
+               'build': build}
+
+
+def seed_all(policy, seed):
+    random.seed(seed)
+    np.random.seed(seed)
+    policy.seed(seed)
+
+
+def run_case(case, episodes, seed):
+    """ Runs one benchmark case and returns a dictionary of its results.
+
+    The case is trained twice from the same seed: once without instrumentation, to
+    measure the wall-clock time, and once with instrumentation and memory tracing, to
+    count updates and measure the peak memory allocated during training. Updates are
+    counted both as state-action pairs (the sizes of the batches) and as calls to the
+    update and train methods of the agent.
+    """
+
+    # timed run
+    learner, Q, task, policy = case['build']()
+    seed_all(policy, seed)
+    start = time.perf_counter()
+    steps, rewards = learner.train(Q, task, policy, episodes)
+    seconds = time.perf_counter() - start
+
+    # the scalar learners report the index of the last step of each episode
+    if not case['vectorized']:
+        steps = steps + 1
+    cumulative_steps = np.cumsum(steps)
+    env_steps = int(cumulative_steps[-1])
+
+    # instrumented run
+    learner, Q, task, policy = case['build']()
+    seed_all(policy, seed)
+    instrumentation = Instrumentation()
+    tracemalloc.start()
+    learner.train(Q, task, policy, episodes, instrumentation=instrumentation)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    summary = instrumentation.summary()
+    updates = summary['updates']
+    update_calls = summary['update_calls'] + summary['train_calls']
+
+    # find the first episode at which the moving average of returns reaches the threshold
+    result = {key: case[key] for key in ('task', 'learner', 'policy', 'threshold')}
+    result.update({
+        'episodes': episodes,
+        'env_steps': env_steps,
+        'seconds': seconds,
+        'steps_per_sec': env_steps / seconds,
+        'updates': updates,
+        'updates_per_sec': updates / seconds,
+        'update_calls': update_calls,
+        'update_calls_per_sec': update_calls / seconds,
+        'peak_memory_bytes': peak_bytes,
+        'final_average_return': float(np.mean(rewards[-WINDOW:])),
+        'episodes_to_threshold': None,
+        'steps_to_threshold': None,
+        'seconds_to_threshold': None
+    })
+    if case['threshold'] is not None and episodes >= WINDOW:
+        averages = np.convolve(rewards, np.ones(WINDOW) / WINDOW, mode='valid')
+        reached = np.flatnonzero(averages >= case['threshold'])
+        if reached.size > 0:
+            episode = int(reached[0]) + WINDOW - 1
+            steps_to = int(cumulative_steps[episode])
+            result['episodes_to_threshold'] = episode + 1
+            result['steps_to_threshold'] = steps_to
+            result['seconds_to_threshold'] = seconds * steps_to / env_steps
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measures the throughput of every learner and policy on reference tasks.')
+    parser.add_argument('--episodes', type=int, default=200,
+                        help='the number of episodes of training per case (default 200)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='the random seed (default 0)')
+    parser.add_argument('--only', default='',
+                        help='only run cases whose task, learner or policy contains this text')
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help='the path of the JSON file of results')
+    args = parser.parse_args()
+
+    results = []
+    for case in cases():
+        name = '{}/{}/{}'.format(case['task'], case['learner'], case['policy'])
+        if args.only not in name:
+            continue
+        result = run_case(case, args.episodes, args.seed)
+        results.append(result)
+        print('{:50s} {:10.0f} steps/s {:10.0f} updates/s {:10.0f} calls/s {:8.1f} MB'
+              .format(name, result['steps_per_sec'], result['updates_per_sec'],
+                      result['update_calls_per_sec'], result['peak_memory_bytes'] / 1e6))
+        sys.stdout.flush()
+
+    report = {
+        'created': datetime.datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'episodes': args.episodes,
+        'seed': args.seed,
+        'results': results
+    }
+    with open(args.output, 'w') as output:
+        json.dump(report, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from domains.Task import Task
+from domains.VectorTask import VectorTask
+
+
+class Chain(Task, VectorTask):
+    """ The n-chain task, a standard test of exploration. The agent starts at the 
+    first of n states in a chain. Action 0 moves one state forward with no reward, except 
+    in the last state, where the agent stays and receives a large reward. Action 1 returns 
+    to the first state with a small reward. With some probability, the effect of the 
+    other action is applied instead. The task has no terminal states.
+    
+    States are integers in [0, n). The task implements both the Task and VectorTask 
+    interfaces.
+    
+    inputs:
+        n - the number of states (defaults to 5)
+        slip - the probability of applying the other action (defaults to 0.2)
+        small - the reward for returning to the first state (defaults to 2.0)
+        large - the reward for staying in the last state (defaults to 10.0)
+        
+    References
+    ========
+        - Strens, Malcolm. "A Bayesian framework for reinforcement learning." 
+        ICML. Vol. 2000. 2000.
+    """
+    
+    def __init__(self, n=5, slip=0.2, small=2.0, large=10.0):
+        self.n = n
+        self.slip = slip
+        self.small = small
+        self.large = large
+        
+    def states(self):
+        """ Returns the number of states of the task.
+        """
+        return self.n
+    
+    def initial_state(self):
+        return 0
+    
+    def initial_states(self, count):
+        return np.zeros(count, dtype=int)
+    
+    def valid_actions(self):
+        return 2
+    
+    def transition(self, state, action):
+        if np.random.rand() < self.slip:
+            action = 1 - action
+        if action == 1:
+            return 0, self.small, False
+        elif state == self.n - 1:
+            return state, self.large, False
+        else:
+            return state + 1, 0.0, False
+    
+    def transition_batch(self, states, actions):
+        count = len(states)
+        actions = np.where(np.random.rand(count) < self.slip, 1 - actions, actions)
+        back = actions == 1
+        last = states == self.n - 1
+        new_states = np.where(back, 0, np.minimum(states + 1, self.n - 1))
+        rewards = np.where(back, self.small, np.where(last, self.large, 0.0))
+        return new_states, rewards, np.zeros(count, dtype=bool)
@@ -0,0 +1,69 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from domains.Task import Task
+from domains.VectorTask import VectorTask
+
+
+class GridWorld(Task, VectorTask):
+    """ A rectangular grid world, in which the agent moves up, right, down or left from
+    the top-left corner until it reaches the bottom-right corner. Every step costs a
+    reward of -1. With some probability, the agent slips and moves in a random direction.
+    
+    States are integers r * columns + c for the cell in row r and column c, so this task 
+    can be learned by a DenseTabular agent indexing states directly. The task implements 
+    both the Task and VectorTask interfaces.
+    
+    inputs:
+        rows - the number of rows of the grid
+        columns - the number of columns of the grid
+        slip - the probability of moving in a random direction (defaults to 0.0)
+    """
+    
+    # the changes in row and column for each action
+    MOVES = np.array([[-1, 0], [0, 1], [1, 0], [0, -1]])
+    
+    def __init__(self, rows, columns, slip=0.0):
+        self.rows = rows
+        self.columns = columns
+        self.slip = slip
+        self.goal = rows * columns - 1
+        
+    def states(self):
+        """ Returns the number of states of the task.
+        """
+        return self.rows * self.columns
+    
+    def initial_state(self):
+        return 0
+    
+    def initial_states(self, count):
+        return np.zeros(count, dtype=int)
+    
+    def valid_actions(self):
+        return 4
+    
+    def transition(self, state, action):
+        if self.slip > 0.0 and np.random.rand() < self.slip:
+            action = np.random.randint(4)
+        row, column = divmod(state, self.columns)
+        d_row, d_column = GridWorld.MOVES[action]
+        row = min(max(row + d_row, 0), self.rows - 1)
+        column = min(max(column + d_column, 0), self.columns - 1)
+        new_state = int(row * self.columns + column)
+        return new_state, -1.0, new_state == self.goal
+    
+    def transition_batch(self, states, actions):
+        count = len(states)
+        if self.slip > 0.0:
+            slip = np.random.rand(count) < self.slip
+            actions = np.where(slip, np.random.randint(4, size=count), actions)
+        rows, columns = np.divmod(states, self.columns)
+        moves = GridWorld.MOVES[actions]
+        rows = np.clip(rows + moves[:, 0], 0, self.rows - 1)
+        columns = np.clip(columns + moves[:, 1], 0, self.columns - 1)
+        new_states = rows * self.columns + columns
+        return new_states, np.full(count, -1.0), new_states == self.goal
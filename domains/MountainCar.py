@@ -0,0 +1,56 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from domains.Task import Task
+from domains.VectorTask import VectorTask
+
+
+class MountainCar(Task, VectorTask):
+    """ The mountain car task, a small task with continuous states. An underpowered car 
+    in a valley must drive back and forth to build up enough momentum to reach the goal 
+    at the top of the hill on the right. Actions push left, do nothing or push right.
+    Every step costs a reward of -1.
+    
+    States are numpy arrays (position, velocity). The task implements both the Task and 
+    VectorTask interfaces; in the latter, states are stored as rows of a two-dimensional 
+    array.
+    
+    References
+    ========
+        - Sutton, Richard S., and Andrew G. Barto. 
+        Reinforcement learning: An introduction. MIT press, 2018.
+    """
+    
+    # the bounds of the position and velocity
+    LOW = np.array([-1.2, -0.07])
+    HIGH = np.array([0.6, 0.07])
+    
+    # the position of the goal
+    GOAL = 0.5
+    
+    def initial_state(self):
+        return np.array([np.random.uniform(-0.6, -0.4), 0.0])
+    
+    def initial_states(self, count):
+        states = np.zeros((count, 2))
+        states[:, 0] = np.random.uniform(-0.6, -0.4, size=count)
+        return states
+    
+    def valid_actions(self):
+        return 3
+    
+    def transition(self, state, action):
+        new_states, rewards, dones = self.transition_batch(state[None, :], np.array([action]))
+        return new_states[0], float(rewards[0]), bool(dones[0])
+    
+    def transition_batch(self, states, actions):
+        position, velocity = states[:, 0], states[:, 1]
+        velocity = velocity + 0.001 * (actions - 1) - 0.0025 * np.cos(3.0 * position)
+        velocity = np.clip(velocity, MountainCar.LOW[1], MountainCar.HIGH[1])
+        position = np.clip(position + velocity, MountainCar.LOW[0], MountainCar.HIGH[0])
+        velocity = np.where(position <= MountainCar.LOW[0], np.maximum(velocity, 0.0), velocity)
+        new_states = np.stack((position, velocity), axis=1)
+        return new_states, np.full(len(states), -1.0), position >= MountainCar.GOAL
@@ -0,0 +1,74 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from domains.Task import Task
+from domains.VectorTask import VectorTask
+
+
+class RandomMDP(Task, VectorTask):
+    """ A randomly generated finite MDP of configurable size, useful to measure how
+    learners scale with the number of states and actions.
+    
+    Each state-action pair leads to one of a fixed number of randomly chosen successor 
+    states, with transition probabilities drawn from a uniform Dirichlet distribution, 
+    and has a mean reward drawn from a standard normal distribution. Rewards are observed 
+    with additional Gaussian noise. Each transition terminates the episode with a fixed 
+    probability. 
+    
+    States are integers in [0, states). The task implements both the Task and VectorTask 
+    interfaces.
+    
+    inputs:
+        states - the number of states
+        actions - the number of actions
+        branching - the number of successor states of each state-action pair 
+        (defaults to 3)
+        termination - the probability that each transition ends the episode 
+        (defaults to 0.01)
+        noise - the standard deviation of the noise added to rewards (defaults to 0.1)
+        seed - the seed used to generate the MDP (defaults to None)
+    """
+    
+    def __init__(self, states, actions, branching=3, termination=0.01, noise=0.1, 
+                 seed=None):
+        self.n_states = states
+        self.n_actions = actions
+        self.termination = termination
+        self.noise = noise
+        random = np.random.RandomState(seed)
+        self.successors = random.randint(states, size=(states, actions, branching))
+        probabilities = random.dirichlet(np.ones(branching), size=(states, actions))
+        self.cdf = np.cumsum(probabilities, axis=2)
+        self.cdf[:, :, -1] = 1.0
+        self.rewards = random.randn(states, actions)
+        
+    def states(self):
+        """ Returns the number of states of the task.
+        """
+        return self.n_states
+    
+    def initial_state(self):
+        return int(np.random.randint(self.n_states))
+    
+    def initial_states(self, count):
+        return np.random.randint(self.n_states, size=count)
+    
+    def valid_actions(self):
+        return self.n_actions
+    
+    def transition(self, state, action):
+        branch = np.searchsorted(self.cdf[state, action], np.random.rand(), side='right')
+        new_state = int(self.successors[state, action, branch])
+        reward = float(self.rewards[state, action] + self.noise * np.random.randn())
+        return new_state, reward, bool(np.random.rand() < self.termination)
+    
+    def transition_batch(self, states, actions):
+        count = len(states)
+        u = np.random.rand(count, 1)
+        branches = np.sum(self.cdf[states, actions] <= u, axis=1)
+        new_states = self.successors[states, actions, branches]
+        rewards = self.rewards[states, actions] + self.noise * np.random.randn(count)
+        return new_states, rewards, np.random.rand(count) < self.termination
@@ -0,0 +1,41 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from domains.Task import Task
+from domains.VectorTask import VectorTask
+
+
+class SequentialVectorTask(VectorTask):
+    """ Adapts a Task to the VectorTask interface by stepping each copy of the 
+    environment in turn. States are stored in numpy object arrays.
+    
+    This does not make the environment itself any faster, but allows tasks that do not 
+    provide a vectorized implementation to be used with the batched learners.
+    
+    inputs:
+        task - the Task to adapt
+    """
+
+    def __init__(self, task : Task):
+        self.task = task
+    
+    def initial_states(self, count):
+        states = np.empty(count, dtype=object)
+        for i in range(count):
+            states[i] = self.task.initial_state()
+        return states
+    
+    def valid_actions(self):
+        return self.task.valid_actions()
+    
+    def transition_batch(self, states, actions):
+        count = len(states)
+        new_states = np.empty(count, dtype=object)
+        rewards = np.empty(count, dtype=float)
+        dones = np.empty(count, dtype=bool)
+        for i in range(count):
+            new_states[i], rewards[i], dones[i] = self.task.transition(states[i], actions[i])
+        return new_states, rewards, dones
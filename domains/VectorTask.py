@@ -0,0 +1,72 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class VectorTask(ABC):
+    """ An abstract class that represents many independent copies of a Markov decision
+    process (MDP) environment that are stepped together.
+    
+    States, actions, rewards and terminal flags are passed as numpy arrays whose first
+    dimension indexes the copies of the environment. States may be stored in an array of
+    any data type, including object arrays for general hashable states.
+    """
+
+    @abstractmethod
+    def initial_states(self, count):
+        """ Returns initial states for the specified number of copies of the environment.
+        May be either deterministic or randomly generated.
+        
+        inputs:
+            count - the number of initial states to generate
+        outputs:
+            a numpy array of initial states whose first dimension has length count
+        """
+        pass
+
+    @abstractmethod
+    def valid_actions(self):
+        """ Returns an integer representing the total number of valid actions
+        available to an agent when interacting with this environment.
+        
+        outputs:
+            an integer counting the total number of valid actions
+        """
+        pass
+
+    @abstractmethod
+    def transition_batch(self, states, actions):
+        """ Performs a transition in each copy of the environment to a new state from 
+        the specified current states when the specified actions are taken.
+        
+        inputs:
+            states - a numpy array of the current states of the environments
+            actions - a one-dimensional numpy array of integer actions taken
+        outputs:
+            a triple (new_states, rewards, dones), where:
+                new_states - a numpy array of the next states 
+                rewards - a one-dimensional numpy array of rewards obtained upon transition
+                dones - a one-dimensional boolean numpy array whether or not each of 
+                new_states is terminal
+        """
+        pass
+    
+    def reset_done(self, states, done):
+        """ Replaces the states of all finished copies of the environment with 
+        new initial states. The array of states is modified in place.
+        
+        inputs:
+            states - a numpy array of states of the environments
+            done - a one-dimensional boolean numpy array whether or not each copy of 
+            the environment must be reset
+        outputs:
+            the array of states, where the states of finished copies are replaced
+        """
+        count = np.count_nonzero(done)
+        if count > 0:
+            states[done] = self.initial_states(count)
+        return states
@@ -18,9 +18,13 @@ class DeepQLearning(TDLearning):
     In other words, if the agent is an instance of DeepQ, this will perform DQN learning, 
     and if the agent is an instance of DoubleDeepQ, will perform double DQN learning. 
     
+    If the memory is an instance of PrioritizedReplayMemory, this will perform prioritized
+    experience replay: the Bellman errors computed during training are fed back to the 
+    memory as new priorities, and the network is trained using importance sampling weights.
+    
     In future implementations, it is hoped that this class definition will be 
-    further generalized to handle prioritized experience replay (among other variations), 
-    as well as other kinds of agents, such as A3C, policy gradients, and others.
+    further generalized to handle other kinds of agents, such as A3C, policy gradients, 
+    and others.
     
     inputs:
         discount - the discount factor in [0, 1]
@@ -42,8 +46,10 @@ class DeepQLearning(TDLearning):
         
     def run_episode(self, Q : Neural, task : Task, policy : Policy):
         
-        # to compute backup
-        rewards = np.zeros(self.episode_length, dtype=float)
+        # to record the episode
+        trajectory = self.trajectory
+        trajectory.clear()
+        record = trajectory.steps.append
         
         # initialize state
         state = task.initial_state()
@@ -58,7 +64,7 @@ class DeepQLearning(TDLearning):
             # take action and observe reward and new state
             new_state, reward, done = task.transition(state, action) 
             phi_new_state = self.phi(new_state)
-            rewards[t] = reward  
+            record((state, action, reward, done))
                
             # store the transition in memory
             self.memory.remember(phi_state, action, reward, phi_new_state, done)
@@ -67,7 +73,8 @@ class DeepQLearning(TDLearning):
             # compute the targets y_j and train the network
             mini_batch = self.memory.sample_batch()
             if mini_batch is not None:            
-                Q.train(mini_batch, self.gamma)
+                errors = Q.train(mini_batch, self.gamma, self.memory.importance_weights())
+                self.memory.update_priorities(errors)
             
             # update state
             state, phi_state = new_state, phi_new_state
@@ -76,5 +83,5 @@ class DeepQLearning(TDLearning):
             if done:
                 break
 
-        return t, rewards[0:t]
+        return t, trajectory.rewards[0:t]
     
\ No newline at end of file
@@ -0,0 +1,196 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import heapq
+import itertools
+import numpy as np
+from learning.TDLearning import TDLearning
+from learning.TransitionModel import TransitionModel, DenseTransitionModel
+from domains.Task import Task
+from policies.Policy import Policy
+from agents.Tabular import Tabular
+from agents.DenseTabular import DenseTabular
+
+
+class DynaQ(TDLearning):
+    """ Represents the Dyna-Q algorithm, which learns a model of the task from real
+    transitions and uses it to perform additional simulated Q-learning backups.
+
+    After each real transition, the agent is updated by Q-learning and the transition
+    is stored in the model. Then, a number of planning backups are performed on
+    transitions predicted by the model:
+        - by default, state-action pairs are drawn uniformly from the model; if the agent
+        is a DenseTabular, the planning backups of a step are applied together as
+        vectorized updates of distinct pairs
+        - with prioritized sweeping, state-action pairs are backed up in order of the
+        magnitude of their Bellman errors, which are kept in a heap; after each backup,
+        the predecessors of the state that was backed up are queued if their errors
+        exceed a threshold
+
+    The model stores the most recent outcome of each state-action pair, so it is exact
+    for deterministic tasks. If the agent is a DenseTabular, the model is stored in
+    arrays indexed by the rows of the agent's table; otherwise, states must be hashable.
+
+    inputs:
+        discount - the discount factor in [0, 1]
+        episode_length - for episodic learning, the length of each episode
+        planning_steps - the number of planning backups per real transition
+        (defaults to 10)
+        sweeping - whether to use prioritized sweeping (defaults to False)
+        threshold - with prioritized sweeping, the minimum magnitude of the Bellman
+        error of a state-action pair for it to be queued (defaults to 1e-4)
+
+    References
+    ========
+        - Sutton, Richard S. "Integrated architectures for learning, planning, and
+        reacting based on approximating dynamic programming." Machine Learning
+        Proceedings 1990. Morgan Kaufmann, 1990. 216-224.
+        - Moore, Andrew W., and Christopher G. Atkeson. "Prioritized sweeping:
+        Reinforcement learning with less data and less time." Machine learning 13.1
+        (1993): 103-130.
+    """
+
+    def __init__(self, discount, episode_length, planning_steps=10, sweeping=False,
+                 threshold=1e-4):
+        super().__init__(discount, episode_length)
+        self.planning_steps = planning_steps
+        self.sweeping = sweeping
+        self.threshold = threshold
+        self.clear()
+
+    def clear(self):
+        self.model = None
+        self.queue = []
+        self.queued = {}
+        self.counter = itertools.count()
+
+    def run_episode(self, Q : Tabular, task : Task, policy : Policy):
+
+        # create the model on the first episode
+        dense = isinstance(Q, DenseTabular)
+        if self.model is None:
+            if dense:
+                self.model = DenseTransitionModel(Q.valid_actions)
+            else:
+                self.model = TransitionModel()
+
+        # to record the episode
+        trajectory = self.trajectory
+        trajectory.clear()
+        record = trajectory.steps.append
+
+        # initialize state
+        state = task.initial_state()
+
+        # repeat for each step of episode
+        for t in range(self.episode_length):
+
+            # choose action from state using policy derived from Q
+            action = policy.act(Q, task, state)
+
+            # take action and observe reward and new state
+            new_state, reward, done = task.transition(state, action)
+            record((state, action, reward, done))
+
+            # update Q
+            target = reward if done else reward + self.gamma * Q.max_value(new_state)
+            delta = target - Q.values(state)[action]
+            Q.update(state, action, delta)
+
+            # update the model
+            if dense:
+                key, new_key = Q.row(state), Q.row(new_state)
+            else:
+                key, new_key = state, new_state
+            self.model.store(key, action, reward, new_key, done)
+
+            # plan using the model
+            if self.sweeping:
+                self.queue_pair(Q, dense, key, action)
+                self.sweep(Q, dense)
+            elif dense:
+                self.plan_dense(Q)
+            else:
+                self.plan(Q)
+
+            # update state
+            state = new_state
+
+            # until state is terminal
+            if done:
+                break
+
+        return t, trajectory.rewards[0:t]
+
+    def plan(self, Q : Tabular):
+        """ Performs planning backups on state-action pairs drawn uniformly from the
+        model, one at a time.
+        """
+        for state, action in self.model.sample(self.planning_steps):
+            reward, new_state, done = self.model.outcome(state, action)
+            target = reward if done else reward + self.gamma * Q.max_value(new_state)
+            Q.update(state, action, target - Q.values(state)[action])
+
+    def plan_dense(self, Q : DenseTabular):
+        """ Performs planning backups on state-action pairs drawn uniformly from the
+        model, as vectorized updates of the table. Each update backs up distinct pairs,
+        so when the model holds fewer pairs than the number of planning backups, the 
+        backups are split into several updates.
+        """
+        model = self.model
+        remaining = self.planning_steps
+        while remaining > 0:
+            count = min(remaining, len(model))
+            rows, actions = model.sample_batch(count, replace=False)
+            next_values = np.amax(Q.Q[model.next_rows[rows, actions]], axis=1)
+            targets = model.rewards[rows, actions] + self.gamma * np.where(
+                model.dones[rows, actions], 0.0, next_values)
+            Q.update_rows(rows, actions, targets - Q.Q[rows, actions])
+            remaining -= count
+
+    def error(self, Q : Tabular, dense, key, action):
+        """ Returns the Bellman error of the specified state-action pair predicted by the
+        model, where key is the state or, if dense, its row index in the table.
+        """
+        reward, new_key, done = self.model.outcome(key, action)
+        if dense:
+            current, next_value = Q.Q[key, action], np.amax(Q.Q[new_key])
+        else:
+            current, next_value = Q.values(key)[action], Q.max_value(new_key)
+        target = reward if done else reward + self.gamma * next_value
+        return target - current
+
+    def queue_pair(self, Q : Tabular, dense, key, action):
+        """ Queues the specified state-action pair for a planning backup if the magnitude
+        of its Bellman error exceeds the threshold and the priority with which it is
+        already queued, if any.
+        """
+        priority = abs(self.error(Q, dense, key, action))
+        if priority > self.threshold and priority > self.queued.get((key, action), 0.0):
+            self.queued[(key, action)] = priority
+            heapq.heappush(self.queue, (-priority, next(self.counter), key, action))
+
+    def sweep(self, Q : Tabular, dense):
+        """ Performs planning backups on the state-action pairs with the largest Bellman
+        errors, and queues the predecessors of each state that is backed up.
+        """
+        steps = 0
+        while steps < self.planning_steps and self.queue:
+            
+            # skip entries superseded by the same pair queued with a higher priority
+            priority, _, key, action = heapq.heappop(self.queue)
+            if self.queued.get((key, action)) != -priority:
+                continue
+            del self.queued[(key, action)]
+            steps += 1
+            
+            # back up the pair with the largest error
+            delta = self.error(Q, dense, key, action)
+            if dense:
+                Q.update_row(key, action, delta)
+            else:
+                Q.update(key, action, delta)
+            for previous_key, previous_action in self.model.predecessors(key):
+                self.queue_pair(Q, dense, previous_key, previous_action)
@@ -0,0 +1,152 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from agents.Tabular import Tabular
+from agents.DenseTabular import DenseTabular
+from agents.Linear import Linear
+
+
+class EligibilityTraces:
+    """ A sparse set of eligibility traces e(s, a) over state-action pairs.
+    
+    Only traces that are currently active are stored. Traces are dropped as soon as 
+    they decay below a threshold, and optionally the number of active traces can be 
+    capped, in which case the smallest trace is dropped whenever the cap is exceeded.
+    The cost of each update is therefore bounded independently of the episode length.
+    
+    Traces are stored in slots of flat numpy arrays. If the agent is a DenseTabular, 
+    slots store row indices of states in the table, and each update is applied to the 
+    active slots with one call to update_rows, whose changes accumulate as described in
+    Tabular.update_batch; otherwise, the agent is updated one active trace at a time. 
+    If the agent is a Linear function approximator, traces are kept over its features 
+    rather than over states, and each visit of a state increments the traces of all of
+    its active features.
+    
+    inputs:
+        threshold - traces that decay below this value are dropped (defaults to 1e-4)
+        replacing - whether to use replacing traces, which are reset to one on each 
+        visit, rather than accumulating traces, which are incremented by one on each 
+        visit (defaults to False)
+        max_traces - the maximum number of active traces (defaults to None, meaning
+        the number of active traces is not capped)
+    """
+    
+    def __init__(self, threshold=1e-4, replacing=False, max_traces=None):
+        self.threshold = threshold
+        self.replacing = replacing
+        self.max_traces = max_traces
+        self.dense = False
+        self.linear = False
+        self.allocate(16)
+        
+    def allocate(self, capacity):
+        """ Removes all traces and allocates slots for the specified number of traces.
+        """
+        self.slots = {}
+        self.free = []
+        self.count = 0
+        self.keys = np.empty(capacity, dtype=np.intp if self.dense else object)
+        self.actions = np.zeros(capacity, dtype=np.intp)
+        self.values = np.zeros(capacity, dtype=float)
+        self.active = np.zeros(capacity, dtype=bool)
+        
+    def clear(self, Q : Tabular):
+        """ Removes all traces, and prepares to update the specified agent.
+        
+        inputs:
+            Q - a Tabular object storing the Q-values
+        """
+        self.linear = isinstance(Q, Linear)
+        dense = self.linear or isinstance(Q, DenseTabular)
+        if dense != self.dense or self.count > 0:
+            self.dense = dense
+            self.allocate(len(self.values))
+        
+    def __len__(self):
+        return len(self.slots)
+    
+    def visit(self, Q : Tabular, state, action):
+        """ Increments (or for replacing traces, resets) the trace of the specified 
+        state-action pair.
+        
+        inputs:
+            Q - a Tabular object storing the Q-values
+            state - the state visited
+            action - the action taken
+        """
+        if self.linear:
+            for key in Q.features(state).tolist():
+                self.visit_key(key, action)
+        else:
+            self.visit_key(Q.row(state) if self.dense else state, action)
+    
+    def visit_key(self, key, action):
+        """ Increments (or for replacing traces, resets) the trace of the specified 
+        key (a state, row index or feature index) and action.
+        """
+        slot = self.slots.get((key, action))
+        if slot is None:
+            slot = self.slots[(key, action)] = self.allocate_slot()
+            self.keys[slot], self.actions[slot] = key, action
+            self.values[slot] = 1.0
+            self.active[slot] = True
+            if self.max_traces is not None and len(self.slots) > self.max_traces:
+                smallest = np.where(self.active, self.values, np.inf)
+                self.drop(np.argmin(smallest[:self.count]))
+        elif self.replacing:
+            self.values[slot] = 1.0
+        else:
+            self.values[slot] += 1.0
+            
+    def allocate_slot(self):
+        """ Returns a free slot, growing the arrays of slots if necessary.
+        """
+        if self.free:
+            return self.free.pop()
+        if self.count == len(self.values):
+            extra = len(self.values)
+            self.keys = np.concatenate((self.keys, np.empty(extra, dtype=self.keys.dtype)))
+            self.actions = np.concatenate((self.actions, np.zeros(extra, dtype=np.intp)))
+            self.values = np.concatenate((self.values, np.zeros(extra, dtype=float)))
+            self.active = np.concatenate((self.active, np.zeros(extra, dtype=bool)))
+        self.count += 1
+        return self.count - 1
+    
+    def drop(self, slot):
+        """ Removes the trace stored in the specified slot.
+        """
+        del self.slots[(self.keys[slot], self.actions[slot])]
+        self.values[slot] = 0.0
+        self.active[slot] = False
+        self.free.append(slot)
+    
+    def update(self, Q : Tabular, delta, decay):
+        """ Updates the Q-values of all state-action pairs with active traces using the
+        specified Bellman error, and then decays all traces.
+        
+        The formula is Q[s, a] += learning_rate * e(s, a) * delta, followed by 
+        e(s, a) *= decay, for each active trace.
+        
+        inputs:
+            Q - a Tabular object storing the Q-values
+            delta - the Bellman error
+            decay - the factor by which to decay the traces
+        """
+        n = self.count
+        values = self.values[:n]
+        
+        # update Q
+        if self.dense:
+            idx = np.flatnonzero(self.active[:n])
+            Q.update_rows(self.keys[idx], self.actions[idx], values[idx] * delta)
+        else:
+            for (state, action), slot in self.slots.items():
+                Q.update(state, action, values[slot] * delta)
+        
+        # decay the traces and drop the ones that are no longer significant
+        values *= decay
+        for slot in np.flatnonzero(self.active[:n] & (values < self.threshold)):
+            self.drop(slot)
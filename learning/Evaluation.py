@@ -0,0 +1,273 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import multiprocessing
+import random
+import numpy as np
+from domains.Task import Task
+from domains.VectorTask import VectorTask
+from agents.Agent import Agent
+from policies.Policy import Policy
+from learning.TDLearning import TDLearning
+from learning.Stopping import StoppingCriterion
+
+
+class Evaluation:
+    """ Evaluates an agent by running rollouts on a task without updating the agent.
+
+    By default, actions are greedy with respect to the Q-values, which are read with the
+    peek methods of the agent, so states that were never visited are not added to the
+    agent. Rollouts may instead follow a fixed policy, in which case the policy is copied
+    before the rollouts and sees the agent through a ReadOnlyAgent, so that neither is
+    modified and the agent is never copied. Since the policy sees only the Q-values,
+    policies that keep state per row of a DenseTabular (e.g. Pursuit) start from their
+    initial state for each state.
+
+    If the task is a VectorTask, all rollouts are run together, one per copy of the
+    environment, and actions are selected in batches. Otherwise, rollouts are run one at a
+    time, and can be divided among several forked worker processes.
+
+    If a seed is specified, the random number generators of the random and numpy.random
+    modules and of the policy are seeded before the rollouts. When rollouts run in the
+    current process, the state of the random and numpy.random modules is restored
+    afterwards, so evaluating an agent during training does not change the random
+    numbers drawn by training.
+
+    inputs:
+        discount - the discount factor in [0, 1] used to compute returns
+        episode_length - the maximum length of each rollout
+        rollouts - the number of rollouts per evaluation (defaults to 100)
+        workers - the number of worker processes used to run rollouts of a Task in
+        parallel (defaults to None, meaning rollouts are run in the current process)
+    """
+
+    def __init__(self, discount, episode_length, rollouts=100, workers=None):
+        self.gamma = discount
+        self.episode_length = episode_length
+        self.rollouts = rollouts
+        self.workers = workers
+
+    def run(self, Q : Agent, task, policy : Policy=None, seed=None):
+        """ Runs the rollouts of an evaluation of the specified agent on the specified task.
+
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a Task or VectorTask object representing the task
+            policy - a Policy object used to select actions (defaults to None, meaning
+            actions are greedy with respect to the Q-values)
+            seed - an integer seed for the rollouts (defaults to None, meaning the random
+            number generators are not seeded)
+        outputs:
+            - a one-dimensional numpy array containing the length of each rollout
+            - a one-dimensional numpy array containing the sum of the discounted rewards
+            obtained on each rollout
+        """
+        if policy is not None:
+            Q = ReadOnlyAgent(Q)
+        if self.workers is not None and not isinstance(task, VectorTask):
+            return self.run_pool(Q, task, policy, seed)
+        if policy is not None:
+            policy = copy.deepcopy(policy)
+        states = (random.getstate(), np.random.get_state())
+        try:
+            if seed is not None:
+                Evaluation.seed(policy, seed)
+            if isinstance(task, VectorTask):
+                return self.rollout_batch(Q, task, policy, self.rollouts)
+            return self.rollout_many(Q, task, policy, self.rollouts)
+        finally:
+            if seed is not None:
+                random.setstate(states[0])
+                np.random.set_state(states[1])
+
+    def evaluate(self, Q : Agent, task, policy : Policy=None, seed=None):
+        """ Evaluates the specified agent on the specified task, and returns a summary of
+        the rollouts. The inputs are the same as those of run.
+
+        outputs:
+            a dictionary containing the mean and standard deviation of the returns
+            ('return_mean', 'return_std') and lengths ('length_mean', 'length_std') of
+            the rollouts
+        """
+        steps, rewards = self.run(Q, task, policy, seed)
+        return {'return_mean': float(np.mean(rewards)),
+                'return_std': float(np.std(rewards)),
+                'length_mean': float(np.mean(steps)),
+                'length_std': float(np.std(steps))}
+
+    @staticmethod
+    def seed(policy : Policy, seed):
+        """ Seeds the random number generators of the random and numpy.random modules, and
+        of the specified policy if it is not None.
+        """
+        random.seed(seed)
+        np.random.seed(seed)
+        if policy is not None:
+            policy.seed(seed)
+
+    def rollout(self, Q : Agent, task : Task, policy : Policy):
+        """ Runs a single rollout on the specified task, and returns its length and the
+        sum of its discounted rewards.
+        """
+        state = task.initial_state()
+        total, discount, steps = 0.0, 1.0, 0
+        for t in range(self.episode_length):
+            if policy is None:
+                action = np.argmax(Q.peek(state))
+            else:
+                action = policy.act(Q, task, state)
+            state, reward, done = task.transition(state, action)
+            total += discount * reward
+            discount *= self.gamma
+            steps = t + 1
+            if done:
+                break
+        return steps, total
+
+    def rollout_many(self, Q : Agent, task : Task, policy : Policy, rollouts):
+        """ Runs the specified number of rollouts on the specified task one at a time.
+        """
+        rewards_history = np.zeros(rollouts, dtype=float)
+        steps_history = np.zeros(rollouts, dtype=int)
+        for i in range(rollouts):
+            steps_history[i], rewards_history[i] = self.rollout(Q, task, policy)
+        return steps_history, rewards_history
+
+    def rollout_batch(self, Q : Agent, task : VectorTask, policy : Policy, rollouts):
+        """ Runs the specified number of rollouts together on the specified vectorized
+        task, one per copy of the environment. Copies whose rollouts have finished are
+        no longer stepped.
+        """
+        states = task.initial_states(rollouts)
+        active = np.ones(rollouts, dtype=bool)
+        rewards_history = np.zeros(rollouts, dtype=float)
+        steps_history = np.zeros(rollouts, dtype=int)
+        discount = 1.0
+        for _ in range(self.episode_length):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+            current = states[idx]
+            if policy is None:
+                actions = np.argmax(Q.peek_batch(current), axis=1)
+            else:
+                actions = policy.act_batch(Q, task, current)
+            new_states, rewards, dones = task.transition_batch(current, actions)
+            rewards_history[idx] += discount * rewards
+            steps_history[idx] += 1
+            states[idx] = new_states
+            active[idx[dones]] = False
+            discount *= self.gamma
+        return steps_history, rewards_history
+
+    def run_pool(self, Q : Agent, task : Task, policy : Policy, seed):
+        """ Runs the rollouts on a new process pool, dividing them as evenly as possible
+        among the workers.
+        """
+        share, remainder = divmod(self.rollouts, self.workers)
+        counts = [share + (1 if i < remainder else 0) for i in range(self.workers)]
+        if seed is not None:
+            seeds = TDLearning.trial_seeds(seed, self.workers)
+        else:
+            seeds = [None] * self.workers
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = None
+            TDLearning.check_picklable(self, Q, task, policy)
+        pool = ProcessPoolExecutor(self.workers, mp_context=context,
+                                   initializer=_init_worker,
+                                   initargs=(self, Q, task, policy))
+        with pool:
+            futures = [pool.submit(_run_worker, count, s)
+                       for count, s in zip(counts, seeds) if count > 0]
+            results = [future.result() for future in futures]
+        steps_history = np.concatenate([steps for steps, _ in results])
+        rewards_history = np.concatenate([rewards for _, rewards in results])
+        return steps_history, rewards_history
+
+
+class ReadOnlyAgent(Agent):
+    """ A read-only view of an agent, whose Q-values are read with the peek methods of
+    the agent. It is given to policies during evaluation, so that selecting actions does
+    not modify the agent.
+
+    inputs:
+        agent - the Agent object to view
+    """
+
+    def __init__(self, agent : Agent):
+        self.agent = agent
+
+    def clear(self):
+        pass
+
+    def values(self, state):
+        return self.agent.peek(state)
+
+    def finish_episode(self, episode):
+        pass
+
+    def values_batch(self, states):
+        return self.agent.peek_batch(states)
+
+
+class PeriodicEvaluation(StoppingCriterion):
+    """ Evaluates the agent periodically during training, by passing this object as
+    the stopping criterion of a learner, and records the summary of each evaluation.
+    Training can optionally be stopped once the mean return of an evaluation reaches a
+    target.
+
+    inputs:
+        evaluation - an Evaluation object
+        task - a Task or VectorTask object on which the agent is evaluated
+        every - the number of episodes of training between evaluations (defaults to 100)
+        policy - a Policy object used to select actions during evaluation (defaults to
+        None, meaning actions are greedy)
+        target - the mean return of an evaluation at which training stops (defaults to
+        None, meaning training is never stopped)
+        seed - an integer seed for each evaluation (defaults to None, meaning evaluations
+        are not seeded)
+    """
+
+    def __init__(self, evaluation : Evaluation, task, every=100, policy : Policy=None,
+                 target=None, seed=None):
+        self.evaluation = evaluation
+        self.task = task
+        self.every = every
+        self.policy = policy
+        self.target = target
+        self.seed = seed
+        self.clear()
+
+    def clear(self):
+        self.episodes = []
+        self.history = []
+
+    def stop(self, episode, steps, reward, Q : Agent):
+        if (episode + 1) % self.every != 0:
+            return False
+        summary = self.evaluation.evaluate(Q, self.task, self.policy, self.seed)
+        self.episodes.append(episode + 1)
+        self.history.append(summary)
+        return self.target is not None and summary['return_mean'] >= self.target
+
+
+# the evaluation, agent, task and policy held by each worker process
+_worker_objects = None
+
+
+def _init_worker(evaluation, Q, task, policy):
+    global _worker_objects
+    _worker_objects = (evaluation, Q, task, policy)
+
+
+def _run_worker(rollouts, seed):
+    evaluation, Q, task, policy = _worker_objects
+    if seed is not None:
+        Evaluation.seed(policy, seed)
+    return evaluation.rollout_many(Q, task, policy, rollouts)
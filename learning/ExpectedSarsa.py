@@ -13,7 +13,9 @@ from agents.Tabular import Tabular
 class ExpectedSarsa(TDLearning):
     """ Represents the tabular Expected Sarsa algorithm.
     
-    Can handle any policy that explicitly implements the method 'distribution'.
+    Can handle any policy that explicitly implements the method 'distribution'. Policies
+    that override 'act_and_evaluate' select actions and compute expected values from
+    a single lookup of the Q-values.
     
     inputs:
         discount - the discount factor in [0, 1]
@@ -33,8 +35,10 @@ class ExpectedSarsa(TDLearning):
     
     def run_episode(self, Q : Tabular, task : Task, policy : Policy):
         
-        # to compute backup
-        rewards = np.zeros(self.episode_length, dtype=float)
+        # to record the episode
+        trajectory = self.trajectory
+        trajectory.clear()
+        record = trajectory.steps.append
         
         # initialize state
         state = task.initial_state()
@@ -47,13 +51,13 @@ class ExpectedSarsa(TDLearning):
                 
             # take action and observe reward and new state
             new_state, reward, done = task.transition(state, action) 
-            rewards[t] = reward  
+            record((state, action, reward, done))
                 
-            # choose new action from new state using policy derived from Q
-            new_action = policy.act(Q, task, new_state) 
+            # choose new action from new state using policy derived from Q, and
+            # compute the expected value of new state under the policy
+            new_action, eQ = policy.act_and_evaluate(Q, task, new_state) 
             
             # update Q
-            eQ = np.inner(policy.distribution(Q, task, new_state), Q.values(new_state))
             delta = reward + self.gamma * eQ - Q.values(state)[action]
             Q.update(state, action, delta)
                 
@@ -64,4 +68,4 @@ class ExpectedSarsa(TDLearning):
             if done:
                 break
 
-        return t, rewards[0:t]
+        return t, trajectory.rewards[0:t]
@@ -0,0 +1,110 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import random
+import numpy as np
+from domains.Task import Task
+from agents.SharedTabular import SharedTabular
+from policies.Policy import Policy
+from learning.TDLearning import TDLearning
+from learning.Returns import Returns
+
+
+class HogwildLearning:
+    """ Trains a single agent stored in shared memory with several worker processes,
+    each of which runs episodes of a temporal difference learner concurrently.
+
+    All workers read and update the same SharedTabular table, so the number of
+    environment steps per second scales with the number of workers. Each worker has
+    its own copy of the learner, task and policy, whose random number generators (as
+    well as those of the random and numpy.random modules) are seeded independently.
+    Because updates from different workers interleave nondeterministically, training
+    is not reproducible even when seeded.
+
+    On platforms that support it, worker processes are forked, so that the learner,
+    agent, task and policy do not need to be pickled.
+
+    inputs:
+        learner - a TDLearning object (e.g. QLearning or Sarsa) run by each worker
+        workers - the number of worker processes
+    """
+
+    def __init__(self, learner : TDLearning, workers):
+        self.learner = learner
+        self.workers = workers
+
+    def worker_episodes(self, episodes):
+        """ Returns a list of the number of episodes run by each worker, which divide
+        the specified total number of episodes as evenly as possible.
+        """
+        share, remainder = divmod(episodes, self.workers)
+        return [share + (1 if i < remainder else 0) for i in range(self.workers)]
+
+    def train(self, Q : SharedTabular, task : Task, policy : Policy, episodes, seed=None):
+        """ Trains the specified agent on the specified task using the specified
+        exploration policy, with the specified total number of episodes divided among
+        the workers.
+
+        inputs:
+            Q - a SharedTabular object storing the Q-values
+            task - a Task object representing the task the agent is learning
+            policy - a Policy object representing the exploration policy used to
+            balance exploration and exploitation
+            episodes - the total number of episodes of training to perform
+            seed - an integer seed from which the seed of each worker is derived
+            (defaults to None, meaning workers are seeded from fresh entropy)
+        outputs:
+            - a one-dimensional numpy array containing the lengths of each episode,
+            grouped by worker
+            - a one-dimensional numpy array containing the sum of the discounted
+            rewards from the environment obtained on each episode, grouped by worker
+        """
+        Q.clear()
+        seeds = TDLearning.trial_seeds(seed, self.workers)
+        counts = self.worker_episodes(episodes)
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = None
+        pool = ProcessPoolExecutor(self.workers, mp_context=context,
+                                   initializer=_init_worker,
+                                   initargs=(self.learner, Q, task, policy))
+        with pool:
+            futures = [pool.submit(_run_worker, count, s) for count, s in zip(counts, seeds)]
+            results = [future.result() for future in futures]
+        steps_history = np.concatenate([steps for steps, _ in results])
+        rewards_history = np.concatenate([rewards for _, rewards in results])
+        return steps_history, rewards_history
+
+
+# the learner, agent, task and policy held by each worker process
+_worker_objects = None
+
+
+def _init_worker(learner, Q, task, policy):
+    global _worker_objects
+    _worker_objects = (learner, Q, task, policy)
+
+
+def _run_worker(episodes, seed):
+    learner, Q, task, policy = _worker_objects
+    random.seed(seed)
+    np.random.seed(seed)
+    policy.seed(seed)
+
+    # the shared table is not cleared, since it is shared with the other workers
+    learner.clear()
+    policy.clear()
+    rewards_history = np.zeros(episodes, dtype=float)
+    steps_history = np.zeros(episodes, dtype=int)
+    for e in range(episodes):
+        steps, rewards = learner.run_episode(Q, task, policy)
+        rewards_history[e] = Returns.discounted_sum(rewards, learner.gamma)
+        steps_history[e] = steps
+        policy.finish_episode(e)
+        Q.finish_episode(e)
+    return steps_history, rewards_history
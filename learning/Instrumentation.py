@@ -0,0 +1,257 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import csv
+import time
+from collections import defaultdict
+
+
+class Instrumentation:
+    """ Collects timers and call counters for each phase of training.
+
+    When passed to the train method of a learner, the agent, task, policy and replay
+    memory (if any) are wrapped in probes that time each call of the methods listed
+    in PHASES. Times are exclusive: for instance, the time spent by a policy to look up
+    Q-values is counted in the phase 'values' and not in the phase 'policy'. Learners
+    that are trained without instrumentation do not pay any overhead.
+
+    At the end of each episode, a dictionary of metrics for the episode is appended to
+    history and passed to the callback, if any. The metrics are:
+        episode - the (zero-based) episode counter
+        steps - the number of environment steps in the episode
+        seconds - the wall-clock duration of the episode
+        steps_per_sec - the number of environment steps per second
+        updates - the number of state-action pairs updated in the agent, where each
+        call to an update method counts the size of its batch (including the experiences
+        of neural network training steps)
+        updates_per_sec - the number of state-action pairs updated per second
+        update_calls, train_calls - the number of calls to update the agent and to train
+        neural networks, regardless of the size of their batches
+        <phase>_seconds, <phase>_calls - the time spent and number of calls in each phase
+
+    inputs:
+        callback - a function of one argument, the dictionary of metrics, called at the
+        end of each episode (defaults to None); see CSVLogger
+    """
+
+    # the phases of training, and the methods of each object assigned to each phase
+    PHASES = {
+        'task': {'initial_state': 'task', 'transition': 'task',
+                 'initial_states': 'task', 'transition_batch': 'task', 'reset_done': 'task'},
+        'policy': {'act': 'policy', 'act_batch': 'policy', 'distribution': 'policy',
+                   'distribution_batch': 'policy', 'act_and_evaluate': 'policy',
+                   'expectation_batch': 'policy'},
+        'agent': {'values': 'values', 'values_batch': 'values', 'max_action': 'values',
+                  'max_value': 'values', 'update': 'update', 'update_all': 'update',
+                  'update_batch': 'update', 'update_row': 'update', 'update_rows': 'update',
+                  'train': 'train'},
+        'memory': {'remember': 'replay', 'sample_batch': 'replay',
+                   'update_priorities': 'replay'}
+    }
+
+    # the names of all phases
+    PHASE_NAMES = ('task', 'policy', 'values', 'update', 'replay', 'train')
+
+    # the phases that count as updates of the agent
+    UPDATE_PHASES = ('update', 'train')
+
+    # the number of state-action pairs updated by one call of each update method of an
+    # agent, given its positional arguments
+    PAIRS = {'update': lambda args: 1, 'update_row': lambda args: 1,
+             'update_all': lambda args: len(args[1]),
+             'update_batch': lambda args: len(args[1]),
+             'update_rows': lambda args: len(args[1]),
+             'train': lambda args: len(args[0][1])}
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.clear()
+
+    def clear(self):
+        """ Resets all timers, counters and the history of metrics.
+        """
+        self.times = defaultdict(float)
+        self.counts = defaultdict(int)
+        self.history = []
+        self.children = [0.0]
+        self.episode_start = None
+        self.memory = None
+
+    def wrap(self, target, kind):
+        """ Returns a probe that times calls to the methods of the specified object.
+
+        inputs:
+            target - the object to wrap
+            kind - the kind of object, one of the keys of PHASES
+        outputs:
+            a Probe object that can be used in place of the target
+        """
+        return Probe(target, self, Instrumentation.PHASES[kind])
+
+    def attach(self, learner, Q, task, policy):
+        """ Wraps the specified agent, task and policy, as well as the replay memory of
+        the specified learner (if any) in probes.
+
+        inputs:
+            learner - the learner being trained
+            Q - the agent being trained
+            task - the task the agent is learning
+            policy - the exploration policy
+        outputs:
+            a triple (Q, task, policy) of probes to use in place of the arguments
+        """
+        self.memory = getattr(learner, 'memory', None)
+        if self.memory is not None:
+            learner.memory = self.wrap(self.memory, 'memory')
+        return self.wrap(Q, 'agent'), self.wrap(task, 'task'), self.wrap(policy, 'policy')
+
+    def detach(self, learner):
+        """ Restores the replay memory of the specified learner (if any) that was
+        wrapped by attach.
+
+        inputs:
+            learner - the learner being trained
+        """
+        if self.memory is not None:
+            learner.memory = self.memory
+            self.memory = None
+
+    def timed(self, method, phase, pairs=None):
+        """ Returns a function that calls the specified method and records its
+        exclusive time and number of calls under the specified phase. If pairs is not 
+        None, it is a function of the positional arguments of the method that returns the
+        number of state-action pairs updated by the call, which is added to the count of
+        updates.
+        """
+        times, counts, children = self.times, self.counts, self.children
+        clock = time.perf_counter
+
+        def timed_method(*args, **kwargs):
+            children.append(0.0)
+            start = clock()
+            try:
+                result = method(*args, **kwargs)
+                if pairs is not None:
+                    counts['pairs'] += pairs(args)
+                return result
+            finally:
+                elapsed = clock() - start
+                times[phase] += elapsed - children.pop()
+                counts[phase] += 1
+                children[-1] += elapsed
+        return timed_method
+
+    def begin_episode(self):
+        """ Marks the start of an episode.
+        """
+        self.episode_start = time.perf_counter()
+        self.episode_times = dict(self.times)
+        self.episode_counts = dict(self.counts)
+
+    def end_episode(self, episode, steps):
+        """ Marks the end of an episode, records its metrics and passes them to the
+        callback.
+
+        inputs:
+            episode - the (zero-based) episode counter
+            steps - the number of environment steps in the episode
+        outputs:
+            the dictionary of metrics of the episode
+        """
+        seconds = max(time.perf_counter() - self.episode_start, 1e-12)
+        metrics = {'episode': episode, 'steps': steps, 'seconds': seconds,
+                   'steps_per_sec': steps / seconds}
+        for phase in Instrumentation.PHASE_NAMES:
+            calls = self.counts[phase] - self.episode_counts.get(phase, 0)
+            metrics[phase + '_seconds'] = self.times[phase] - self.episode_times.get(phase, 0.0)
+            metrics[phase + '_calls'] = calls
+        updates = self.counts['pairs'] - self.episode_counts.get('pairs', 0)
+        metrics['updates'] = updates
+        metrics['updates_per_sec'] = updates / seconds
+        self.history.append(metrics)
+        if self.callback is not None:
+            self.callback(metrics)
+        return metrics
+
+    def summary(self):
+        """ Returns a dictionary of the cumulative time and number of calls of each phase,
+        and of the number of state-action pairs updated ('updates'), over all episodes 
+        since the last call to clear.
+        """
+        result = {}
+        for phase in Instrumentation.PHASE_NAMES:
+            result[phase + '_seconds'] = self.times[phase]
+            result[phase + '_calls'] = self.counts[phase]
+        result['updates'] = self.counts['pairs']
+        return result
+
+
+class Probe:
+    """ A proxy that forwards all attribute accesses to a target object, and times calls
+    to selected methods of the target using an Instrumentation.
+
+    The proxy reports the class of its target, so isinstance checks on the proxy behave
+    as they would on the target.
+
+    inputs:
+        target - the object to wrap
+        instrumentation - the Instrumentation that records the calls
+        phases - a dictionary mapping the names of the methods to time to their phases
+    """
+
+    def __init__(self, target, instrumentation, phases):
+        self.__dict__['_target'] = target
+        self.__dict__['_instrumentation'] = instrumentation
+        self.__dict__['_phases'] = phases
+
+    @property
+    def __class__(self):
+        return type(self._target)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        phase = self._phases.get(name)
+        if phase is not None and callable(value):
+            if phase in Instrumentation.UPDATE_PHASES:
+                pairs = Instrumentation.PAIRS.get(name)
+            else:
+                pairs = None
+            value = self._instrumentation.timed(value, phase, pairs)
+            self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+    def __len__(self):
+        return len(self._target)
+
+
+class CSVLogger:
+    """ A callback for Instrumentation that appends the metrics of each episode as a row
+    of a CSV file. The header is written with the first row.
+
+    inputs:
+        path - the path of the CSV file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.writer = None
+
+    def __call__(self, metrics):
+        if self.writer is None:
+            self.file = open(self.path, 'w', newline='')
+            self.writer = csv.DictWriter(self.file, fieldnames=list(metrics.keys()))
+            self.writer.writeheader()
+        self.writer.writerow(metrics)
+        self.file.flush()
+
+    def close(self):
+        """ Closes the CSV file.
+        """
+        if self.writer is not None:
+            self.file.close()
+            self.writer = None
@@ -8,11 +8,17 @@ import numpy as np
 from domains.Task import Task
 from policies.Policy import Policy
 from agents.Tabular import Tabular
+from learning.Returns import Returns
 
 
 class MonteCarlo(TDLearning):
     """ Represents the tabular first-visit offline Monte Carlo algorithm for control.
     
+    The returns of all steps of an episode are computed in one vectorized pass, and the
+    agent is updated with backup, which gives the same result as updating the steps one
+    at a time in reverse order, but updates distinct state-action pairs of a 
+    DenseTabular together.
+    
     inputs:
         discount - the discount factor in [0, 1]
         episode_length - for episodic learning, the length of each episode
@@ -31,29 +37,27 @@ class MonteCarlo(TDLearning):
     
     def run_episode(self, Q : Tabular, task : Task, policy : Policy):
         
-        # to compute backup
-        rewards = np.zeros(self.episode_length, dtype=float)
-        
         # simulate a trajectory
-        t, episode = self.sample_episode(Q, task, policy, rewards)
+        t = self.sample_episode(Q, task, policy)
+        trajectory = self.trajectory
         
-        # repeat for each step of episode
-        G = 0.0
-        for state, action, reward in episode[::-1]:
-               
-            # update cumulative reward
-            G = reward + self.gamma * G
-             
-            # update Q
-            delta = G - Q.values(state)[action]
-            Q.update(state, action, delta)
+        # compute the returns of all steps and update Q
+        if t > 0:
+            states, actions = trajectory.states[0:t], trajectory.actions[0:t]
+            G = Returns.discounted(trajectory.rewards[0:t], self.gamma)
+            TDLearning.backup(Q, states, actions, G)
                 
-        return t, rewards[0:t]
+        return t, trajectory.rewards[0:t]
     
-    def sample_episode(self, Q : Tabular, task : Task, policy : Policy, rewards):
+    def sample_episode(self, Q : Tabular, task : Task, policy : Policy):
+        """ Generates an episode using the specified exploration policy, and records it
+        in the trajectory of the current learner. Returns the index of the last step.
+        """
         
-        # to store the episode
-        episode = [None] * (self.episode_length)
+        # to record the episode
+        trajectory = self.trajectory
+        trajectory.clear()
+        record = trajectory.steps.append
         
         # initialize state
         state = task.initial_state()
@@ -66,8 +70,7 @@ class MonteCarlo(TDLearning):
             
             # take action and observe reward and new state
             new_state, reward, done = task.transition(state, action)
-            rewards[t] = reward
-            episode[t] = (state, action, reward)
+            record((state, action, reward, done))
             
             # update state
             state = new_state
@@ -76,4 +79,4 @@ class MonteCarlo(TDLearning):
             if done:
                 break
         
-        return t, episode[0:t]
+        return t
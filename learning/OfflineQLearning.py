@@ -0,0 +1,104 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+from agents.Agent import Agent
+from agents.Neural import Neural
+from learning.TransitionLog import TransitionLog
+
+
+class OfflineQLearning:
+    """ Represents batch Q-learning from a log of transitions, without interacting with
+    a task.
+
+    Each sweep streams the log from disk in chunks, and splits each chunk into shuffled
+    mini-batches. Memory usage is therefore bounded by the size of a chunk, regardless
+    of the size of the log.
+        - for Neural agents, each mini-batch is passed to the train method of the agent,
+        so this performs fitted Q-iteration with a DeepQ agent, or with a DoubleDeepQ
+        agent whose target network is synchronized as during online training
+        - for other agents (e.g. DenseTabular, Tabular or Linear), the Q-learning targets
+        of each mini-batch are computed with values_batch, and the agent is updated with
+        update_batch with merge=True, which updates repeated state-action pairs within a
+        mini-batch once, by the mean of their errors
+
+    inputs:
+        discount - the discount factor in [0, 1]
+        batch_size - the number of transitions per mini-batch (defaults to 32)
+        chunk_size - the number of transitions read from disk at a time
+        (defaults to 65536)
+        state_encoding - a lambda expression to encode a two-dimensional array of states
+        (one per row) into the inputs of the agent (defaults to None, meaning states are
+        used as they are logged)
+        shuffle - whether to shuffle the transitions within each chunk (defaults to True)
+
+    References
+    ========
+        - Ernst, Damien, Pierre Geurts, and Louis Wehenkel. "Tree-based batch mode
+        reinforcement learning." Journal of Machine Learning Research 6 (2005): 503-556.
+        - Riedmiller, Martin. "Neural fitted Q iteration - first experiences with a data
+        efficient neural reinforcement learning method." European Conference on Machine
+        Learning. Springer, 2005.
+    """
+
+    def __init__(self, discount, batch_size=32, chunk_size=65536, state_encoding=None,
+                 shuffle=True):
+        self.gamma = discount
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.phi = state_encoding
+        self.shuffle = shuffle
+
+    def train(self, Q : Agent, log : TransitionLog, sweeps, clear=True):
+        """ Trains the specified agent on the transitions in the specified log.
+
+        inputs:
+            Q - an Agent object storing the Q-values
+            log - a TransitionLog object containing the transitions to learn from
+            sweeps - the number of passes over the log
+            clear - whether or not to re-initialize the agent before training
+            (defaults to True)
+        outputs:
+            - a one-dimensional numpy array containing the mean absolute Bellman error
+            over all transitions in each sweep, computed before each update - this can be
+            used to check the convergence of the agent
+        """
+        if clear:
+            Q.clear()
+        neural = isinstance(Q, Neural)
+        errors_history = np.zeros(sweeps, dtype=float)
+        for sweep in range(sweeps):
+            total, count = 0.0, 0
+            for chunk in log.chunks(self.chunk_size):
+                states, actions, rewards, next_states, dones = chunk
+                if self.phi is not None:
+                    states, next_states = self.phi(states), self.phi(next_states)
+                order = np.arange(len(actions))
+                if self.shuffle:
+                    np.random.shuffle(order)
+                for start in range(0, len(order), self.batch_size):
+                    batch = order[start:start + self.batch_size]
+                    mini_batch = (states[batch], actions[batch], rewards[batch],
+                                  next_states[batch], dones[batch])
+                    if neural:
+                        errors = Q.train(mini_batch, self.gamma)
+                    else:
+                        errors = self.update(Q, mini_batch)
+                    total += np.sum(np.abs(errors))
+                    count += len(batch)
+            errors_history[sweep] = total / max(count, 1)
+            Q.finish_episode(sweep)
+        return errors_history
+
+    def update(self, Q : Agent, mini_batch):
+        """ Updates the specified agent on a mini-batch of transitions using Q-learning,
+        and returns the Bellman errors of the transitions.
+        """
+        states, actions, rewards, next_states, dones = mini_batch
+        next_values = np.amax(Q.values_batch(next_states), axis=1)
+        targets = rewards + self.gamma * np.where(dones, 0.0, next_values)
+        errors = targets - Q.values_batch(states)[np.arange(len(actions)), actions]
+        Q.update_batch(states, actions, errors, merge=True)
+        return errors
@@ -8,11 +8,18 @@ from agents.Tabular import Tabular
 from domains.Task import Task
 from learning.TDLearning import TDLearning
 from policies.Policy import Policy
+from learning.Returns import Returns
 
 
 class OfflineSarsaLambda(TDLearning):
     """ Represents the tabular offline Sarsa-Lambda algorithm.
     
+    At the end of each episode, the lambda-returns of all steps are computed in one 
+    vectorized pass from the Q-values of the episode before any update, and the agent
+    is updated with backup, which gives the same result as updating the steps one at a
+    time in reverse order, but updates distinct state-action pairs of a DenseTabular 
+    together.
+    
     inputs:
         discount - the discount factor in [0, 1]
         episode_length - for episodic learning, the length of each episode
@@ -33,10 +40,10 @@ class OfflineSarsaLambda(TDLearning):
     
     def run_episode(self, Q : Tabular, task : Task, policy : Policy):
         
-        # to compute backups
-        rewards = np.zeros(self.episode_length, dtype=float)
-        states = [None] * self.episode_length
-        actions = [None] * self.episode_length
+        # to record the episode
+        trajectory = self.trajectory
+        trajectory.clear()
+        record = trajectory.steps.append
         
         # initialize state
         state = task.initial_state()
@@ -46,11 +53,10 @@ class OfflineSarsaLambda(TDLearning):
             
             # choose action from state using policy derived from Q
             action = policy.act(Q, task, state)
-            states[t], actions[t] = state, action
             
             # take action and observe reward and new state
             new_state, reward, done = task.transition(state, action) 
-            rewards[t] = reward  
+            record((state, action, reward, done))
             
             # update state and action
             state = new_state
@@ -59,21 +65,16 @@ class OfflineSarsaLambda(TDLearning):
             if done:
                 break
         
-        # initialize lambda-average of returns
-        lambda_return = reward
-        
-        # repeat for each step of episode in reverse order 
+        # compute the lambda-average of returns of each step, where the last step
+        # is not bootstrapped
         T = t
-        for t in range(T, -1, -1):
-            
-            # compute lambda-average of returns
-            if t < T:
-                lambda_return = rewards[t] + self.gamma * (
-                    (1.0 - self.decay) * Q.values(states[t + 1])[actions[t + 1]] + 
-                    self.decay * lambda_return)
-            
-            # update Q
-            delta = lambda_return - Q.values(states[t])[actions[t]]
-            Q.update(states[t], actions[t], delta)
+        states, actions = trajectory.states, trajectory.actions
+        values = Q.values_batch(states)[np.arange(T + 1), actions]
+        next_values = np.append(values[1:], 0.0)
+        lambda_returns = Returns.lambda_returns(trajectory.rewards, next_values, 
+                                                self.gamma, self.decay)
+        
+        # update Q
+        TDLearning.backup(Q, states, actions, lambda_returns)
             
-        return T, rewards[0:T]
+        return T, trajectory.rewards[0:T]
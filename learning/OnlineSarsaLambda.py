@@ -3,11 +3,11 @@ Created on Oct 22, 2018
 
 @author: michael
 '''
-from collections import defaultdict
 import numpy as np
 from agents.Tabular import Tabular
 from domains.Task import Task
 from learning.TDLearning import TDLearning
+from learning.EligibilityTraces import EligibilityTraces
 from policies.Policy import Policy
 
 
@@ -15,10 +15,19 @@ class OnlineSarsaLambda(TDLearning):
     """ Represents the tabular online Sarsa-Lambda algorithm implemented 
     using eligibility traces.
     
+    Traces are stored sparsely (see EligibilityTraces), so that the cost of each step
+    is bounded by the number of traces that are still significant, rather than growing
+    with the number of states visited during the episode.
+    
     inputs:
         discount - the discount factor in [0, 1]
         episode_length - for episodic learning, the length of each episode
         decay - the lambda parameter in [0, 1] (defaults to 0.9)
+        threshold - traces that decay below this value are dropped (defaults to 1e-4)
+        replacing - whether to use replacing rather than accumulating traces 
+        (defaults to False)
+        max_traces - the maximum number of active traces (defaults to None, meaning
+        the number of active traces is not capped)
         
     References
     ========
@@ -26,21 +35,26 @@ class OnlineSarsaLambda(TDLearning):
         Reinforcement learning: An introduction. MIT press, 2018.
     """
     
-    def __init__(self, discount, episode_length, decay=0.9):
+    def __init__(self, discount, episode_length, decay=0.9, 
+                 threshold=1e-4, replacing=False, max_traces=None):
         super().__init__(discount, episode_length)
         self.decay = decay
+        self.traces = EligibilityTraces(threshold, replacing, max_traces)
         
     def clear(self):
         pass
     
     def run_episode(self, Q : Tabular, task : Task, policy : Policy):
         
-        # to compute backups
-        rewards = np.zeros(self.episode_length, dtype=float)
+        # to record the episode
+        trajectory = self.trajectory
+        trajectory.clear()
+        record = trajectory.steps.append
         
         # initialize the e(s, a) matrix
         # note: there is an error in Sutton and Barto since e is reset each episode
-        e = defaultdict(lambda: np.zeros(task.valid_actions(), dtype=float))
+        e = self.traces
+        e.clear(Q)
         
         # initialize state and action
         state = task.initial_state()
@@ -51,20 +65,17 @@ class OnlineSarsaLambda(TDLearning):
                 
             # take action and observe reward and new state
             new_state, reward, done = task.transition(state, action) 
-            rewards[t] = reward  
+            record((state, action, reward, done))
                    
             # choose action from state using policy derived from Q
             new_action = policy.act(Q, task, new_state) 
              
             # update e
-            e[state][action] += 1.0 
+            e.visit(Q, state, action)
             
             # update trace
             delta = reward + self.gamma * Q.values(new_state)[new_action] - Q.values(state)[action]
-            for s in e.keys():
-                errors = e[s] * delta
-                Q.update_all(s, errors)
-                e[s] *= self.gamma * self.decay
+            e.update(Q, delta, self.gamma * self.decay)
 
             # update state and action
             state, action = new_state, new_action
@@ -73,4 +84,4 @@ class OnlineSarsaLambda(TDLearning):
             if done:
                 break
 
-        return t, rewards[0:t]
+        return t, trajectory.rewards[0:t]
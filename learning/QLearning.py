@@ -31,8 +31,10 @@ class QLearning(TDLearning):
     
     def run_episode(self, Q : Tabular, task : Task, policy : Policy):
         
-        # to compute backup
-        rewards = np.zeros(self.episode_length, dtype=float)
+        # to record the episode
+        trajectory = self.trajectory
+        trajectory.clear()
+        record = trajectory.steps.append
         
         # initialize state
         state = task.initial_state()
@@ -45,7 +47,7 @@ class QLearning(TDLearning):
                 
             # take action and observe reward and new state
             new_state, reward, done = task.transition(state, action) 
-            rewards[t] = reward  
+            record((state, action, reward, done))
                 
             # update Q
             delta = reward + self.gamma * Q.max_value(new_state) - Q.values(state)[action]
@@ -58,4 +60,4 @@ class QLearning(TDLearning):
             if done:
                 break
 
-        return t, rewards[0:t]
+        return t, trajectory.rewards[0:t]
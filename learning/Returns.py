@@ -0,0 +1,87 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import math
+import numpy as np
+
+
+class Returns:
+    """ Vectorized kernels to compute discounted returns and lambda-returns over whole
+    trajectories, without looping over the steps of the trajectory in Python.
+
+    Returns satisfy the linear recurrence G[t] = x[t] + factor * G[t + 1], which is
+    computed in closed form as a reversed cumulative sum of x[k] * factor ** k scaled by
+    factor ** -t. To keep the powers of the factor within floating point range, long
+    trajectories are split into blocks that are processed from last to first, with the
+    return at the start of each block carried into the previous block.
+    """
+
+    # the largest power of ten by which values are scaled within a block
+    EXPONENT_LIMIT = 250.0
+
+    @staticmethod
+    def discounted(values, factor):
+        """ Returns the discounted sums G[t] = sum_{k >= t} factor ** (k - t) * values[k]
+        for each step t of a trajectory.
+
+        inputs:
+            values - a one-dimensional numpy array of rewards (or other per-step values)
+            factor - the discount factor in [0, 1]
+        outputs:
+            a one-dimensional numpy array of discounted sums, one per step
+        """
+        values = np.asarray(values, dtype=float)
+        n = len(values)
+        if n == 0 or factor == 0.0:
+            return values.copy()
+        if factor == 1.0:
+            return np.cumsum(values[::-1])[::-1]
+
+        # split the trajectory into blocks in which the powers of factor remain in range
+        block = max(1, min(n, int(Returns.EXPONENT_LIMIT / -math.log10(factor))))
+        powers = factor ** np.arange(block)
+        result = np.empty(n, dtype=float)
+        carry = 0.0
+        for end in range(n, 0, -block):
+            start = max(0, end - block)
+            length = end - start
+            p = powers[:length]
+            tail = np.cumsum((values[start:end] * p)[::-1])[::-1] / p
+            result[start:end] = tail + carry * (factor ** length / p)
+            carry = result[start]
+        return result
+
+    @staticmethod
+    def discounted_sum(values, factor):
+        """ Returns the discounted sum of all values of a trajectory, sum_k factor ** k *
+        values[k], which is the first element of the output of discounted.
+        """
+        values = np.asarray(values, dtype=float)
+        return float(np.dot(values, factor ** np.arange(len(values), dtype=float)))
+
+    @staticmethod
+    def lambda_returns(rewards, next_values, discount, decay):
+        """ Returns the lambda-returns of each step of a trajectory, which satisfy
+        G[t] = rewards[t] + discount * ((1 - decay) * next_values[t] + decay * G[t + 1])
+        for each step t before the last, and G[T] = rewards[T] + discount * next_values[T]
+        for the last step T.
+
+        inputs:
+            rewards - a one-dimensional numpy array of rewards
+            next_values - a one-dimensional numpy array, whose element t is the estimated
+            value of the step following step t (and whose last element is the value
+            used to bootstrap after the last step, or zero if the last step is terminal)
+            discount - the discount factor in [0, 1]
+            decay - the lambda parameter in [0, 1]
+        outputs:
+            a one-dimensional numpy array of lambda-returns, one per step
+        """
+        rewards = np.asarray(rewards, dtype=float)
+        next_values = np.asarray(next_values, dtype=float)
+        if len(rewards) == 0:
+            return rewards.copy()
+        x = rewards + discount * (1.0 - decay) * next_values
+        x[-1] = rewards[-1] + discount * next_values[-1]
+        return Returns.discounted(x, discount * decay)
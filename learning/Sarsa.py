@@ -31,8 +31,10 @@ class Sarsa(TDLearning):
     
     def run_episode(self, Q : Tabular, task : Task, policy : Policy):
         
-        # to compute backup
-        rewards = np.zeros(self.episode_length, dtype=float)
+        # to record the episode
+        trajectory = self.trajectory
+        trajectory.clear()
+        record = trajectory.steps.append
         
         # initialize state
         state = task.initial_state()
@@ -45,7 +47,7 @@ class Sarsa(TDLearning):
                 
             # take action and observe reward and new state
             new_state, reward, done = task.transition(state, action) 
-            rewards[t] = reward  
+            record((state, action, reward, done))
                 
             # choose new action from new state using policy derived from Q
             new_action = policy.act(Q, task, new_state) 
@@ -61,4 +63,4 @@ class Sarsa(TDLearning):
             if done:
                 break
 
-        return t, rewards[0:t]
+        return t, trajectory.rewards[0:t]
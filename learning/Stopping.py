@@ -0,0 +1,222 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from abc import ABC, abstractmethod
+from collections import deque
+import time
+import numpy as np
+from agents.Agent import Agent
+from agents.Tabular import Tabular
+from agents.DenseTabular import DenseTabular
+from agents.Linear import Linear
+
+
+class StoppingCriterion(ABC):
+    """ An abstract class that represents a criterion to stop training early.
+
+    A criterion is passed to the train method of a learner, which calls clear at the
+    start of training and stop at the end of each episode. Training stops as soon as
+    stop returns True.
+    """
+
+    @abstractmethod
+    def clear(self):
+        """ Resets all working variables contained in the current implementation.
+        """
+        pass
+
+    @abstractmethod
+    def stop(self, episode, steps, reward, Q : Agent):
+        """ Returns whether or not training should stop after the specified episode.
+
+        inputs:
+            episode - the (zero-based) episode counter
+            steps - the length of the episode
+            reward - the sum of the discounted rewards obtained in the episode
+            Q - an Agent object storing the Q-values
+        outputs:
+            a boolean whether or not to stop training
+        """
+        pass
+
+    @staticmethod
+    def criteria(stopping):
+        """ Returns a list of the specified stopping criteria after clearing them.
+
+        inputs:
+            stopping - a StoppingCriterion object, a list of StoppingCriterion objects
+            or None
+        outputs:
+            a list of StoppingCriterion objects, which is empty if stopping is None
+        """
+        if stopping is None:
+            criteria = []
+        elif isinstance(stopping, StoppingCriterion):
+            criteria = [stopping]
+        else:
+            criteria = list(stopping)
+        for criterion in criteria:
+            criterion.clear()
+        return criteria
+
+    @staticmethod
+    def any(criteria, episode, steps, reward, Q : Agent):
+        """ Returns whether or not any of the specified criteria requests to stop
+        training after the specified episode. All criteria are updated.
+        """
+        stops = [criterion.stop(episode, steps, reward, Q) for criterion in criteria]
+        return any(stops)
+
+
+class Plateau(StoppingCriterion):
+    """ Stops training when the moving average of the returns of recent episodes has not
+    improved on its best value by more than a tolerance for a number of episodes.
+
+    inputs:
+        window - the number of episodes over which returns are averaged (defaults to 100)
+        tolerance - the minimum increase of the moving average that counts as an
+        improvement (defaults to 1e-3)
+        patience - the number of episodes without improvement after which training
+        stops (defaults to None, meaning the same as window)
+    """
+
+    def __init__(self, window=100, tolerance=1e-3, patience=None):
+        self.window = window
+        self.tolerance = tolerance
+        self.patience = patience if patience is not None else window
+        self.clear()
+
+    def clear(self):
+        self.returns = deque(maxlen=self.window)
+        self.total = 0.0
+        self.best = -np.inf
+        self.waiting = 0
+
+    def stop(self, episode, steps, reward, Q : Agent):
+        if len(self.returns) == self.window:
+            self.total -= self.returns[0]
+        self.returns.append(reward)
+        self.total += reward
+        if len(self.returns) < self.window:
+            return False
+        average = self.total / self.window
+        if average > self.best + self.tolerance:
+            self.best = average
+            self.waiting = 0
+        else:
+            self.waiting += 1
+        return self.waiting >= self.patience
+
+
+class TargetReturn(StoppingCriterion):
+    """ Stops training when the moving average of the returns of recent episodes reaches
+    a target.
+
+    inputs:
+        target - the target average return
+        window - the number of episodes over which returns are averaged (defaults to 100)
+    """
+
+    def __init__(self, target, window=100):
+        self.target = target
+        self.window = window
+        self.clear()
+
+    def clear(self):
+        self.returns = deque(maxlen=self.window)
+        self.total = 0.0
+
+    def stop(self, episode, steps, reward, Q : Agent):
+        if len(self.returns) == self.window:
+            self.total -= self.returns[0]
+        self.returns.append(reward)
+        self.total += reward
+        return len(self.returns) == self.window and self.total / self.window >= self.target
+
+
+class QChange(StoppingCriterion):
+    """ Stops training when the largest change of any Q-value (or weight, for Linear
+    agents) between consecutive checks falls below a tolerance for a number of
+    consecutive checks. Supports Tabular, DenseTabular and Linear agents.
+
+    Each check copies the table of the agent, so for large tables, checks can be made
+    every few episodes. States that were first visited since the previous check count
+    as an infinite change. Vector learners can complete several episodes without
+    updating the agent in between, so every should then be at least the number of
+    copies of the environment.
+
+    inputs:
+        tolerance - the largest change of the Q-values considered negligible
+        every - the number of episodes between checks (defaults to 1)
+        patience - the number of consecutive checks with negligible changes after which
+        training stops (defaults to 1)
+    """
+
+    def __init__(self, tolerance, every=1, patience=1):
+        self.tolerance = tolerance
+        self.every = every
+        self.patience = patience
+        self.clear()
+
+    def clear(self):
+        self.previous = None
+        self.calm = 0
+
+    @staticmethod
+    def snapshot(Q : Agent):
+        """ Returns a copy of the Q-values (or weights) of the specified agent.
+        """
+        if isinstance(Q, DenseTabular):
+            return Q.Q.copy()
+        elif isinstance(Q, Tabular):
+            return {state: values.copy() for state, values in Q.Q.items()}
+        elif isinstance(Q, Linear):
+            return Q.W.copy()
+        else:
+            raise ValueError('unsupported agent {}'.format(type(Q).__name__))
+
+    @staticmethod
+    def change(previous, current):
+        """ Returns the largest absolute difference between two snapshots.
+        """
+        if isinstance(current, dict):
+            if current.keys() != previous.keys():
+                return np.inf
+            return max((np.amax(np.abs(current[state] - values))
+                        for state, values in previous.items()), default=0.0)
+        if current.shape != previous.shape:
+            return np.inf
+        return np.amax(np.abs(current - previous))
+
+    def stop(self, episode, steps, reward, Q : Agent):
+        if (episode + 1) % self.every != 0:
+            return False
+        current = QChange.snapshot(Q)
+        if self.previous is not None:
+            if QChange.change(self.previous, current) < self.tolerance:
+                self.calm += 1
+            else:
+                self.calm = 0
+        self.previous = current
+        return self.calm >= self.patience
+
+
+class TimeBudget(StoppingCriterion):
+    """ Stops training once a wall-clock time budget has been used, measured from the
+    start of training. The episode running when the budget runs out is completed.
+
+    inputs:
+        seconds - the time budget in seconds
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.clear()
+
+    def clear(self):
+        self.start = time.perf_counter()
+
+    def stop(self, episode, steps, reward, Q : Agent):
+        return time.perf_counter() - self.start >= self.seconds
@@ -0,0 +1,272 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import numpy as np
+from learning.TDLearning import TDLearning
+
+
+class Grid:
+    """ A parameter space containing every combination of the values of each parameter.
+
+    inputs:
+        space - a dictionary mapping the name of each parameter to a list of its values
+    """
+
+    def __init__(self, space):
+        self.space = space
+
+    def configurations(self):
+        """ Returns a list of dictionaries mapping the name of each parameter to its value,
+        one per configuration.
+        """
+        names = list(self.space.keys())
+        return [dict(zip(names, values))
+                for values in itertools.product(*(self.space[name] for name in names))]
+
+
+class RandomSpace:
+    """ A parameter space containing a number of configurations sampled at random.
+
+    The values of each parameter are specified either as a list, from which values are
+    sampled uniformly, as a tuple (low, high), from which values are sampled from the
+    uniform distribution on [low, high], or as a function that is given a
+    numpy.random.Generator and returns a value (e.g. to sample on a logarithmic scale).
+
+    inputs:
+        space - a dictionary mapping the name of each parameter to its values
+        samples - the number of configurations to sample
+        seed - an integer seed used to sample configurations (defaults to None, meaning
+        configurations are sampled from fresh entropy; a sweep that is resumed must use
+        the same seed)
+    """
+
+    def __init__(self, space, samples, seed=None):
+        self.space = space
+        self.samples = samples
+        self.seed = seed
+
+    def sample(self, values, rng):
+        """ Returns a value of a parameter with the specified values.
+        """
+        if isinstance(values, tuple):
+            return float(rng.uniform(values[0], values[1]))
+        elif callable(values):
+            return values(rng)
+        else:
+            return values[int(rng.integers(len(values)))]
+
+    def configurations(self):
+        """ Returns a list of dictionaries mapping the name of each parameter to its value,
+        one per configuration.
+        """
+        rng = np.random.default_rng(self.seed)
+        return [{name: self.sample(values, rng) for name, values in self.space.items()}
+                for _ in range(self.samples)]
+
+
+class Sweep:
+    """ Searches a parameter space for the configuration of a learner that obtains the
+    highest return, training configurations in parallel.
+
+    Each configuration is trained with train_many, and scored by the average return
+    of its last episodes. Optionally, configurations are pruned by successive halving:
+    all configurations are first trained for a small number of episodes, after which
+    only the best fraction 1 / eta of them are trained again with eta times as many
+    episodes, and so on until the remaining configurations are trained for the full
+    number of episodes. Since train_many resets the agent, each round of training starts
+    from scratch.
+
+    Each trained configuration is appended as one line of JSON to a results file as soon
+    as it finishes. If the results file exists when the sweep starts, the configurations
+    it records are not trained again, so an interrupted sweep can be resumed by running
+    it again with the same arguments.
+
+    Configurations are built in worker processes by a function that maps a dictionary of
+    parameters to the objects to train, for example
+        def build(params):
+            learner = QLearning(params['discount'], 200)
+            Q = Tabular(4, params['learning_rate'])
+            return learner, Q, GridWorld(), EpsilonGreedy(params['epsilon'])
+    On platforms that support it, worker processes are forked, so this function does
+    not need to be pickled, but the values of the parameters must be serializable to JSON.
+
+    inputs:
+        build - a function that returns a tuple (learner, Q, task, policy) of a
+        TDLearning, Agent, Task and Policy object for a dictionary of parameters
+        space - a Grid or RandomSpace object describing the configurations to search
+        episodes - the number of episodes of training of the configurations that are
+        not pruned
+        trials - the number of independent trials of training of each configuration
+        (defaults to 1)
+        min_episodes - the number of episodes of training of all configurations in the
+        first round of successive halving (defaults to None, meaning configurations are
+        not pruned)
+        eta - the factor by which the number of configurations is divided and the number
+        of episodes is multiplied in each round of successive halving (defaults to 3)
+        tail - the fraction of the last episodes whose returns are averaged to score a
+        configuration (defaults to 0.1)
+        workers - the number of worker processes used to train configurations in parallel
+        (defaults to None, meaning configurations are trained sequentially)
+        path - the path of the results file (defaults to None, meaning results are not
+        saved)
+        seed - an integer seed from which the seed of each configuration is derived
+        (defaults to None, meaning configurations are seeded from fresh entropy)
+
+    References
+    ========
+        - Jamieson, Kevin, and Ameet Talwalkar. "Non-stochastic best arm identification
+        and hyperparameter optimization." Artificial Intelligence and Statistics. 2016.
+        - Li, Lisha, et al. "Hyperband: A novel bandit-based approach to hyperparameter
+        optimization." The Journal of Machine Learning Research 18.1 (2017): 6765-6816.
+    """
+
+    def __init__(self, build, space, episodes, trials=1, min_episodes=None, eta=3,
+                 tail=0.1, workers=None, path=None, seed=None):
+        self.build = build
+        self.space = space
+        self.episodes = episodes
+        self.trials = trials
+        self.min_episodes = min_episodes
+        self.eta = eta
+        self.tail = tail
+        self.workers = workers
+        self.path = path
+        self.seed = seed
+
+    def budgets(self):
+        """ Returns a list of the number of episodes of training in each round of
+        successive halving.
+        """
+        if self.min_episodes is None or self.min_episodes >= self.episodes:
+            return [self.episodes]
+        budgets = []
+        budget = self.min_episodes
+        while budget < self.episodes:
+            budgets.append(budget)
+            budget *= self.eta
+        budgets.append(self.episodes)
+        return budgets
+
+    @staticmethod
+    def key(params, episodes):
+        """ Returns a string that identifies the training of a configuration with the
+        specified parameters for the specified number of episodes.
+        """
+        return json.dumps([params, episodes], sort_keys=True)
+
+    def load(self):
+        """ Returns a dictionary of the results recorded in the results file, keyed on the
+        configuration and number of episodes. An incomplete last line, written when a
+        sweep is interrupted, is removed from the file.
+        """
+        results = {}
+        if self.path is None or not os.path.exists(self.path):
+            return results
+        with open(self.path) as file:
+            text = file.read()
+        if not text.endswith('\n'):
+            text = text[:text.rfind('\n') + 1]
+            with open(self.path, 'w') as file:
+                file.write(text)
+        for line in text.splitlines():
+            if line.strip():
+                result = json.loads(line)
+                results[Sweep.key(result['params'], result['episodes'])] = result
+        return results
+
+    def run(self):
+        """ Runs the sweep.
+
+        outputs:
+            a list of the results of the configurations trained for the full number of
+            episodes, sorted from the highest to the lowest score; each result is a
+            dictionary containing the parameters of the configuration ('params'), the
+            number of episodes of training ('episodes'), the score ('score'), and the
+            average length of the last episodes ('length')
+        """
+        configurations = self.space.configurations()
+        seeds = TDLearning.trial_seeds(self.seed, len(configurations))
+        results = self.load()
+        survivors = list(range(len(configurations)))
+        if self.workers is None:
+            pool = None
+        elif 'fork' in multiprocessing.get_all_start_methods():
+            pool = ProcessPoolExecutor(self.workers,
+                                       mp_context=multiprocessing.get_context('fork'),
+                                       initializer=_init_worker, initargs=(self,))
+        else:
+            TDLearning.check_picklable(self)
+            pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                       initargs=(self,))
+        try:
+            for budget in self.budgets():
+
+                # train the surviving configurations that have no recorded result
+                pending = [i for i in survivors
+                           if Sweep.key(configurations[i], budget) not in results]
+                if pool is None:
+                    finished = (self.train(configurations[i], budget, seeds[i])
+                                for i in pending)
+                else:
+                    futures = [pool.submit(_train_worker, configurations[i], budget,
+                                           seeds[i]) for i in pending]
+                    finished = (future.result() for future in as_completed(futures))
+                for result in finished:
+                    results[Sweep.key(result['params'], budget)] = result
+                    self.save(result)
+
+                # keep the best configurations for the next round
+                scores = [results[Sweep.key(configurations[i], budget)]['score']
+                          for i in survivors]
+                order = np.argsort(scores, kind='stable')[::-1]
+                ranked = [survivors[j] for j in order]
+                if budget < self.episodes:
+                    survivors = ranked[:max(1, len(ranked) // self.eta)]
+                else:
+                    survivors = ranked
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return [results[Sweep.key(configurations[i], self.episodes)] for i in survivors]
+
+    def train(self, params, episodes, seed):
+        """ Trains the configuration with the specified parameters for the specified
+        number of episodes, and returns its result.
+        """
+        learner, Q, task, policy = self.build(params)
+        steps, rewards = learner.train_many(Q, task, policy, episodes, self.trials,
+                                            seed=seed)
+        n = max(1, int(math.ceil(self.tail * len(rewards))))
+        return {'params': params, 'episodes': episodes,
+                'score': float(np.mean(rewards[-n:])),
+                'length': float(np.mean(steps[-n:]))}
+
+    def save(self, result):
+        """ Appends the specified result to the results file, if any.
+        """
+        if self.path is None:
+            return
+        with open(self.path, 'a') as file:
+            file.write(json.dumps(result) + '\n')
+            file.flush()
+
+
+# the sweep held by each worker process
+_worker_sweep = None
+
+
+def _init_worker(sweep):
+    global _worker_sweep
+    _worker_sweep = sweep
+
+
+def _train_worker(params, episodes, seed):
+    return _worker_sweep.train(params, episodes, seed)
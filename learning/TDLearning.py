@@ -4,15 +4,29 @@ Created on Oct 22, 2018
 @author: michael
 '''
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import multiprocessing
+import pickle
+import random
 import numpy as np
 from domains.Task import Task
 from agents.Agent import Agent
+from agents.DenseTabular import DenseTabular
 from policies.Policy import Policy
+from learning.Instrumentation import Instrumentation
+from learning.Returns import Returns
+from learning.Trajectory import Trajectory
+from learning.Stopping import StoppingCriterion
 
 
 class TDLearning(ABC):
     """ An abstract class that represents all temporal difference learning algorithms.
     
+    Each learner records the steps of the current episode in a Trajectory, which is 
+    allocated once and reused by every episode. After an episode, it holds the states,
+    actions, rewards and terminal flags of that episode until the next one begins.
+    
     inputs:
         discount - the discount factor in [0, 1]
         episode_length - for episodic learning, the length of each episode
@@ -21,6 +35,7 @@ class TDLearning(ABC):
     def __init__(self, discount, episode_length):
         self.gamma = discount
         self.episode_length = episode_length
+        self.trajectory = Trajectory()
     
     @abstractmethod
     def clear(self):
@@ -43,14 +58,22 @@ class TDLearning(ABC):
             - the length of the episode until the terminal state is reached
             or the episode reaches its maximum length
             - a one-dimensional numpy array containing the sum of the discounted 
-            rewards from the environment
+            rewards from the environment, which may be a view of the rewards recorded 
+            in the trajectory of the current learner
         """
         pass    
     
-    def train(self, Q : Agent, task : Task, policy : Policy, episodes):
+    def train(self, Q : Agent, task : Task, policy : Policy, episodes, 
+              instrumentation : Instrumentation=None, stopping=None):
         """ Trains the specified agent on the specified task using the specified
         exploration policy using the current implementation. A specified number of episodes
-        is generated for training.
+        is generated for training, unless a stopping criterion ends training early, in
+        which case the histories only contain the episodes that were run.
+        
+        Random numbers come from two separate sources: the policy draws exploration 
+        decisions from its own Sampler, while tasks, replay memories and other components
+        draw from the random and numpy.random modules. To reproduce a run, seed both, 
+        e.g. with policy.seed(s) and numpy.random.seed(s), or call train_many with a seed.
         
         inputs:
             Q - an Agent object storing the Q-values
@@ -58,6 +81,11 @@ class TDLearning(ABC):
             policy - a Policy object representing the exploration policy used to 
             balance exploration and exploitation
             episodes - the number of episodes of training to perform
+            instrumentation - an Instrumentation object that records the time spent in 
+            each phase of training (defaults to None, meaning training is not timed)
+            stopping - a StoppingCriterion object, or a list of StoppingCriterion objects
+            any of which can stop training, checked at the end of each episode (defaults 
+            to None, meaning all episodes are run)
         outputs:
             - a one-dimensional numpy array containing the lengths of each episode - this
             can be used to check the learning progress of the agent
@@ -70,36 +98,75 @@ class TDLearning(ABC):
         self.clear()
         Q.clear()
         policy.clear()
+        criteria = StoppingCriterion.criteria(stopping)
         
         # for storing history of trial
         rewards_history = np.zeros(episodes, dtype=float)
         steps_history = np.zeros(episodes, dtype=int)
         
+        # wrap the objects to time if instrumentation is requested
+        if instrumentation is not None:
+            Q, task, policy = instrumentation.attach(self, Q, task, policy)
+        
         # run episodes
-        for e in range(episodes):
-            
-            # run an episode of training
-            steps, rewards = self.run_episode(Q, task, policy)
-            
-            # compute the value of the backup and update the history
-            R = 0.0
-            for reward in rewards[::-1]:
-                R = reward + self.gamma * R
-            rewards_history[e] = R
-            steps_history[e] = steps
-            
-            # finish episode
-            policy.finish_episode(e)
-            Q.finish_episode(e)
-        
-        return steps_history, rewards_history
+        completed = 0
+        try:
+            for e in range(episodes):
+                if instrumentation is not None:
+                    instrumentation.begin_episode()
+                
+                # run an episode of training
+                steps, rewards = self.run_episode(Q, task, policy)
+                
+                # compute the value of the backup and update the history
+                rewards_history[e] = Returns.discounted_sum(rewards, self.gamma)
+                steps_history[e] = steps
+                
+                # finish episode
+                policy.finish_episode(e)
+                Q.finish_episode(e)
+                if instrumentation is not None:
+                    instrumentation.end_episode(e, steps)
+                completed = e + 1
+                
+                # check whether to stop early
+                if criteria and StoppingCriterion.any(criteria, e, steps, 
+                                                      rewards_history[e], Q):
+                    break
+        finally:
+            if instrumentation is not None:
+                instrumentation.detach(self)
+        
+        return steps_history[:completed], rewards_history[:completed]
     
-    def train_many(self, Q : Agent, task : Task, policy : Policy, episodes, trials):
+    def train_many(self, Q : Agent, task : Task, policy : Policy, episodes, trials,
+                   workers=None, executor=None, seed=None, stopping=None):
         """ Trains the specified agent on the specified task using the specified
         exploration policy using the current implementation. A specified number of episodes
         is generated for training. A specified number of independent trials of training are
         performed - all variables are reset at the end of each trial. 
         
+        If either workers or executor is specified, trials are run in parallel. Each trial
+        then trains its own copy of the learner, agent, task and policy, so the objects
+        passed to this method are not modified. By default, trials are distributed over a 
+        process pool; on platforms that support it, worker processes are forked so that
+        the learner, agent, task and policy do not need to be pickled. A custom executor 
+        must be able to transfer these objects to its workers (e.g. by pickling them).
+        Objects sent to a process pool whose workers are not forked must be picklable,
+        which excludes parameters given as lambda expressions (e.g. learning rate 
+        schedules), and a ValueError is raised otherwise.
+        
+        The random number generators of the random and numpy.random modules, and of the
+        policy (which is separate, see train), are seeded at the start of each trial with
+        independent seeds derived from the specified seed, so the results are 
+        reproducible regardless of how trials are assigned to worker processes. Trials 
+        that share these generators (e.g. when run on a thread pool) are not 
+        reproducible.
+        
+        If a stopping criterion is specified, trials may stop after different numbers of
+        episodes. Each episode is then averaged over the trials that ran it, and the 
+        results have the length of the longest trial.
+        
         inputs:
             Q - an Agent object storing the Q-values
             task - a Task object representing the task the agent is learning
@@ -107,6 +174,17 @@ class TDLearning(ABC):
             balance exploration and exploitation
             episodes - the number of episodes of training to perform
             trials - the number of independent trials of training to perform
+            workers - the number of worker processes used to run trials in parallel
+            (defaults to None, meaning trials are run sequentially unless an executor 
+            is specified)
+            executor - a concurrent.futures.Executor used to run trials in parallel
+            (defaults to None, meaning a process pool with the specified number of workers
+            is created)
+            seed - an integer seed from which the seed of each trial is derived (defaults 
+            to None, meaning trials are not seeded when run sequentially, and are seeded
+            from fresh entropy when run in parallel)
+            stopping - a StoppingCriterion object, or a list of StoppingCriterion objects,
+            used to stop each trial early (defaults to None, meaning all episodes are run)
         outputs:
             - a one-dimensional numpy array containing the average length of each episode 
             over all trials - this can be used to check the learning progress of the agent
@@ -114,10 +192,156 @@ class TDLearning(ABC):
             rewards from the environment obtained on each episode over all trials - this can 
             be used to check the learning progress of the agent 
         """
-        average_rewards = np.zeros(episodes, dtype=float)
-        average_steps = np.zeros(episodes, dtype=float)
-        for _ in range(trials):
-            steps, rewards = self.train(Q, task, policy, episodes)
-            average_rewards += rewards / trials
-            average_steps += steps / trials
-        return average_steps, average_rewards
+        parallel = workers is not None or executor is not None
+        if parallel or seed is not None:
+            seeds = TDLearning.trial_seeds(seed, trials)
+        else:
+            seeds = [None] * trials
+        
+        # run the trials
+        if not parallel:
+            results = (_train_trial(self, Q, task, policy, episodes, s, stopping) 
+                       for s in seeds)
+        elif executor is not None:
+            if isinstance(executor, ProcessPoolExecutor):
+                TDLearning.check_picklable(self, Q, task, policy, stopping)
+            futures = [executor.submit(_train_trial_copy, self, Q, task, policy, 
+                                       episodes, s, stopping)
+                       for s in seeds]
+            results = (future.result() for future in futures)
+        else:
+            results = self._train_pool(Q, task, policy, episodes, seeds, workers, stopping)
+        
+        # average the results over the trials that ran each episode
+        total_rewards = np.zeros(episodes, dtype=float)
+        total_steps = np.zeros(episodes, dtype=float)
+        counts = np.zeros(episodes, dtype=int)
+        for steps, rewards in results:
+            n = len(rewards)
+            total_rewards[:n] += rewards
+            total_steps[:n] += steps
+            counts[:n] += 1
+        n = np.count_nonzero(counts)
+        return total_steps[:n] / counts[:n], total_rewards[:n] / counts[:n]
+    
+    def _train_pool(self, Q : Agent, task : Task, policy : Policy, episodes, seeds, workers,
+                    stopping):
+        """ Runs one trial of training per seed on a new process pool, and returns 
+        the results of all trials in order. 
+        """
+        if 'fork' in multiprocessing.get_all_start_methods():
+            pool = ProcessPoolExecutor(workers, 
+                                       mp_context=multiprocessing.get_context('fork'),
+                                       initializer=_init_worker,
+                                       initargs=(self, Q, task, policy, stopping))
+            with pool:
+                futures = [pool.submit(_train_worker_trial, episodes, s) for s in seeds]
+                return [future.result() for future in futures]
+        else:
+            TDLearning.check_picklable(self, Q, task, policy, stopping)
+            with ProcessPoolExecutor(workers) as pool:
+                futures = [pool.submit(_train_trial_copy, self, Q, task, policy, 
+                                       episodes, s, stopping)
+                           for s in seeds]
+                return [future.result() for future in futures]
+    
+    @staticmethod
+    def backup(Q : Agent, states, actions, targets):
+        """ Moves the Q-values of the specified steps of an episode towards the 
+        specified targets, visiting the steps in reverse order, with the same result as
+        the loop
+            for t in reversed(range(len(targets))):
+                s, a = states[t], actions[t]
+                Q.update(s, a, targets[t] - Q.values(s)[a])
+        
+        For DenseTabular agents, updates of distinct state-action pairs do not affect 
+        each other, so the steps are grouped into rounds: round k contains the k-th last 
+        visit of each pair, whose pairs are distinct and are updated together with 
+        update_rows. The number of rounds is the largest number of visits of any pair.
+        Other agents are updated by the loop above, which is faster for hash tables, and
+        necessary for agents whose updates of distinct pairs share parameters (e.g. 
+        Linear).
+        
+        inputs:
+            Q - an Agent object storing the Q-values
+            states - a numpy array of the states of the steps
+            actions - a one-dimensional numpy array of the actions of the steps
+            targets - a one-dimensional numpy array of the targets of the steps
+        """
+        if not isinstance(Q, DenseTabular):
+            for t in range(len(targets) - 1, -1, -1):
+                state, action = states[t], actions[t]
+                Q.update(state, action, targets[t] - Q.values(state)[action])
+            return
+        
+        # rank the visits of each pair from the last one, by sorting the steps by pair 
+        # and then by decreasing time
+        n = len(targets)
+        rows, actions = Q.rows(states), np.asarray(actions)
+        keys = rows * Q.valid_actions + actions
+        order = np.lexsort((-np.arange(n), keys))
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        sizes = np.diff(np.r_[starts, n])
+        rounds = np.empty(n, dtype=np.intp)
+        rounds[order] = np.arange(n) - np.repeat(starts, sizes)
+        
+        # update the pairs of each round together
+        order = np.argsort(rounds, kind='stable')
+        ends = np.cumsum(np.bincount(rounds, minlength=1))
+        start = 0
+        for end in ends:
+            idx = order[start:end]
+            round_rows, round_actions = rows[idx], actions[idx]
+            values = Q.Q[round_rows, round_actions]
+            Q.update_rows(round_rows, round_actions, targets[idx] - values)
+            start = end
+    
+    @staticmethod
+    def check_picklable(*objects):
+        """ Raises a ValueError if the specified objects cannot be pickled, which is 
+        required to send them to worker processes, unless the workers are forked after 
+        the objects are created. Parameters given as lambda expressions (e.g. learning 
+        rate schedules) are the usual culprit, and can be replaced by functions defined
+        at module level.
+        """
+        try:
+            pickle.dumps(objects)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            raise ValueError('objects sent to worker processes must be picklable, but '
+                             'pickling failed: {}'.format(error)) from error
+    
+    @staticmethod
+    def trial_seeds(seed, trials):
+        """ Returns a list of independent integer seeds for the specified number of 
+        trials, derived from the specified seed.
+        """
+        children = np.random.SeedSequence(seed).spawn(trials)
+        return [int(child.generate_state(1)[0]) for child in children]
+
+
+# the learner, agent, task, policy and stopping criteria held by each forked worker process
+_worker_objects = None
+
+
+def _init_worker(learner, Q, task, policy, stopping):
+    global _worker_objects
+    _worker_objects = (learner, Q, task, policy, stopping)
+
+
+def _train_worker_trial(episodes, seed):
+    learner, Q, task, policy, stopping = _worker_objects
+    return _train_trial(learner, Q, task, policy, episodes, seed, stopping)
+
+
+def _train_trial_copy(learner, Q, task, policy, episodes, seed, stopping):
+    learner, Q, task, policy, stopping = copy.deepcopy((learner, Q, task, policy, stopping))
+    return _train_trial(learner, Q, task, policy, episodes, seed, stopping)
+
+
+def _train_trial(learner, Q, task, policy, episodes, seed, stopping=None):
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+        policy.seed(seed)
+    return learner.train(Q, task, policy, episodes, stopping=stopping)
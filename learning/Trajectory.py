@@ -0,0 +1,105 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from operator import itemgetter
+import numpy as np
+
+
+class Trajectory:
+    """ A record of the steps of an episode, as columns of states, actions, rewards and
+    flags whether or not each step ended in a terminal state.
+
+    A learner allocates one trajectory and reuses it for every episode. Steps are
+    recorded as tuples (state, action, reward, done) in the list steps, since appending
+    to a list is the cheapest way to record a step in Python: learners bind
+    record = trajectory.steps.append after clearing the trajectory, and call
+    record((state, action, reward, done)) on each step. Each column is converted to a
+    numpy array once, when it is first accessed after steps were recorded. The columns
+    are replaced when the next episode is recorded, so callers that keep a trajectory
+    must copy it.
+
+    inputs:
+        state_dtype - the numpy data type of the column of states (defaults to object,
+        meaning any state can be stored; integer states or state ids may use int)
+    """
+
+    def __init__(self, state_dtype=object):
+        self.state_dtype = state_dtype
+        self.steps = []
+        self.clear()
+
+    def clear(self):
+        """ Removes all steps. The list of steps is emptied in place.
+        """
+        self.steps.clear()
+        self.columns = {}
+        self.converted = 0
+
+    def __len__(self):
+        return len(self.steps)
+
+    def append(self, state, action, reward, done):
+        """ Records one step of the episode. Learners record steps by appending to the
+        list steps directly, which is faster.
+
+        inputs:
+            state - the state in which the action was taken
+            action - the action taken
+            reward - the reward observed
+            done - whether or not the next state is terminal
+        """
+        self.steps.append((state, action, reward, done))
+
+    def column(self, index, dtype):
+        """ Returns the specified column of the steps recorded so far as a numpy array,
+        converting it if it was not converted since the last step was recorded.
+
+        inputs:
+            index - the position of the column in each step
+            dtype - the numpy data type of the column
+        outputs:
+            a one-dimensional numpy array with one element per step
+        """
+        steps = self.steps
+        n = len(steps)
+        if n != self.converted:
+            self.columns = {}
+            self.converted = n
+        values = self.columns.get(index)
+        if values is None:
+            values = np.fromiter(map(itemgetter(index), steps), dtype=dtype, count=n)
+            self.columns[index] = values
+        return values
+
+    @property
+    def states(self):
+        """ The column of states of the steps recorded so far.
+        """
+        return self.column(0, self.state_dtype)
+
+    @property
+    def actions(self):
+        """ The column of actions of the steps recorded so far.
+        """
+        return self.column(1, np.intp)
+
+    @property
+    def rewards(self):
+        """ The column of rewards of the steps recorded so far.
+        """
+        return self.column(2, float)
+
+    @property
+    def dones(self):
+        """ The column of terminal flags of the steps recorded so far.
+        """
+        return self.column(3, bool)
+
+    def copy(self):
+        """ Returns a new trajectory containing a copy of the steps recorded so far.
+        """
+        other = Trajectory(self.state_dtype)
+        other.steps.extend(self.steps)
+        return other
@@ -0,0 +1,79 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import os
+import numpy as np
+
+
+class TransitionLog:
+    """ A log of transitions (state, action, reward, next_state, done) stored on disk,
+    which can be read sequentially in chunks of bounded size.
+
+    A log is a directory containing one .npy file per column, named states.npy,
+    actions.npy, rewards.npy, next_states.npy and dones.npy, with one row per transition.
+    Columns are memory-mapped, so only the chunk being read is loaded into memory, and
+    each chunk is read from each file sequentially. A log may consist of several such
+    directories (shards), which are read one after the other.
+
+    inputs:
+        paths - the path of a log directory, or a list of paths of log directories
+    """
+
+    # the names of the columns of a log, in the order in which they are returned
+    COLUMNS = ('states', 'actions', 'rewards', 'next_states', 'dones')
+
+    def __init__(self, paths):
+        if isinstance(paths, (str, os.PathLike)):
+            paths = [paths]
+        self.paths = list(paths)
+        self.shards = [TransitionLog.open(path) for path in self.paths]
+
+    @staticmethod
+    def open(path):
+        """ Opens the columns of the specified log directory as memory-mapped arrays,
+        and checks that they have the same number of rows.
+        """
+        columns = tuple(np.load(os.path.join(path, column + '.npy'), mmap_mode='r')
+                        for column in TransitionLog.COLUMNS)
+        lengths = set(len(column) for column in columns)
+        if len(lengths) != 1:
+            raise ValueError('columns of log {} have different lengths'.format(path))
+        return columns
+
+    @staticmethod
+    def save(path, states, actions, rewards, next_states, dones):
+        """ Writes the specified transitions to a new log directory.
+
+        inputs:
+            path - the path of the log directory, which is created if necessary
+            states - a numpy array of states, with one row per transition
+            actions - a one-dimensional numpy array of actions
+            rewards - a one-dimensional numpy array of rewards
+            next_states - a numpy array of next states, with one row per transition
+            dones - a one-dimensional boolean numpy array whether or not each next state
+            is terminal
+        """
+        os.makedirs(path, exist_ok=True)
+        data = (states, actions, rewards, next_states, dones)
+        for column, values in zip(TransitionLog.COLUMNS, data):
+            np.save(os.path.join(path, column + '.npy'), np.asarray(values))
+
+    def __len__(self):
+        return sum(len(shard[0]) for shard in self.shards)
+
+    def chunks(self, size):
+        """ Yields the transitions of the log in order, in chunks of at most the
+        specified number of transitions.
+
+        inputs:
+            size - the maximum number of transitions per chunk
+        outputs:
+            a generator of tuples of numpy arrays (states, actions, rewards, next_states,
+            dones), with one row per transition, which are copies loaded into memory
+        """
+        for shard in self.shards:
+            count = len(shard[0])
+            for start in range(0, count, size):
+                yield tuple(np.array(column[start:start + size]) for column in shard)
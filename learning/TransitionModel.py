@@ -0,0 +1,152 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from collections import defaultdict
+import numpy as np
+
+
+class TransitionModel:
+    """ A learned model of the transitions of a task, used for planning.
+
+    For each state-action pair, the model stores the most recent outcome observed,
+    namely the reward, the next state and whether the next state is terminal. It also
+    stores the set of state-action pairs that have been observed to lead to each state,
+    as required by prioritized sweeping. States are stored as keys of dictionaries, and
+    therefore must be hashable.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """ Removes all transitions from the model.
+        """
+        self.outcomes = {}
+        self.pairs = []
+        self.leading = defaultdict(set)
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def store(self, key, action, reward, next_key, done):
+        """ Stores the outcome of taking the specified action in the specified state.
+
+        inputs:
+            key - the state
+            action - the action taken
+            reward - the reward observed
+            next_key - the next state
+            done - whether or not the next state is terminal
+        """
+        pair = (key, action)
+        if pair not in self.outcomes:
+            self.pairs.append(pair)
+        self.outcomes[pair] = (reward, next_key, done)
+        self.leading[next_key].add(pair)
+
+    def outcome(self, key, action):
+        """ Returns the triple (reward, next_key, done) last observed for the specified
+        state and action.
+        """
+        return self.outcomes[(key, action)]
+
+    def predecessors(self, key):
+        """ Returns the set of state-action pairs that have been observed to lead to the
+        specified state.
+        """
+        return self.leading.get(key, ())
+
+    def sample(self, count):
+        """ Returns a list of the specified number of state-action pairs drawn uniformly
+        with replacement from the pairs stored in the model.
+        """
+        return [self.pairs[i] for i in np.random.randint(len(self.pairs), size=count)]
+
+
+class DenseTransitionModel(TransitionModel):
+    """ A learned model of the transitions of a task whose states are identified by
+    the row indices of a DenseTabular agent.
+
+    Outcomes are stored in two-dimensional numpy arrays indexed by row and action, so
+    that batches of transitions can be sampled and backed up in a vectorized manner.
+
+    inputs:
+        valid_actions - the number of possible actions
+        capacity - the initial number of rows allocated (defaults to 1024)
+    """
+
+    def __init__(self, valid_actions, capacity=1024):
+        self.valid_actions = valid_actions
+        self.capacity = capacity
+        super().__init__()
+
+    def clear(self):
+        self.leading = defaultdict(set)
+        self.rewards = np.zeros((self.capacity, self.valid_actions), dtype=float)
+        self.next_rows = np.zeros((self.capacity, self.valid_actions), dtype=np.intp)
+        self.dones = np.zeros((self.capacity, self.valid_actions), dtype=bool)
+        self.seen = np.zeros((self.capacity, self.valid_actions), dtype=bool)
+        self.pairs = np.zeros(self.capacity, dtype=np.intp)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def grow(self, rows):
+        """ Enlarges the arrays of outcomes so that they contain at least the specified
+        number of rows.
+        """
+        extra = max(rows, 2 * self.rewards.shape[0]) - self.rewards.shape[0]
+        pad = ((0, extra), (0, 0))
+        self.rewards = np.pad(self.rewards, pad)
+        self.next_rows = np.pad(self.next_rows, pad)
+        self.dones = np.pad(self.dones, pad)
+        self.seen = np.pad(self.seen, pad)
+
+    def store(self, key, action, reward, next_key, done):
+        if key >= self.rewards.shape[0]:
+            self.grow(key + 1)
+        if not self.seen[key, action]:
+            self.seen[key, action] = True
+            if self.count == len(self.pairs):
+                self.pairs = np.concatenate((self.pairs, np.zeros_like(self.pairs)))
+            self.pairs[self.count] = key * self.valid_actions + action
+            self.count += 1
+        self.rewards[key, action] = reward
+        self.next_rows[key, action] = next_key
+        self.dones[key, action] = done
+        self.leading[next_key].add((key, action))
+
+    def outcome(self, key, action):
+        return (self.rewards[key, action], self.next_rows[key, action],
+                self.dones[key, action])
+
+    def sample(self, count):
+        rows, actions = self.sample_batch(count)
+        return list(zip(rows.tolist(), actions.tolist()))
+
+    def sample_batch(self, count, replace=True):
+        """ Returns a pair (rows, actions) of one-dimensional numpy arrays of the
+        specified number of state-action pairs drawn uniformly from the pairs stored in
+        the model.
+
+        inputs:
+            count - the number of pairs to draw
+            replace - whether pairs are drawn with replacement (defaults to True); if
+            False, the pairs are distinct and count must not exceed the number of pairs
+            stored in the model
+        """
+        if replace:
+            idx = np.random.randint(self.count, size=count)
+        elif 2 * count > self.count:
+            idx = np.random.permutation(self.count)[:count]
+        else:
+            
+            # redraw duplicates, which are rare when few pairs are drawn
+            idx = np.unique(np.random.randint(self.count, size=count))
+            while idx.size < count:
+                extra = np.random.randint(self.count, size=count - idx.size)
+                idx = np.unique(np.concatenate((idx, extra)))
+        return np.divmod(self.pairs[idx], self.valid_actions)
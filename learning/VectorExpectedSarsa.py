@@ -0,0 +1,52 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from learning.VectorTDLearning import VectorTDLearning
+import numpy as np
+from domains.VectorTask import VectorTask
+from policies.Policy import Policy
+from agents.Tabular import Tabular
+
+
+class VectorExpectedSarsa(VectorTDLearning):
+    """ Represents the tabular Expected Sarsa algorithm, learning from many copies
+    of the environment at once.
+    
+    Can handle any policy that explicitly implements the method 'distribution'.
+    
+    inputs:
+        discount - the discount factor in [0, 1]
+        episode_length - for episodic learning, the length of each episode
+        copies - the number of copies of the environment that are stepped together
+        
+    References
+    ========
+        - Sutton, Richard S., and Andrew G. Barto. 
+        Reinforcement learning: An introduction. MIT press, 2018.
+    """
+    
+    def __init__(self, discount, episode_length, copies):
+        super().__init__(discount, episode_length, copies)
+    
+    def clear(self):
+        self.rows = None
+    
+    def step(self, Q : Tabular, task : VectorTask, policy : Policy, states):
+        if self.rows is None:
+            self.rows = np.arange(self.copies)
+        
+        # choose actions from states using policy derived from Q
+        actions = policy.act_batch(Q, task, states)
+        
+        # take actions and observe rewards and new states
+        new_states, rewards, dones = task.transition_batch(states, actions)
+        
+        # update Q
+        eQ = policy.expectation_batch(Q, task, new_states)
+        targets = rewards + self.gamma * np.where(dones, 0.0, eQ)
+        deltas = targets - Q.values_batch(states)[self.rows, actions]
+        Q.update_batch(states, actions, deltas, merge=True)
+        
+        return new_states, rewards, dones
@@ -0,0 +1,62 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from learning.VectorTDLearning import VectorTDLearning
+import numpy as np
+from domains.VectorTask import VectorTask
+from policies.Policy import Policy
+from agents.Tabular import Tabular
+
+
+class VectorSarsa(VectorTDLearning):
+    """ Represents the tabular online Sarsa algorithm, learning from many copies
+    of the environment at once.
+    
+    inputs:
+        discount - the discount factor in [0, 1]
+        episode_length - for episodic learning, the length of each episode
+        copies - the number of copies of the environment that are stepped together
+        
+    References
+    ========
+        - Sutton, Richard S., and Andrew G. Barto. 
+        Reinforcement learning: An introduction. MIT press, 2018.
+    """
+    
+    def __init__(self, discount, episode_length, copies):
+        super().__init__(discount, episode_length, copies)
+    
+    def clear(self):
+        self.rows = None
+        self.actions = None
+    
+    def reset(self, Q : Tabular, task : VectorTask, policy : Policy, states, done):
+        
+        # choose actions from reset states using policy derived from Q
+        if self.actions is None:
+            self.rows = np.arange(self.copies)
+            self.actions = policy.act_batch(Q, task, states)
+        else:
+            self.actions[done] = policy.act_batch(Q, task, states[done])
+    
+    def step(self, Q : Tabular, task : VectorTask, policy : Policy, states):
+        actions = self.actions
+        
+        # take actions and observe rewards and new states
+        new_states, rewards, dones = task.transition_batch(states, actions)
+        
+        # choose new actions from new states using policy derived from Q
+        new_actions = policy.act_batch(Q, task, new_states)
+        
+        # update Q
+        targets = rewards + self.gamma * np.where(
+            dones, 0.0, Q.values_batch(new_states)[self.rows, new_actions])
+        deltas = targets - Q.values_batch(states)[self.rows, actions]
+        Q.update_batch(states, actions, deltas, merge=True)
+        
+        # update actions
+        self.actions = new_actions
+        
+        return new_states, rewards, dones
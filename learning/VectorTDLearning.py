@@ -0,0 +1,169 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+from abc import ABC, abstractmethod
+import numpy as np
+from domains.VectorTask import VectorTask
+from agents.Agent import Agent
+from policies.Policy import Policy
+from learning.Instrumentation import Instrumentation
+from learning.Stopping import StoppingCriterion
+
+
+class VectorTDLearning(ABC):
+    """ An abstract class that represents temporal difference learning algorithms
+    that learn from many copies of an environment at once.
+
+    On each iteration, all copies of the environment are stepped together and one
+    batch of updates is applied to the agent with update_batch, merging the updates of
+    copies that visit the same state-action pair (see Tabular.update_batch). Copies
+    whose episodes terminate or reach their maximum length are reset automatically. Best performance is obtained with a
+    DenseTabular agent and a VectorTask with a vectorized transition function.
+
+    inputs:
+        discount - the discount factor in [0, 1]
+        episode_length - for episodic learning, the length of each episode
+        copies - the number of copies of the environment that are stepped together
+    """
+
+    def __init__(self, discount, episode_length, copies):
+        self.gamma = discount
+        self.episode_length = episode_length
+        self.copies = copies
+
+    @abstractmethod
+    def clear(self):
+        """ Resets all working variables contained in the current implementation.
+        """
+        pass
+
+    @abstractmethod
+    def step(self, Q : Agent, task : VectorTask, policy : Policy, states):
+        """ Performs one transition in every copy of the environment and updates the
+        agent on the resulting batch of experiences.
+
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a VectorTask object representing the task the agent is learning
+            policy - a Policy object representing the exploration policy used to
+            balance exploration and exploitation
+            states - a numpy array of the current states of all copies of the environment
+        outputs:
+            a triple (new_states, rewards, dones) as returned by the task
+        """
+        pass
+
+    def reset(self, Q : Agent, task : VectorTask, policy : Policy, states, done):
+        """ Called when the copies of the environment indicated by done have been reset
+        to new initial states (and at the start of training, with all copies reset).
+        Implementations that keep per-copy working variables should reinitialize them here.
+
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a VectorTask object representing the task the agent is learning
+            policy - a Policy object representing the exploration policy used to
+            balance exploration and exploitation
+            states - a numpy array of the current states of all copies of the environment
+            done - a one-dimensional boolean numpy array whether or not each copy was reset
+        """
+        pass
+
+    def train(self, Q : Agent, task : VectorTask, policy : Policy, episodes,
+              instrumentation : Instrumentation=None, stopping=None):
+        """ Trains the specified agent on the specified task using the specified
+        exploration policy using the current implementation. Training stops once the
+        specified number of episodes have been completed over all copies of the environment,
+        or once a stopping criterion ends training early, in which case the histories only
+        contain the episodes that were completed.
+
+        Episodes are recorded in the order in which they complete, and policy and agent
+        parameters are updated after each completed episode. As in TDLearning.train, the
+        policy draws from its own Sampler and the task from numpy.random, so both must be
+        seeded to reproduce a run.
+
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a VectorTask object representing the task the agent is learning
+            policy - a Policy object representing the exploration policy used to
+            balance exploration and exploitation
+            episodes - the number of episodes of training to perform
+            instrumentation - an Instrumentation object that records the time spent in 
+            each phase of training (defaults to None, meaning training is not timed); 
+            metrics are reported each time episodes complete, and count the steps taken
+            over all copies of the environment since the previous report
+            stopping - a StoppingCriterion object, or a list of StoppingCriterion objects
+            any of which can stop training, checked each time an episode completes 
+            (defaults to None, meaning all episodes are run)
+        outputs:
+            - a one-dimensional numpy array containing the lengths of each episode
+            - a one-dimensional numpy array containing the sum of the discounted
+            rewards from the environment obtained on each episode
+        """
+
+        # initialization
+        self.clear()
+        Q.clear()
+        policy.clear()
+        criteria = StoppingCriterion.criteria(stopping)
+
+        # for storing history of trial
+        rewards_history = np.zeros(episodes, dtype=float)
+        steps_history = np.zeros(episodes, dtype=int)
+
+        # wrap the objects to time if instrumentation is requested
+        if instrumentation is not None:
+            Q, task, policy = instrumentation.attach(self, Q, task, policy)
+            instrumentation.begin_episode()
+            iterations = 0
+        
+        # initialize the state of each copy of the environment
+        states = task.initial_states(self.copies)
+        lengths = np.zeros(self.copies, dtype=int)
+        returns = np.zeros(self.copies, dtype=float)
+        discounts = np.ones(self.copies, dtype=float)
+        self.reset(Q, task, policy, states, np.ones(self.copies, dtype=bool))
+
+        # run until enough episodes have completed
+        e = 0
+        try:
+            while e < episodes:
+    
+                # step all copies of the environment and update the agent
+                states, rewards, dones = self.step(Q, task, policy, states)
+                returns += discounts * rewards
+                discounts *= self.gamma
+                lengths += 1
+    
+                # record and reset finished episodes
+                done = dones | (lengths >= self.episode_length)
+                if np.any(done):
+                    for i in np.flatnonzero(done):
+                        if e < episodes:
+                            rewards_history[e] = returns[i]
+                            steps_history[e] = lengths[i]
+                            policy.finish_episode(e)
+                            Q.finish_episode(e)
+                            if criteria and StoppingCriterion.any(
+                                    criteria, e, lengths[i], returns[i], Q):
+                                episodes = e + 1
+                            e += 1
+                    states = task.reset_done(states, done)
+                    returns[done] = 0.0
+                    discounts[done] = 1.0
+                    lengths[done] = 0
+                    self.reset(Q, task, policy, states, done)
+                
+                # report the metrics of the iterations since the last report
+                if instrumentation is not None:
+                    iterations += 1
+                    if np.any(done):
+                        instrumentation.end_episode(e - 1, iterations * self.copies)
+                        instrumentation.begin_episode()
+                        iterations = 0
+        finally:
+            if instrumentation is not None:
+                instrumentation.detach(self)
+
+        return steps_history[:e], rewards_history[:e]
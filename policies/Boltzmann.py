@@ -5,8 +5,10 @@ Created on Oct 22, 2018
 '''
 import numpy as np
 from policies.Policy import Policy
+from policies.Sampler import Sampler
 from domains.Task import Task
 from agents.Agent import Agent
+from agents.Constant import Constant
 
 
 class Boltzmann(Policy):
@@ -16,11 +18,14 @@ class Boltzmann(Policy):
     inputs:
         temperature - the temperature parameter - may be either a lambda expression
         of one integer parameter (the episode counter), or a floating point number
+        sampler - a Sampler object used to draw random numbers (defaults to None, meaning
+        a new Sampler seeded from the numpy.random generator)
     """
     
-    def __init__(self, temperature):
+    def __init__(self, temperature, sampler : Sampler=None):
+        super().__init__(sampler)
         if isinstance(temperature, float):
-            self.temperature = lambda e: temperature
+            self.temperature = Constant(temperature)
         else:
             self.temperature = temperature
         self.clear()
@@ -30,13 +35,35 @@ class Boltzmann(Policy):
         
     def distribution(self, Q : Agent, task : Task, state):
         values = Q.values(state)
-        values = np.exp(values / self.temp)
+        values = np.exp((values - np.amax(values)) / self.temp)
         values /= np.sum(values)
         return values
         
     def act(self, Q : Agent, task : Task, state):
         values = self.distribution(Q, task, state)
-        return np.random.choice(task.valid_actions(), 1, p=values)
+        return self.sampler.categorical(values)
+
+    def act_and_evaluate(self, Q : Agent, task : Task, state):
+        values = Q.values(state)
+        probabilities = np.exp((values - np.amax(values)) / self.temp)
+        probabilities /= np.sum(probabilities)
+        action = self.sampler.categorical(probabilities)
+        return action, np.inner(probabilities, values)
+
+    def distribution_batch(self, Q : Agent, task : Task, states):
+        values = Q.values_batch(states) / self.temp
+        values = np.exp(values - np.amax(values, axis=1, keepdims=True))
+        values /= np.sum(values, axis=1, keepdims=True)
+        return values
+
+    def expectation_batch(self, Q : Agent, task : Task, states):
+        values = Q.values_batch(states)
+        probabilities = np.exp((values - np.amax(values, axis=1, keepdims=True)) / self.temp)
+        probabilities /= np.sum(probabilities, axis=1, keepdims=True)
+        return np.sum(probabilities * values, axis=1)
+
+    def act_batch(self, Q : Agent, task : Task, states):
+        return self.sampler.categorical_batch(self.distribution_batch(Q, task, states))
         
     def finish_episode(self, episode):
         self.temp = self.temperature(episode)
@@ -4,10 +4,11 @@ Created on Oct 22, 2018
 @author: michael
 '''
 import numpy as np
-import random
 from policies.Policy import Policy
+from policies.Sampler import Sampler
 from domains.Task import Task
 from agents.Agent import Agent
+from agents.Constant import Constant
 
 
 class EpsilonGreedy(Policy):
@@ -17,11 +18,17 @@ class EpsilonGreedy(Policy):
     inputs:
         epsilon - the probability of selecting a random action - may be either a lambda
         expression of one parameter (the episode counter), or a floating point number
+        sampler - a Sampler object used to draw random numbers (defaults to None, meaning
+        a new Sampler seeded from the numpy.random generator)
     """
     
-    def __init__(self, epsilon):
+    # the largest number of actions for which Q-values are scanned in Python
+    SCAN_LIMIT = 16
+    
+    def __init__(self, epsilon, sampler : Sampler=None):
+        super().__init__(sampler)
         if isinstance(epsilon, float):
-            self.epsilon_lambda = lambda e: epsilon
+            self.epsilon_lambda = Constant(epsilon)
         else:
             self.epsilon_lambda = epsilon
         self.clear()
@@ -36,10 +43,53 @@ class EpsilonGreedy(Policy):
         return values
         
     def act(self, Q : Agent, task : Task, state):
-        if np.random.rand() <= self.epsilon:
-            return random.randrange(task.valid_actions())
+        if self.sampler.uniform() <= self.epsilon:
+            return self.sampler.integer(task.valid_actions())
         else:
             return Q.max_action(state)
         
+    def distribution_batch(self, Q : Agent, task : Task, states):
+        num_actions = task.valid_actions()
+        greedy = np.argmax(Q.values_batch(states), axis=1)
+        values = np.full((len(states), num_actions), self.epsilon / num_actions)
+        values[np.arange(len(states)), greedy] += 1.0 - self.epsilon
+        return values
+
+    def act_and_evaluate(self, Q : Agent, task : Task, state):
+        values = Q.values(state)
+        num_actions = len(values)
+        
+        # for a small number of actions, scanning in Python is faster than numpy
+        if num_actions <= EpsilonGreedy.SCAN_LIMIT:
+            scan = values.tolist()
+            best = max(scan)
+            greedy = scan.index(best)
+            total = sum(scan)
+        else:
+            greedy = int(values.argmax())
+            best = float(values[greedy])
+            total = float(values.sum())
+        if self.sampler.uniform() <= self.epsilon:
+            action = self.sampler.integer(task.valid_actions())
+        else:
+            action = greedy
+
+        # the expectation is a mixture of the mean and the maximum of the Q-values
+        expectation = self.epsilon * total / num_actions + (1.0 - self.epsilon) * best
+        return action, expectation
+
+    def expectation_batch(self, Q : Agent, task : Task, states):
+        values = Q.values_batch(states)
+        return self.epsilon * np.mean(values, axis=1) + \
+            (1.0 - self.epsilon) * np.amax(values, axis=1)
+
+    def act_batch(self, Q : Agent, task : Task, states):
+        count = len(states)
+        actions = np.argmax(Q.values_batch(states), axis=1)
+        explore = self.sampler.uniform_batch(count) <= self.epsilon
+        actions[explore] = self.sampler.integer_batch(task.valid_actions(), 
+                                                      np.count_nonzero(explore))
+        return actions
+        
     def finish_episode(self, episode):
         self.epsilon = self.epsilon_lambda(episode)
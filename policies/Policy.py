@@ -4,13 +4,30 @@ Created on Oct 22, 2018
 @author: michael
 '''
 from abc import ABC, abstractmethod
+import numpy as np
 from domains.Task import Task
 from agents.Agent import Agent
+from policies.Sampler import Sampler
 
 
 class Policy(ABC):
     """ Represents an abstract class for an exploration policy used in reinforcement learning.
+    
+    inputs:
+        sampler - a Sampler object used to draw random numbers (defaults to None, meaning
+        a new Sampler seeded from the numpy.random generator)
     """
+    
+    def __init__(self, sampler : Sampler=None):
+        self.sampler = sampler if sampler is not None else Sampler()
+    
+    def seed(self, seed):
+        """ Seeds the random number generator used by the current policy.
+        
+        inputs:
+            seed - the seed of the random number generator
+        """
+        self.sampler.seed(seed)
         
     @abstractmethod
     def clear(self):
@@ -49,6 +66,73 @@ class Policy(ABC):
         """
         pass
     
+    def act_batch(self, Q : Agent, task : Task, states):
+        """ Selects an action for each of the specified states in the specified task 
+        according to the specified value function. 
+        
+        The default implementation calls act for each state in turn; policies should 
+        override this method with a vectorized implementation where possible.
+        
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a Task or VectorTask object representing the task the agent is learning
+            states - a numpy array of states of the task for which to select actions
+        outputs:
+            - a one-dimensional numpy array of the actions selected in the specified states
+        """
+        actions = [self.act(Q, task, state) for state in states]
+        return np.array(actions, dtype=int).reshape(len(actions))
+    
+    def distribution_batch(self, Q : Agent, task : Task, states):
+        """ Returns the probability distributions over actions of the current policy for
+        each of the specified states in the specified task according to the specified 
+        value function.
+        
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a Task or VectorTask object representing the task the agent is learning
+            states - a numpy array of states of the task
+        outputs:
+            - a two-dimensional numpy array of probabilities of selecting each action
+            under the current policy, with one row per state
+        """
+        return np.array([self.distribution(Q, task, state) for state in states])
+
+    def act_and_evaluate(self, Q : Agent, task : Task, state):
+        """ Selects an action for the specified state in the specified task according
+        to the specified value function, and also returns the expected Q-value of the
+        state under the current policy (as required by Expected Sarsa).
+
+        The default implementation calls act, distribution and the values of Q in turn;
+        policies should override this method to select the action and compute the
+        expectation from a single lookup of the Q-values where possible.
+
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a Task object representing the task the agent is learning
+            state - the current state of the task for which to select an action
+        outputs:
+            - the action selected in the specified state
+            - the expected Q-value of the specified state under the current policy
+        """
+        action = self.act(Q, task, state)
+        expectation = np.inner(self.distribution(Q, task, state), Q.values(state))
+        return action, expectation
+
+    def expectation_batch(self, Q : Agent, task : Task, states):
+        """ Returns the expected Q-values of each of the specified states in the
+        specified task under the current policy.
+
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a Task or VectorTask object representing the task the agent is learning
+            states - a numpy array of states of the task
+        outputs:
+            - a one-dimensional numpy array of the expected Q-values of the states
+        """
+        return np.sum(self.distribution_batch(Q, task, states) * Q.values_batch(states),
+                      axis=1)
+
     @abstractmethod
     def finish_episode(self, episode):
         """ Finishes the current episode.
@@ -6,22 +6,33 @@ Created on Oct 27, 2018
 from collections import defaultdict
 import numpy as np
 from policies.Policy import Policy
+from policies.Sampler import Sampler
 from domains.Task import Task
 from agents.Agent import Agent
+from agents.DenseTabular import DenseTabular
+from agents.Constant import Constant
 
 
 class Pursuit(Policy):
     """ Represents the pursuit exploration policy. Allows both constant or changing
     learning rate over time.
     
+    When used with a DenseTabular agent, the preference distributions of all states are 
+    stored as rows of a single two-dimensional numpy array, indexed by the same row 
+    indices as the table of the agent. Otherwise, preferences are stored in a dictionary
+    keyed by state.
+    
     inputs:
         learning_rate - the learning rate parameter - may be either a lambda expression
         of one integer parameter (the episode counter), or a floating point number
+        sampler - a Sampler object used to draw random numbers (defaults to None, meaning
+        a new Sampler seeded from the numpy.random generator)
     """
     
-    def __init__(self, learning_rate):
+    def __init__(self, learning_rate, sampler : Sampler=None):
+        super().__init__(sampler)
         if isinstance(learning_rate, float):
-            self.beta_lambda = lambda e: learning_rate
+            self.beta_lambda = Constant(learning_rate)
         else:
             self.beta_lambda = learning_rate
         self.clear()
@@ -29,33 +40,114 @@ class Pursuit(Policy):
     def clear(self):
         self.valid_actions = 0
         self.beta = self.beta_lambda(0)
-        self.preferences = defaultdict(
-            lambda: np.ones(self.valid_actions) / self.valid_actions)
+        self.table = None
+        self.preferences = defaultdict(self.uniform)
     
-    def distribution(self, Q : Agent, task : Task, state):
-        return self.preferences[state]
+    def uniform(self):
+        """ Returns the initial preference distribution of a state, which is uniform 
+        over actions. This is a method rather than a lambda expression so that copies of
+        the current policy create distributions with their own number of actions.
+        """
+        return np.ones(self.valid_actions) / self.valid_actions
     
-    def act(self, Q : Agent, task : Task, state):
+    def preference(self, Q : Agent, task : Task, state):
+        """ Returns the preference distribution of the specified state, which can be 
+        updated in place.
+        
+        inputs:
+            Q - an Agent object storing the Q-values
+            task - a Task object representing the task the agent is learning
+            state - the state whose preference distribution to return
+        outputs:
+            - a one-dimensional numpy array of probabilities of selecting each action
+        """
         
         # set the number of actions of the current task, if not set
         if self.valid_actions == 0:
             self.valid_actions = task.valid_actions()
-            
-        # get the distribution over actions for the current state
-        pref = self.preferences[state]
         
-        # sample an action from the preference distribution
-        action = np.random.choice(self.valid_actions, 1, p=pref)
+        if isinstance(Q, DenseTabular):
+            idx = Q.row(state)
+            if self.table is None or idx >= self.table.shape[0]:
+                self.grow(Q)
+            return self.table[idx]
+        return self.preferences[state]
+    
+    def grow(self, Q : DenseTabular):
+        """ Enlarges the table of preferences to the number of rows of the table of 
+        the specified agent, initializing new rows to uniform distributions.
         
-        # get the greedy action according to Q
-        greedy = Q.max_action(state)
+        inputs:
+            Q - a DenseTabular object storing the Q-values
+        """
+        old_rows = 0 if self.table is None else self.table.shape[0]
+        extra = np.full((Q.Q.shape[0] - old_rows, self.valid_actions), 
+                        1.0 / self.valid_actions)
+        if self.table is None:
+            self.table = extra
+        else:
+            self.table = np.concatenate((self.table, extra), axis=0)
+    
+    def distribution(self, Q : Agent, task : Task, state):
+        return self.preference(Q, task, state)
+    
+    def act(self, Q : Agent, task : Task, state):
+        pref = self.preference(Q, task, state)
+        return self.pursue(pref, Q.max_action(state))
+
+    def act_and_evaluate(self, Q : Agent, task : Task, state):
+        values = Q.values(state)
+        pref = self.preference(Q, task, state)
+        action = self.pursue(pref, np.argmax(values))
+        return action, np.inner(pref, values)
+
+    def pursue(self, pref, greedy):
+        """ Samples an action from the specified preference distribution, and then 
+        moves the preference distribution towards the specified greedy action in place.
+
+        inputs:
+            pref - the preference distribution of the current state
+            greedy - the greedy action according to Q in the current state
+        outputs:
+            - the action sampled from the preference distribution
+        """
+        
+        # sample an action from the preference distribution
+        action = self.sampler.categorical(pref)
         
         # update the preference distribution
         pref *= (1.0 - self.beta)
-        pref[greedy] /= (1.0 - self.beta)
-        pref[greedy] += self.beta * (1.0 - pref[greedy])
+        pref[greedy] += self.beta
         
         return action
+    
+    def distribution_batch(self, Q : Agent, task : Task, states):
+        if not isinstance(Q, DenseTabular):
+            return super().distribution_batch(Q, task, states)
+        if self.valid_actions == 0:
+            self.valid_actions = task.valid_actions()
+        rows = Q.rows(states)
+        if self.table is None or Q.Q.shape[0] > self.table.shape[0]:
+            self.grow(Q)
+        return self.table[rows]
+    
+    def act_batch(self, Q : Agent, task : Task, states):
+        if not isinstance(Q, DenseTabular):
+            return super().act_batch(Q, task, states)
+        
+        # sample actions from the preference distributions
+        prefs = self.distribution_batch(Q, task, states)
+        actions = self.sampler.categorical_batch(prefs)
+        
+        # update the preference distribution of each distinct state once, applying
+        # the update as many times as the state occurs in the batch
+        rows, counts = np.unique(Q.rows(states), return_counts=True)
+        greedy = np.argmax(Q.Q[rows], axis=1)
+        decay = (1.0 - self.beta) ** counts
+        self.table[rows] *= decay[:, np.newaxis]
+        self.table[rows, greedy] += 1.0 - decay
+        
+        return actions
         
     def finish_episode(self, episode):
         self.beta = self.beta_lambda(episode)
@@ -0,0 +1,112 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import numpy as np
+
+
+class Sampler:
+    """ Draws the random numbers used by exploration policies.
+
+    Uniform numbers for single draws are generated in blocks by a numpy Generator and
+    handed out one at a time, which avoids the overhead of calling into numpy on every
+    step. Categorical distributions are sampled by inverting their cumulative
+    distribution, without validating the probabilities, and single draws are returned
+    as plain Python numbers.
+
+    The generator is independent of the numpy.random module. A sampler that is not given
+    a seed draws its seed from numpy.random, so seeding numpy.random before creating a
+    policy (or before calling seed without arguments) makes its choices reproducible.
+
+    inputs:
+        seed - the seed of the random number generator (defaults to None, meaning the
+        seed is drawn from the numpy.random generator)
+        block - the number of uniform numbers generated at a time (defaults to 1024)
+    """
+
+    # the largest number of categories for which distributions are sampled by scanning
+    SCAN_LIMIT = 64
+
+    def __init__(self, seed=None, block=1024):
+        self.block = block
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """ Re-initializes the random number generator with the specified seed, and
+        discards any uniform numbers generated in advance.
+
+        inputs:
+            seed - the seed of the random number generator (defaults to None, meaning
+            the seed is drawn from the numpy.random generator)
+        """
+        if seed is None:
+            seed = np.random.randint(2 ** 32, size=4, dtype=np.uint64).tolist()
+        self.random = np.random.default_rng(seed)
+        self.buffer = []
+        self.position = 0
+
+    def uniform(self):
+        """ Returns a floating point number drawn uniformly from [0, 1).
+        """
+        if self.position >= len(self.buffer):
+            self.buffer = self.random.random(self.block).tolist()
+            self.position = 0
+        u = self.buffer[self.position]
+        self.position += 1
+        return u
+
+    def integer(self, n):
+        """ Returns an integer drawn uniformly from 0, 1, ... n - 1.
+        """
+        return min(int(self.uniform() * n), n - 1)
+
+    def categorical(self, probabilities):
+        """ Returns the index of an element drawn from the specified categorical
+        distribution.
+
+        inputs:
+            probabilities - a one-dimensional numpy array of (possibly unnormalized)
+            non-negative probabilities
+        outputs:
+            an integer index in 0, 1, ... len(probabilities) - 1
+        """
+        
+        # for a small number of categories, scanning in Python is faster than numpy
+        if len(probabilities) <= Sampler.SCAN_LIMIT:
+            values = probabilities.tolist()
+            u = self.uniform() * sum(values)
+            for i, value in enumerate(values):
+                u -= value
+                if u < 0.0:
+                    return i
+            return len(values) - 1
+        cdf = np.cumsum(probabilities)
+        index = int(np.searchsorted(cdf, self.uniform() * cdf[-1], side='right'))
+        return min(index, len(cdf) - 1)
+
+    def uniform_batch(self, count):
+        """ Returns a one-dimensional numpy array of the specified number of floating
+        point numbers drawn uniformly from [0, 1).
+        """
+        return self.random.random(count)
+
+    def integer_batch(self, n, count):
+        """ Returns a one-dimensional numpy array of the specified number of integers
+        drawn uniformly from 0, 1, ... n - 1.
+        """
+        return self.random.integers(n, size=count)
+
+    def categorical_batch(self, probabilities):
+        """ Returns the indices of elements drawn from each of the specified categorical
+        distributions.
+
+        inputs:
+            probabilities - a two-dimensional numpy array of (possibly unnormalized)
+            non-negative probabilities, with one distribution per row
+        outputs:
+            a one-dimensional numpy array of integer indices, one per row
+        """
+        cdf = np.cumsum(probabilities, axis=1)
+        u = self.random.random((len(cdf), 1)) * cdf[:, -1:]
+        return np.minimum(np.sum(cdf <= u, axis=1), cdf.shape[1] - 1)
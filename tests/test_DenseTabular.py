@@ -0,0 +1,55 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import copy
+import pickle
+import unittest
+import numpy as np
+from agents.DenseTabular import DenseTabular
+from agents.Indexer import InternIndexer
+
+
+class TestDenseTabular(unittest.TestCase):
+    """ Checks the lookups and updates of DenseTabular against the behavior of Tabular.
+    """
+
+    def test_fixed_size(self):
+        Q = DenseTabular(3, 0.5, 10)
+        self.assertEqual(Q.Q.shape, (10, 3))
+        for state in (-1, 10):
+            with self.assertRaises(IndexError):
+                Q.values(state)
+            with self.assertRaises(IndexError):
+                Q.update(state, 0, 1.0)
+        with self.assertRaises(IndexError):
+            Q.values_batch(np.array([0, -1]))
+
+    def test_growth(self):
+        Q = DenseTabular(2, 0.5, InternIndexer(), capacity=1)
+        for state in range(5):
+            Q.update(('s', state), 1, 2.0)
+            np.testing.assert_allclose(Q.values(('s', state)), [0.0, 1.0])
+        self.assertGreaterEqual(Q.Q.shape[0], 5)
+
+    def test_copies_keep_views(self):
+        Q = DenseTabular(2, 0.5, 4)
+        for other in (pickle.loads(pickle.dumps(Q)), copy.deepcopy(Q)):
+            other.update(1, 0, 2.0)
+            np.testing.assert_allclose(other.Q[1], [1.0, 0.0])
+            np.testing.assert_allclose(Q.Q[1], [0.0, 0.0])
+
+    def test_update_rows(self):
+        rows, actions = np.array([0, 1, 1]), np.array([1, 0, 0])
+        errors = np.array([1.0, 2.0, 4.0])
+        Q = DenseTabular(2, 0.5, 2)
+        Q.update_rows(rows, actions, errors)
+        np.testing.assert_allclose(Q.Q, [[0.0, 0.5], [3.0, 0.0]])
+        Q = DenseTabular(2, 0.5, 2)
+        Q.update_rows(rows, actions, errors, merge=True)
+        np.testing.assert_allclose(Q.Q, [[0.0, 0.5], [1.5, 0.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import unittest
+import numpy as np
+from agents.Tabular import Tabular
+from agents.DenseTabular import DenseTabular
+from learning.EligibilityTraces import EligibilityTraces
+
+
+class TestEligibilityTraces(unittest.TestCase):
+    """ Checks that traces applied with update_rows to a DenseTabular have the same
+    effect as traces applied one at a time to a Tabular.
+    """
+
+    def run_traces(self, Q, visits, max_traces=None):
+        traces = EligibilityTraces(threshold=0.05, max_traces=max_traces)
+        traces.clear(Q)
+        for state, action, delta in visits:
+            traces.visit(Q, state, action)
+            traces.update(Q, delta, 0.5)
+        return traces
+
+    def visits(self):
+        rng = np.random.default_rng(0)
+        return [(int(rng.integers(6)), int(rng.integers(2)), float(rng.normal()))
+                for _ in range(200)]
+
+    def test_dense_matches_tabular(self):
+        for max_traces in (None, 3):
+            dense, table = DenseTabular(2, 0.5, 6), Tabular(2, 0.5)
+            self.run_traces(dense, self.visits(), max_traces)
+            self.run_traces(table, self.visits(), max_traces)
+            for state in range(6):
+                np.testing.assert_allclose(dense.values(state), table.values(state))
+
+    def test_dropped_traces_are_not_updated(self):
+
+        # every update moves a Q-value by at least 1, so stale slots would show up
+        Q = DenseTabular(2, 0.5, 4, clip_min=1.0)
+        traces = self.run_traces(Q, [(0, 0, 1.0), (1, 1, 1.0), (2, 0, 1.0)], 2)
+        self.assertEqual(len(traces), 2)
+        np.testing.assert_allclose(Q.values(0), [2.0, 0.0])
+        np.testing.assert_allclose(Q.values(1), [0.0, 2.0])
+        np.testing.assert_allclose(Q.values(2), [1.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+'''
+Created on Oct 18, 2026
+
+@author: michael
+'''
+import unittest
+import numpy as np
+from agents.Tabular import Tabular
+from agents.DenseTabular import DenseTabular
+from agents.Linear import Linear
+from agents.TileCoder import TileCoder
+from learning.TDLearning import TDLearning
+
+
+class TestBackup(unittest.TestCase):
+    """ Checks that TDLearning.backup matches the sequential loop it documents.
+    """
+
+    def loop(self, Q, states, actions, targets):
+        for t in reversed(range(len(targets))):
+            s, a = states[t], actions[t]
+            Q.update(s, a, targets[t] - Q.values(s)[a])
+
+    def episode(self, n, seed=0):
+        rng = np.random.default_rng(seed)
+        return rng.integers(6, size=n), rng.integers(3, size=n), rng.normal(size=n)
+
+    def check(self, make, table):
+        for n in (0, 1, 300):
+            states, actions, targets = self.episode(n)
+            expected, actual = make(), make()
+            self.loop(expected, states, actions, targets)
+            TDLearning.backup(actual, states, actions, targets)
+            np.testing.assert_allclose(table(actual), table(expected), atol=1e-12)
+
+    def test_dense(self):
+        self.check(lambda: DenseTabular(3, 0.4, 6, clip_min=-0.2, clip_max=0.3),
+                   lambda Q: Q.Q)
+
+    def test_tabular(self):
+        self.check(lambda: Tabular(3, 0.4, clip_min=-0.2, clip_max=0.3),
+                   lambda Q: np.array([Q.peek(state) for state in range(6)]))
+
+    def test_linear(self):
+        coder = TileCoder([0.0], [6.0], 4, 4)
+        states, actions, targets = self.episode(300)
+        states = states[:, np.newaxis].astype(float)
+        expected, actual = Linear(3, 0.4, coder), Linear(3, 0.4, coder)
+        self.loop(expected, states, actions, targets)
+        TDLearning.backup(actual, states, actions, targets)
+        np.testing.assert_allclose(actual.W, expected.W, atol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()